@@ -1 +1 @@
-from .committee_agent import CommitteeAgent
+from .committee_agent import CommitteeAgent, cache_point_block
@@ -1,9 +1,30 @@
-import time
+from typing import Callable
+
 from strands import Agent
-from strands.models.bedrock import BedrockModel
 from dbc.committee import CommitteeMember
+from dbc.models import (
+    CachedModel,
+    Cassette,
+    FailoverModel,
+    LazyModel,
+    MockModelConfig,
+    RateLimitedModel,
+    RecordingModel,
+    ReplayModel,
+    ResponseCache,
+    RetryingModel,
+    RetryPolicy,
+    create_bedrock_model,
+)
+
 
-from botocore.exceptions import ClientError
+def cache_point_block() -> dict:
+    """Return a Bedrock prompt-cache checkpoint content block.
+    
+    Everything before the checkpoint (tools, system prompt, earlier content) is
+    cached by Bedrock and billed as cache reads on subsequent requests.
+    """
+    return {'cachePoint': {'type': 'default'}}
 
 
 class CommitteeAgent:
@@ -26,7 +47,17 @@ class CommitteeAgent:
         cls,
         member: CommitteeMember,
         description: str = None,
-        enable_streaming: bool = False
+        enable_streaming: bool = False,
+        prompt_cache: bool = False,
+        mock_model: MockModelConfig = None,
+        retry_deadline: float = None,
+        rate_limit: bool = False,
+        failover: bool = False,
+        circuit_breaker: dict = None,
+        bedrock_pool: dict = None,
+        response_cache: ResponseCache = None,
+        cassette: Cassette = None,
+        notify: Callable[[str], None] = None
     ) -> 'CommitteeAgent':
         """
         Create a CommitteeAgent from a CommitteeMember definition.
@@ -36,16 +67,78 @@ class CommitteeAgent:
             description: Optional description for swarm coordination
             enable_streaming: If True, enables output streaming (for swarm).
                             If False, suppresses output (for manual formatting).
+            prompt_cache: If True, marks the system prompt as a Bedrock cache point
+                          so it is not re-billed as fresh input on every turn.
+            mock_model: If provided, use an offline MockModel built from this config
+                        instead of BedrockModel (no AWS credentials needed).
+            retry_deadline: Seconds a failing model call may keep retrying
+                            (the swarm passes SWARM_CONFIG['node_timeout']).
+            rate_limit: If True, wait for admission from the process-wide limiter for
+                        member.model_id before every model call.
+            failover: If True, fail over to member.fallback_model_ids, in order, when a
+                      model is unavailable or its circuit breaker is open.
+            circuit_breaker: CircuitBreaker settings (failure_threshold, cool_down, latency_slo)
+            bedrock_pool: Connection pool settings for the Bedrock client shared by every member
+                          (max_pool_connections, tcp_keepalive)
+            response_cache: If provided, replay cached responses for requests this member
+                            (or any member sharing the cache) has sent before.
+            cassette: If provided, record every model call into it (record mode) or serve
+                      the member's recorded responses instead of calling a model (replay mode).
+            notify: Called with model notices such as failovers, retries and throttling (e.g. to
+                    write them to the meeting's output sink). Defaults to the model wrappers' loggers.
         """
         # Import system prompt and optional round prompts dynamically
         prompt_module = __import__(member.prompt_module, fromlist=['SYSTEM_PROMPT', 'ROUND_PROMPTS'])
         system_prompt = prompt_module.SYSTEM_PROMPT
         
+        # Tools and the system prompt are a stable prefix for every turn this member takes
+        if prompt_cache:
+            system_prompt = [{'text': system_prompt}, cache_point_block()]
+        
         # Load round-specific prompts if they exist
         round_prompts = getattr(prompt_module, 'ROUND_PROMPTS', {})
         
-        # Create Bedrock model
-        model = BedrockModel(model_id=member.model_id)
+        def create_model(model_id: str, fallback: bool = False):
+            # Create Bedrock model (or its offline stand-in). Bedrock models are built on their
+            # first call and share one pooled client, so credentials and connections are set up once.
+            if mock_model is not None:
+                model = mock_model.create_model(member.key, model_id=model_id, fallback=fallback)
+            else:
+                model = LazyModel(
+                    lambda: create_bedrock_model(model_id, pool_settings=bedrock_pool),
+                    model_id=model_id
+                )
+            
+            # Members (and meetings) sharing a model id share one request/token quota
+            if rate_limit:
+                model = RateLimitedModel(model, model_id)
+            return model
+        
+        model_ids = [member.model_id] + (member.fallback_model_ids if failover else [])
+        models = [(model_id, create_model(model_id, fallback=index > 0)) for index, model_id in enumerate(model_ids)]
+        
+        # Fail over down the member's chain before spending the retry budget on one model
+        if len(models) > 1:
+            model = FailoverModel(models, label=member.display_name, breaker_settings=circuit_breaker, notify=notify)
+        else:
+            model = models[0][1]
+        
+        # Retry throttling and subscription activation with asyncio.sleep, so a member
+        # backing off never stalls the other members' turns
+        policy = RetryPolicy(deadline=retry_deadline) if retry_deadline else None
+        model = RetryingModel(model, label=member.display_name, policy=policy, notify=notify)
+        
+        # A repeated request is answered from disk without queueing, failing over or retrying
+        if response_cache is not None:
+            model = CachedModel(model, member.model_id, response_cache)
+        
+        # Record every call as the agent sees it, or serve recorded calls in place of the whole chain
+        # (its Bedrock models are lazy, so replay never builds a client or touches the network)
+        if cassette is not None:
+            if cassette.mode == 'replay':
+                model = ReplayModel(member.key, member.model_id, cassette)
+            else:
+                model = RecordingModel(model, member.key, member.model_id, cassette)
         
         # Create Strands Agent with conditional callback handler
         agent_kwargs = {
@@ -78,8 +171,10 @@ class CommitteeAgent:
         AWS Bedrock on-demand models require an automatic subscription that takes
         ~2 minutes to activate on first invocation. AWS deprecated the console page
         where this could be done manually, so the subscription is now created
-        automatically on first API call. This method handles the initial
-        AccessDeniedException with exponential backoff retry logic.
+        automatically on first API call. The agent's model is wrapped in a
+        RetryingModel, which handles the initial AccessDeniedException (and
+        throttling) with jittered exponential backoff inside the agent's own event
+        loop, so this synchronous path and the async path share one retry policy.
         
         Args:
             prompt: The prompt to send to the agent
@@ -91,38 +186,52 @@ class CommitteeAgent:
         Raises:
             Exception: If all retries are exhausted or a non-retryable error occurs
         """
-        retry_delays = [5, 30, 60]
-        max_attempts = len(retry_delays) + 1
-
-        last_error = None
+        return self.agent(prompt, **kwargs)
+    
+    @property
+    def answered_by(self) -> str:
+        """Model id that produced this member's most recent response (member.model_id before any call)."""
+        # Walk the model wrappers down to the failover chain, if there is one
+        model = self.agent.model
+        while model is not None:
+            if getattr(model, 'answered_by', None):
+                return model.answered_by
+            model = getattr(model, 'model', None)
+        return self.member.model_id
+    
+    async def invoke_async(self, prompt, **kwargs):
+        """
+        Invoke the agent without blocking the event loop.
         
-        for attempt in range(max_attempts):
-            try:
-                return self.agent(prompt, **kwargs)
-            except ClientError as e:
-                last_error = e
-
-                # Check if this is the last attempt
-                if attempt == max_attempts - 1:
-                    break
+        Retries wait with asyncio.sleep (see RetryingModel), so other agents on the
+        same event loop keep making progress while this member backs off.
+        
+        Args:
+            prompt: The prompt to send to the agent
+            **kwargs: Additional arguments to pass to the agent
+            
+        Returns:
+            AgentResult
+        """
+        return await self.agent.invoke_async(prompt, **kwargs)
+    
+    async def stream_async(self, prompt, **kwargs):
+        """
+        Stream agent events for a direct (non-swarm) invocation.
 
-                error_code = e.response['Error']['Code']
-                delay = retry_delays[attempt]
+        Used by phase execution modes that invoke several members concurrently
+        instead of routing them through swarm handoffs.
 
-                if (error_code == 'AccessDeniedException' and 'aws-marketplace' in str(e)):
-                    print(f"Model subscription activating for {self.member.display_name} (first-time setup)...")
-                elif (error_code == 'ThrottlingException'):
-                    print(f"Encountered throttling exception for {self.member.display_name}")
-                else:
-                    print(f"Error encountered when trying to invoke models: {error_code}")
-                    raise
+        Args:
+            prompt: The prompt to send to the agent
+            **kwargs: Additional arguments to pass to the agent
 
-                print(f"Retrying in {delay} seconds... (attempt {attempt + 1}/{max_attempts})")
-                time.sleep(delay)
+        Yields:
+            Strands agent events, ending with the {'result': AgentResult} event
+        """
+        async for event in self.agent.stream_async(prompt, **kwargs):
+            yield event
 
-        print(f"Retries exhausted for {self.member.display_name}.")
-        raise last_error
-    
     def __call__(self, prompt: str, **kwargs):
         """Make the agent directly callable, returning text content."""
         response = self._invoke_with_retry(prompt, **kwargs)
@@ -0,0 +1,31 @@
+"""
+Benchmarks for Designed by Committee.
+
+Benchmarks run against the offline mock model, so they need no AWS
+credentials, and return machine-readable results for regression tracking.
+"""
+
+from .meeting import (
+    run_meeting_benchmark,
+    print_meeting_benchmark,
+)
+
+from .render import (
+    run_render_benchmark,
+    print_render_benchmark,
+)
+
+from .thinking_filter import (
+    run_thinking_filter_benchmark,
+    print_thinking_filter_benchmark,
+)
+
+from .startup import (
+    run_startup_benchmark,
+    print_startup_benchmark,
+)
+
+from .results import (
+    environment_info,
+    write_results,
+)
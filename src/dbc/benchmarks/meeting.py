@@ -0,0 +1,324 @@
+"""
+End-to-end meeting benchmark.
+
+Runs full five-phase meetings through CommitteeMeetingSwarm.run_async against
+the deterministic offline MockModel and reports where the time goes: wall time
+per phase, time to first token and throughput per member, handoff counts of
+swarm phases against the PHASE_CONFIG limits, and orchestration overhead (wall time during
+which no model call was in flight).
+"""
+
+from typing import Dict, List, Tuple
+import asyncio
+import contextlib
+import os
+import statistics
+import time
+
+from strands.models.model import Model
+
+from dbc.benchmarks.results import environment_info, median
+from dbc.committee import COMMITTEE_MEMBERS
+from dbc.models import MockModelConfig, ModelWrapper
+from dbc.workflow import CommitteeMeetingSwarm
+from dbc.workflow.committee_meeting_swarm import CommitteeStreamHandler
+from dbc.workflow.swarm_config import PHASE_CONFIG, SWARM_CONFIG
+
+
+DEFAULT_BENCHMARK_PROMPT = "Design an internal developer portal for onboarding new engineers."
+
+
+class BenchmarkRecorder:
+    """Collects model call timings and speaker turns for one meeting run."""
+
+    def __init__(self):
+        self.current_phase = None
+        self.calls: List[dict] = []  # [{agent_key, phase, start, first_token, end, output_tokens}]
+        self.phase_windows: Dict[int, Tuple[float, float]] = {}  # phase -> (start, end)
+        self.turns: Dict[int, int] = {}  # phase -> speaker turns
+        self.handoffs: Dict[int, int] = {}  # phase -> handoffs between speakers
+
+    def record_turn(self):
+        """Count a speaker turn in the current phase."""
+        self.turns[self.current_phase] = self.turns.get(self.current_phase, 0) + 1
+
+    def record_handoff(self):
+        """Count a handoff in the current phase."""
+        self.handoffs[self.current_phase] = self.handoffs.get(self.current_phase, 0) + 1
+
+    def model_time(self, phase_number: int) -> float:
+        """Wall time during the phase in which at least one model call was in flight."""
+        phase_start, phase_end = self.phase_windows[phase_number]
+        intervals = sorted(
+            (max(call['start'], phase_start), min(call['end'], phase_end))
+            for call in self.calls if call['phase'] == phase_number
+        )
+
+        # Union of overlapping call intervals, so concurrent calls are not double counted
+        busy = 0.0
+        current_start, current_end = None, None
+        for start, end in intervals:
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    busy += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            busy += current_end - current_start
+        return busy
+
+
+class InstrumentedModel(ModelWrapper):
+    """Wraps a model and records call start, first token, end and output tokens."""
+
+    def __init__(self, model: Model, agent_key: str, recorder: BenchmarkRecorder):
+        super().__init__(model)
+        self.agent_key = agent_key
+        self.recorder = recorder
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        call = {
+            'agent_key': self.agent_key,
+            'phase': self.recorder.current_phase,
+            'start': time.perf_counter(),
+            'first_token': None,
+            'end': None,
+            'output_tokens': 0,
+        }
+        try:
+            async for event in self.model.stream(messages, tool_specs, system_prompt, **kwargs):
+                if call['first_token'] is None and 'contentBlockDelta' in event:
+                    call['first_token'] = time.perf_counter()
+                if 'metadata' in event:
+                    call['output_tokens'] = event['metadata'].get('usage', {}).get('outputTokens', 0)
+                yield event
+        finally:
+            call['end'] = time.perf_counter()
+            self.recorder.calls.append(call)
+
+
+class _CountingStreamHandler(CommitteeStreamHandler):
+    """Stream handler that also counts speaker turns and handoffs for the benchmark."""
+
+    recorder: BenchmarkRecorder = None
+
+    async def handle_event(self, event: dict):
+        if event.get('type') == 'multiagent_node_start':
+            self.recorder.record_turn()
+        elif event.get('type') == 'multiagent_handoff':
+            self.recorder.record_handoff()
+        await super().handle_event(event)
+
+
+class BenchmarkMeeting(CommitteeMeetingSwarm):
+    """CommitteeMeetingSwarm that records phase windows and speaker turns."""
+
+    def __init__(self, agents, recorder: BenchmarkRecorder, **kwargs):
+        super().__init__(agents, **kwargs)
+        self.recorder = recorder
+        self.stream_handler_class = type(
+            '_RecordingStreamHandler', (_CountingStreamHandler,), {'recorder': recorder}
+        )
+
+        # Every model call goes through the recorder, for swarm and direct turns alike
+        for agent_key, agent in agents.items():
+            agent.agent.model = InstrumentedModel(agent.agent.model, agent_key, recorder)
+
+    async def _run_phase(self, phase_number: int, show_thinking: bool = False):
+        self.recorder.current_phase = phase_number
+        start = time.perf_counter()
+        try:
+            return await super()._run_phase(phase_number, show_thinking=show_thinking)
+        finally:
+            self.recorder.phase_windows[phase_number] = (start, time.perf_counter())
+
+
+def _member_stats(calls: List[dict]) -> dict:
+    """Summarize time to first token and throughput for one member's calls."""
+    ttfts = [call['first_token'] - call['start'] for call in calls if call['first_token'] is not None]
+    streaming_time = sum(call['end'] - call['first_token'] for call in calls if call['first_token'] is not None)
+    output_tokens = sum(call['output_tokens'] for call in calls)
+    return {
+        'calls': len(calls),
+        'output_tokens': output_tokens,
+        'ttft_mean': statistics.fmean(ttfts) if ttfts else None,
+        'ttft_max': max(ttfts) if ttfts else None,
+        'tokens_per_second': output_tokens / streaming_time if streaming_time else None,
+    }
+
+
+def _run_stats(meeting: BenchmarkMeeting, wall_time: float) -> dict:
+    """Build the result record for one meeting run."""
+    recorder = meeting.recorder
+
+    phases = []
+    for phase_number, (start, end) in sorted(recorder.phase_windows.items()):
+        phase_wall = end - start
+        model_time = recorder.model_time(phase_number)
+        execution_mode = PHASE_CONFIG[phase_number].get('execution_mode', 'swarm')
+        handoffs, max_handoffs, within_limit = None, None, None
+        # Fan-out and parallel phases invoke members directly, so they make no handoffs to count
+        if execution_mode == 'swarm':
+            handoffs = recorder.handoffs.get(phase_number, 0)
+            max_handoffs = PHASE_CONFIG[phase_number].get('max_handoffs', SWARM_CONFIG['max_handoffs'])
+            within_limit = handoffs <= max_handoffs
+        phases.append({
+            'phase': phase_number,
+            'name': PHASE_CONFIG[phase_number]['name'],
+            'execution_mode': execution_mode,
+            'wall_time': phase_wall,
+            'model_time': model_time,
+            'orchestration_overhead': phase_wall - model_time,
+            'turns': recorder.turns.get(phase_number, 0),
+            'handoffs': handoffs,  # None outside swarm phases
+            'max_handoffs': max_handoffs,
+            'within_limit': within_limit,
+        })
+
+    members = {}
+    for agent_key in meeting.agents:
+        members[agent_key] = _member_stats([call for call in recorder.calls if call['agent_key'] == agent_key])
+
+    return {
+        'wall_time': wall_time,
+        'orchestration_overhead': sum(phase['orchestration_overhead'] for phase in phases),
+        'phases': phases,
+        'members': members,
+    }
+
+
+async def run_meeting_benchmark_once(mock_model: MockModelConfig, user_prompt: str = DEFAULT_BENCHMARK_PROMPT,
+                                     show_output: bool = False, **meeting_options) -> dict:
+    """
+    Run one full five-phase meeting against the mock model and return its stats.
+
+    Args:
+        mock_model: Offline model configuration (throughput, latency, scripts)
+        user_prompt: Request given to the committee
+        show_output: Whether to render the meeting to stdout (rendering cost is measured either way)
+        **meeting_options: Options passed to CommitteeMeetingSwarm.from_members
+    """
+    # Mock calls cost nothing, and shared per-model quotas would couple consecutive runs
+    meeting_options.setdefault('rate_limit', False)
+
+    recorder = BenchmarkRecorder()
+    meeting = BenchmarkMeeting.from_members(
+        COMMITTEE_MEMBERS,
+        mock_model=mock_model,
+        recorder=recorder,
+        **meeting_options
+    )
+
+    with open(os.devnull, 'w') as devnull:
+        output = contextlib.nullcontext() if show_output else contextlib.redirect_stdout(devnull)
+        with output:
+            start = time.perf_counter()
+            await meeting.run_async(user_prompt, questions_per_agent=0, pause_between_phases=False)
+            wall_time = time.perf_counter() - start
+
+    return _run_stats(meeting, wall_time)
+
+
+def _summarize(runs: List[dict]) -> dict:
+    """Median across runs for the headline numbers."""
+    phase_numbers = [phase['phase'] for phase in runs[0]['phases']]
+    return {
+        'wall_time_median': median([run['wall_time'] for run in runs]),
+        'orchestration_overhead_median': median([run['orchestration_overhead'] for run in runs]),
+        'phases': {
+            str(phase_number): {
+                'wall_time_median': median([run['phases'][index]['wall_time'] for run in runs]),
+                'orchestration_overhead_median': median(
+                    [run['phases'][index]['orchestration_overhead'] for run in runs]
+                ),
+            }
+            for index, phase_number in enumerate(phase_numbers)
+        },
+    }
+
+
+def run_meeting_benchmark(runs: int = 3, tokens_per_second: float = 200.0, time_to_first_token: float = 0.1,
+                          response_tokens: int = 80, user_prompt: str = DEFAULT_BENCHMARK_PROMPT,
+                          show_output: bool = False, **meeting_options) -> dict:
+    """
+    Run the end-to-end meeting benchmark.
+
+    Args:
+        runs: Number of full meetings to run
+        tokens_per_second: Mock model streaming throughput
+        time_to_first_token: Mock model latency before the first chunk, in seconds
+        response_tokens: Length of each mock response, in tokens
+        user_prompt: Request given to the committee
+        show_output: Whether to render the meetings to stdout
+        **meeting_options: Options passed to CommitteeMeetingSwarm.from_members
+            (e.g. facilitator_router, prompt_cache)
+
+    Returns:
+        Machine-readable results: environment, config, per-run stats and medians
+    """
+    results = []
+    for run_index in range(runs):
+        # Same seed every run, so every run sees identical model output
+        mock_model = MockModelConfig(
+            tokens_per_second=tokens_per_second,
+            time_to_first_token=time_to_first_token,
+            response_tokens=response_tokens,
+        )
+        results.append(asyncio.run(run_meeting_benchmark_once(
+            mock_model,
+            user_prompt=user_prompt,
+            show_output=show_output,
+            **meeting_options
+        )))
+
+    return {
+        'benchmark': 'meeting',
+        'environment': environment_info(),
+        'config': {
+            'runs': runs,
+            'tokens_per_second': tokens_per_second,
+            'time_to_first_token': time_to_first_token,
+            'response_tokens': response_tokens,
+            'user_prompt': user_prompt,
+            **meeting_options,
+        },
+        'runs': results,
+        'summary': _summarize(results),
+    }
+
+
+def print_meeting_benchmark(results: dict):
+    """Print a human-readable summary of meeting benchmark results."""
+    summary = results['summary']
+    last_run = results['runs'][-1]
+
+    print("\n" + "=" * 80)
+    print(f"MEETING BENCHMARK ({results['config']['runs']} runs)")
+    print("=" * 80)
+    print(f"\nWall time (median): {summary['wall_time_median']:.3f}s, "
+          f"orchestration overhead (median): {summary['orchestration_overhead_median']:.3f}s")
+
+    print("\nPer phase (median wall / overhead, last run turns and handoffs):")
+    for phase in last_run['phases']:
+        phase_summary = summary['phases'][str(phase['phase'])]
+        if phase['handoffs'] is None:
+            handoffs = "handoffs n/a"
+        else:
+            limit = "" if phase['within_limit'] else " OVER LIMIT"
+            handoffs = f"{phase['handoffs']}/{phase['max_handoffs']} handoffs{limit}"
+        print(
+            f"   Phase {phase['phase']} ({phase['execution_mode']}): "
+            f"{phase_summary['wall_time_median']:.3f}s / {phase_summary['orchestration_overhead_median']:.3f}s, "
+            f"{phase['turns']} turns, {handoffs}"
+        )
+
+    print("\nPer member (last run):")
+    for agent_key, stats in last_run['members'].items():
+        if not stats['calls']:
+            continue
+        ttft = f"{stats['ttft_mean'] * 1000:.0f}ms" if stats['ttft_mean'] is not None else "n/a"
+        throughput = f"{stats['tokens_per_second']:.0f} tok/s" if stats['tokens_per_second'] else "n/a"
+        print(f"   {agent_key}: {stats['calls']} calls, TTFT {ttft}, {throughput}")
+
+    print("\n" + "=" * 80 + "\n")
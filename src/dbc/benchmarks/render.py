@@ -0,0 +1,71 @@
+"""
+Render benchmark.
+
+Replays a saved meeting transcript through CommitteeStreamHandler as fast as
+possible, with output discarded, to measure the terminal hot path without any
+model calls.
+"""
+
+from typing import List
+import asyncio
+import contextlib
+import os
+
+from dbc.benchmarks.results import environment_info, median
+from dbc.workflow.transcript_replay import TranscriptReplayer, load_transcript
+
+
+DEFAULT_TRANSCRIPT = os.path.join('examples', 'dev-portal-full-transcript.txt')
+
+
+def run_render_benchmark(transcript_path: str = DEFAULT_TRANSCRIPT, runs: int = 5, chunk_chars: int = 12,
+                         show_thinking: bool = False) -> dict:
+    """
+    Run the render benchmark.
+
+    Args:
+        transcript_path: Saved transcript to replay
+        runs: Number of replays
+        chunk_chars: Average streamed chunk size in characters
+        show_thinking: Whether the handler shows <thinking> blocks (skips the filter)
+
+    Returns:
+        Machine-readable results: environment, config, per-run stats and medians
+    """
+    replayer = TranscriptReplayer(load_transcript(transcript_path), show_thinking=show_thinking, chunk_chars=chunk_chars)
+
+    results: List[dict] = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(runs):
+            results.append(asyncio.run(replayer.replay()))
+
+    return {
+        'benchmark': 'render',
+        'environment': environment_info(),
+        'config': {
+            'runs': runs,
+            'transcript': transcript_path,
+            'chunk_chars': chunk_chars,
+            'show_thinking': show_thinking,
+        },
+        'runs': results,
+        'summary': {
+            'events_per_second_median': median([run['events_per_second'] for run in results]),
+            'bytes_per_second_median': median([run['bytes_per_second'] for run in results]),
+        },
+    }
+
+
+def print_render_benchmark(results: dict):
+    """Print a human-readable summary of render benchmark results."""
+    summary = results['summary']
+    run = results['runs'][-1]
+
+    print("\n" + "=" * 80)
+    print(f"RENDER BENCHMARK ({results['config']['runs']} runs, {results['config']['transcript']})")
+    print("=" * 80)
+    print(f"\n{run['events']} events, {run['bytes']} bytes per replay")
+    print(f"Events/sec (median): {summary['events_per_second_median']:,.0f}")
+    print(f"Bytes/sec (median): {summary['bytes_per_second_median']:,.0f}")
+    print(f"Terminal writes: {run['writes']} for {run['chunks']} chunks ({run['writes_saved']} saved)")
+    print("\n" + "=" * 80 + "\n")
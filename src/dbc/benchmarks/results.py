@@ -0,0 +1,42 @@
+"""
+Shared helpers for benchmark results.
+
+Every benchmark returns a JSON-serializable dictionary with the environment it
+ran in, so results can be compared across releases.
+"""
+
+from typing import List, Optional
+import importlib.metadata
+import json
+import platform
+import statistics
+import time
+
+
+def environment_info() -> dict:
+    """Describe the interpreter and package versions a benchmark ran with."""
+    versions = {}
+    for package in ('designed-by-committee', 'strands-agents'):
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = None
+
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'packages': versions,
+    }
+
+
+def median(values: List[float]) -> Optional[float]:
+    """Median of the values, or None if there are none."""
+    return statistics.median(values) if values else None
+
+
+def write_results(results: dict, path: str):
+    """Write benchmark results as JSON."""
+    with open(path, 'w') as results_file:
+        json.dump(results, results_file, indent=2)
+        results_file.write('\n')
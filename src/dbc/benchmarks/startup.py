@@ -0,0 +1,167 @@
+"""
+Startup benchmark.
+
+Measures what a user waits for before anything happens, each in a fresh
+interpreter: `dbc --help`, importing the CLI, building a meeting, and the
+time to the first streamed token of `dbc kickoff` against the mock model.
+For comparison it also measures the work that used to happen eagerly:
+importing the full meeting workflow, and building every member's Bedrock
+models up front.
+"""
+
+from typing import List
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+from dbc.benchmarks.results import environment_info, median
+
+
+DEFAULT_KICKOFF_PROMPT = "Design an internal developer portal for onboarding new engineers."
+
+# Builds a Bedrock-backed meeting (no model calls), then forces every lazy model to be built
+_CONSTRUCTION_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from dbc.committee import COMMITTEE_MEMBERS
+from dbc.models import LazyModel
+from dbc.workflow import CommitteeMeetingSwarm
+meeting = CommitteeMeetingSwarm.from_members(COMMITTEE_MEMBERS)
+constructed = time.perf_counter()
+
+def lazy_models(model):
+    if isinstance(model, LazyModel):
+        return [model]
+    if hasattr(model, 'models'):
+        return [lazy for _, inner in model.models for lazy in lazy_models(inner)]
+    return lazy_models(model.model) if hasattr(model, 'model') else []
+
+models = [lazy for agent in meeting.agents.values() for lazy in lazy_models(agent.agent.model)]
+built_on_construction = sum(lazy.built for lazy in models)
+for lazy in models:
+    lazy.model
+print(json.dumps({
+    'construct': constructed - start,
+    'models': len(models),
+    'built_on_construction': built_on_construction,
+    'build_all': time.perf_counter() - constructed,
+}))
+"""
+
+_SPEAKER_HEADER_PATTERN = re.compile(r'^\[\d{2}:\d{2}:\d{2}\] .+ \(.+\):$')
+
+
+def _python(*args: str, **kwargs) -> subprocess.CompletedProcess:
+    """Run the current interpreter in a fresh process."""
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True, **kwargs)
+
+
+def _wall_time(*args: str) -> float:
+    """Wall time of a fresh interpreter running args."""
+    start = time.perf_counter()
+    _python(*args)
+    return time.perf_counter() - start
+
+
+def _import_time(module: str) -> float:
+    """Cumulative import time of a module in a fresh interpreter, in seconds (from -X importtime)."""
+    stderr = _python('-X', 'importtime', '-c', f'import {module}').stderr
+    for line in reversed(stderr.splitlines()):
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1e6
+    return None
+
+
+def _kickoff_time_to_first_token(prompt: str, time_to_first_token: float) -> float:
+    """Seconds from launching `dbc kickoff` (mock model) to the first streamed text."""
+    command = [
+        sys.executable, '-m', 'dbc.cli', 'kickoff',
+        '--mock-model', '--mock-ttft', str(time_to_first_token),
+        '--questions-per-agent', '0', '--no-preflight',
+        prompt,
+    ]
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                               stderr=subprocess.DEVNULL, text=True)
+    try:
+        seen_header = False
+        for line in process.stdout:
+            if seen_header and line.strip():
+                return time.perf_counter() - start
+            seen_header = seen_header or bool(_SPEAKER_HEADER_PATTERN.match(line.rstrip('\n')))
+        return None
+    finally:
+        process.kill()
+        process.wait()
+
+
+def run_startup_benchmark(runs: int = 5, time_to_first_token: float = 0.0,
+                          prompt: str = DEFAULT_KICKOFF_PROMPT) -> dict:
+    """
+    Run the startup benchmark.
+
+    Args:
+        runs: Number of fresh interpreters per measurement
+        time_to_first_token: Mock model latency before the first chunk, in seconds
+        prompt: Request given to the committee for the kickoff measurement
+
+    Returns:
+        Machine-readable results: environment, config, per-run stats and medians
+    """
+    results: List[dict] = []
+    for _ in range(runs):
+        construction = json.loads(_python('-c', _CONSTRUCTION_SCRIPT).stdout)
+        results.append({
+            'help_wall_time': _wall_time('-m', 'dbc.cli', '--help'),
+            'cli_import_time': _import_time('dbc.cli'),
+            'workflow_import_time': _import_time('dbc.workflow.committee_meeting_swarm'),
+            'meeting_construction_time': construction['construct'],
+            'bedrock_models': construction['models'],
+            'bedrock_models_built_on_construction': construction['built_on_construction'],
+            'bedrock_models_build_all_time': construction['build_all'],
+            'kickoff_time_to_first_token': _kickoff_time_to_first_token(prompt, time_to_first_token),
+        })
+
+    return {
+        'benchmark': 'startup',
+        'environment': environment_info(),
+        'config': {
+            'runs': runs,
+            'time_to_first_token': time_to_first_token,
+            'prompt': prompt,
+            'cwd': os.getcwd(),
+        },
+        'runs': results,
+        'summary': {
+            f'{key}_median': median([run[key] for run in results if run[key] is not None])
+            for key in results[0]
+            if key not in ('bedrock_models', 'bedrock_models_built_on_construction')
+        },
+    }
+
+
+def print_startup_benchmark(results: dict):
+    """Print a human-readable summary of startup benchmark results."""
+    summary = results['summary']
+    run = results['runs'][-1]
+
+    def seconds(value):
+        return f"{value * 1000:.0f}ms" if value is not None else "n/a"
+
+    print("\n" + "=" * 80)
+    print(f"STARTUP BENCHMARK ({results['config']['runs']} runs, medians)")
+    print("=" * 80)
+    print(f"\ndbc --help: {seconds(summary['help_wall_time_median'])} wall "
+          f"(CLI import {seconds(summary['cli_import_time_median'])}; "
+          f"full workflow import it no longer pays: {seconds(summary['workflow_import_time_median'])})")
+    print(f"Meeting construction: {seconds(summary['meeting_construction_time_median'])}, "
+          f"{run['bedrock_models_built_on_construction']}/{run['bedrock_models']} Bedrock models built "
+          f"(building all up front would add {seconds(summary['bedrock_models_build_all_time_median'])})")
+    print(f"dbc kickoff time to first token (mock model, "
+          f"{results['config']['time_to_first_token']}s model TTFT): "
+          f"{seconds(summary['kickoff_time_to_first_token_median'])}")
+    print("\n" + "=" * 80 + "\n")
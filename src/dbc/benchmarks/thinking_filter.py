@@ -0,0 +1,104 @@
+"""
+Thinking filter micro-benchmark.
+
+Streams a transcript with <thinking> blocks mixed in (nested and case-varied)
+through ThinkingBlockFilter at several chunk sizes and reports throughput.
+Chunk size matters because the filter runs once per streamed delta.
+"""
+
+from typing import List
+import os
+import random
+import time
+
+from dbc.benchmarks.results import environment_info, median
+from dbc.workflow.thinking_filter import ThinkingBlockFilter
+
+
+DEFAULT_TRANSCRIPT = os.path.join('examples', 'dev-portal-full-transcript.txt')
+DEFAULT_CHUNK_SIZES = (1, 4, 16, 64, 256)
+
+_THINKING_BLOCKS = (
+    "<thinking>Weigh the proposal against the timeline.</thinking>\n",
+    "<THINKING>Check the security implications first.</THINKING> ",
+    "<thinking>Outer <Thinking>nested aside</Thinking> back to the outer block.</thinking>\n\n",
+)
+
+
+def build_stream_text(transcript: str, seed: int = 0) -> str:
+    """Insert thinking blocks before roughly every third paragraph of the transcript."""
+    rng = random.Random(seed)
+    paragraphs = transcript.split('\n\n')
+    return '\n\n'.join(
+        (rng.choice(_THINKING_BLOCKS) + paragraph) if rng.random() < 0.3 else paragraph
+        for paragraph in paragraphs
+    )
+
+
+def _chunks(text: str, chunk_size: int) -> List[str]:
+    return [text[position:position + chunk_size] for position in range(0, len(text), chunk_size)]
+
+
+def _time_filter(chunks: List[str]) -> float:
+    """Seconds to filter one full stream."""
+    thinking_filter = ThinkingBlockFilter()
+    start = time.perf_counter()
+    for chunk in chunks:
+        thinking_filter.feed(chunk)
+    thinking_filter.flush()
+    return time.perf_counter() - start
+
+
+def run_thinking_filter_benchmark(transcript_path: str = DEFAULT_TRANSCRIPT, runs: int = 5,
+                                  chunk_sizes=DEFAULT_CHUNK_SIZES) -> dict:
+    """
+    Run the thinking filter micro-benchmark.
+
+    Args:
+        transcript_path: Transcript used as the base text
+        runs: Timed repetitions per chunk size
+        chunk_sizes: Chunk sizes (in characters) to stream the text in
+
+    Returns:
+        Machine-readable results: environment, config and per-chunk-size throughput
+    """
+    with open(transcript_path, encoding='utf-8') as transcript_file:
+        text = build_stream_text(transcript_file.read())
+
+    results = []
+    for chunk_size in chunk_sizes:
+        chunks = _chunks(text, chunk_size)
+        timings = [_time_filter(chunks) for _ in range(runs)]
+        seconds = median(timings)
+        results.append({
+            'chunk_size': chunk_size,
+            'chunks': len(chunks),
+            'seconds_median': seconds,
+            'chars_per_second': len(text) / seconds if seconds else None,
+            'chunks_per_second': len(chunks) / seconds if seconds else None,
+        })
+
+    return {
+        'benchmark': 'thinking-filter',
+        'environment': environment_info(),
+        'config': {
+            'runs': runs,
+            'transcript': transcript_path,
+            'characters': len(text),
+            'chunk_sizes': list(chunk_sizes),
+        },
+        'results': results,
+    }
+
+
+def print_thinking_filter_benchmark(results: dict):
+    """Print a human-readable summary of thinking filter benchmark results."""
+    print("\n" + "=" * 80)
+    print(f"THINKING FILTER BENCHMARK ({results['config']['characters']} characters)")
+    print("=" * 80 + "\n")
+    for result in results['results']:
+        print(
+            f"   {result['chunk_size']:>4} chars/chunk: {result['chars_per_second']:>14,.0f} chars/sec, "
+            f"{result['chunks_per_second']:>12,.0f} chunks/sec"
+        )
+    print("\n" + "=" * 80 + "\n")
@@ -1,12 +1,144 @@
 """CLI entry point for Designed by Committee."""
 import argparse
 import sys
+from contextlib import contextmanager
 from dbc.committee import COMMITTEE_MEMBERS
-from dbc.workflow import CommitteeMeetingSwarm
+from dbc.workflow.swarm_config import SWARM_CONFIG
+
+# Strands, boto3 and the meeting workflow are imported inside the commands that
+# need them, so `dbc --help` and argument errors return immediately.
+
+
+def build_mock_model_config(args):
+    """Build the offline model config from CLI flags, or None to use Bedrock."""
+    if not (args.mock_model or args.mock_script):
+        return None
+    
+    from dbc.models import MockModelConfig
+    config = MockModelConfig.from_file(args.mock_script) if args.mock_script else MockModelConfig()
+    if args.mock_tokens_per_second is not None:
+        config.tokens_per_second = args.mock_tokens_per_second
+    if args.mock_ttft is not None:
+        config.time_to_first_token = args.mock_ttft
+    if args.mock_error_rate is not None:
+        config.error_rate = args.mock_error_rate
+    return config
+
+
+def add_mock_model_arguments(parser):
+    """Add the offline model flags to a subcommand parser."""
+    parser.add_argument(
+        "--mock-model",
+        action="store_true",
+        help="Use an offline mock model instead of Amazon Bedrock (no AWS credentials needed)"
+    )
+    parser.add_argument(
+        "--mock-script",
+        metavar="PATH",
+        help="JSON script for the mock model (responses, handoffs, errors per member; implies --mock-model)"
+    )
+    parser.add_argument(
+        "--mock-tokens-per-second",
+        type=float,
+        help="Mock model streaming throughput (default: unthrottled)"
+    )
+    parser.add_argument(
+        "--mock-ttft",
+        type=float,
+        help="Mock model time to first token, in seconds (default: 0)"
+    )
+    parser.add_argument(
+        "--mock-error-rate",
+        type=float,
+        help="Probability of a mock ThrottlingException on each model call (default: 0)"
+    )
+
+
+@contextmanager
+def _meeting_errors(checkpoint=None):
+    """Report a meeting that stopped early, and how to resume it, then exit."""
+    try:
+        yield
+    except KeyboardInterrupt:
+        print("\nMeeting interrupted due to unscheduled stakeholder input.", file=sys.stderr)
+        _print_resume_hint(checkpoint)
+        sys.exit(130)
+    except Exception as e:
+        print(f"\nMeeting encountered an unresolved blocking issue: {e}", file=sys.stderr)
+        _print_resume_hint(checkpoint)
+        sys.exit(1)
+
+
+def _print_resume_hint(checkpoint=None):
+    if checkpoint is not None:
+        print(f"Resume from the last completed phase with: dbc resume {checkpoint.meeting_id}", file=sys.stderr)
+
+
+def replay_cassette(args):
+    """Re-run a recorded meeting from its cassette, with no model calls and no pauses."""
+    import time
+    from dbc.models import Cassette, CassetteError, print_replay_report
+    from dbc.workflow import CommitteeMeetingSwarm
+    
+    try:
+        cassette = Cassette.load(args.replay, strict=args.strict_replay)
+    except CassetteError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    recorded = cassette.meeting
+    meeting = CommitteeMeetingSwarm.from_members(
+        COMMITTEE_MEMBERS,
+        cassette=cassette,
+        **recorded['options']
+    )
+    
+    start = time.perf_counter()
+    with _meeting_errors():
+        meeting.run(
+            " ".join(args.prompt) or recorded['user_prompt'],
+            show_thinking=args.show_thinking,
+            questions_per_agent=recorded['questions_per_agent'],
+            show_stats=args.show_stats,
+            pause_between_phases=False
+        )
+    
+    print_replay_report(cassette)
+    print(f"Replayed in {time.perf_counter() - start:.2f}s")
+    if cassette.divergences:
+        sys.exit(1)
 
 
 def kickoff(args):
     """Kickoff a swarm-based committee meeting (default workflow)."""
+    from dbc.models import BackgroundPreflight, committee_model_ids, print_preflight_report
+    from dbc.workflow import CommitteeMeetingSwarm
+    from dbc.workflow.clarification_sources import create_answer_source
+    from dbc.workflow.phase_gate import create_phase_gate
+    
+    if args.replay:
+        replay_cassette(args)
+        return
+    
+    mock_model = build_mock_model_config(args)
+    
+    try:
+        clarification_source = create_answer_source(args.answers_file, args.answer_url)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    # Warm every committee model in the background while the user types
+    warm_up = None
+    if not args.no_preflight:
+        warm_up = BackgroundPreflight(
+            committee_model_ids(COMMITTEE_MEMBERS, include_fallbacks=not args.no_failover),
+            mock_model=mock_model,
+            deadline=SWARM_CONFIG['preflight_timeout'],
+            rate_limit=not args.no_rate_limit,
+            bedrock_pool=SWARM_CONFIG['bedrock_pool']
+        ).start()
+    
     # Get user prompt
     user_prompt = " ".join(args.prompt)
     if not user_prompt:
@@ -17,23 +149,249 @@ def kickoff(args):
         print("Error: No prompt provided", file=sys.stderr)
         sys.exit(1)
     
+    if warm_up is not None:
+        if not warm_up.done:
+            print("\nWaiting for committee models to warm up...")
+        print_preflight_report(warm_up.wait())
+    
+    # Everything needed to rebuild this meeting on resume
+    meeting_options = {
+        'facilitator_router': not args.llm_facilitator,
+        'prompt_cache': not args.no_prompt_cache,
+        'rate_limit': not args.no_rate_limit,
+        'failover': not args.no_failover,
+        'response_cache': args.response_cache,
+        'speculative': args.speculative,
+    }
+    
+    checkpoint = None
+    if not args.no_checkpoint:
+        from dataclasses import asdict
+        from dbc.workflow.checkpoint import MeetingCheckpoint
+        checkpoint = MeetingCheckpoint.create(user_prompt, options={
+            'meeting': meeting_options,
+            'mock_model': asdict(mock_model) if mock_model else None,
+            'show_thinking': args.show_thinking,
+        })
+        print(f"\nMeeting id: {checkpoint.meeting_id}")
+    
+    cassette = None
+    if args.record:
+        from dbc.models import Cassette
+        cassette = Cassette('record', meeting={
+            'user_prompt': user_prompt,
+            'options': meeting_options,
+            'questions_per_agent': args.questions_per_agent,
+        })
+    
     # Create and run swarm meeting
-    meeting = CommitteeMeetingSwarm.from_members(COMMITTEE_MEMBERS)
+    meeting = CommitteeMeetingSwarm.from_members(
+        COMMITTEE_MEMBERS,
+        mock_model=mock_model,
+        checkpoint=checkpoint,
+        cassette=cassette,
+        phase_gate=create_phase_gate(args.phase_gate, args.gate_timeout),
+        clarification_source=clarification_source,
+        clarification_timeout=args.clarification_timeout,
+        **meeting_options
+    )
     
     try:
-        meeting.run(
-            user_prompt,
-            show_thinking=args.show_thinking,
-            questions_per_agent=args.questions_per_agent
-        )
+        with _meeting_errors(checkpoint):
+            meeting.run(
+                user_prompt,
+                show_thinking=args.show_thinking,
+                questions_per_agent=args.questions_per_agent,
+                show_stats=args.show_stats
+            )
+    finally:
+        # Save whatever was recorded, even if the meeting stopped early
+        if cassette is not None:
+            cassette.save(args.record)
+            print(f"Recorded {len(cassette.interactions)} model calls to {args.record}", file=sys.stderr)
+
+
+def resume(args):
+    """Resume a checkpointed meeting from the phase after its last completed one."""
+    import asyncio
+    from dbc.models import MockModelConfig
+    from dbc.workflow import CommitteeMeetingSwarm
+    from dbc.workflow.checkpoint import CheckpointError, MeetingCheckpoint, latest_checkpoint
+    
+    meeting_id = args.meeting_id
+    if meeting_id == "latest":
+        meeting_id = latest_checkpoint()
+        if meeting_id is None:
+            print("Error: No saved meetings to resume", file=sys.stderr)
+            sys.exit(1)
+    
+    try:
+        checkpoint = MeetingCheckpoint.load(meeting_id)
+        options = checkpoint.read()['meeting']['options']
+    except CheckpointError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    mock_model = MockModelConfig.from_dict(options['mock_model']) if options.get('mock_model') else None
+    meeting = CommitteeMeetingSwarm.from_members(
+        COMMITTEE_MEMBERS,
+        mock_model=mock_model,
+        checkpoint=checkpoint,
+        **options['meeting']
+    )
+    
+    with _meeting_errors(checkpoint):
+        asyncio.run(meeting.resume_async(
+            show_thinking=args.show_thinking or options.get('show_thinking', False),
+            show_stats=args.show_stats
+        ))
+
+
+def batch(args):
+    """Run every meeting in a JSONL file concurrently, unattended."""
+    import asyncio
+    from dbc.models import committee_model_ids, print_preflight_report, run_preflight
+    from dbc.workflow.batch import load_batch, print_batch_summary, run_batch
+    
+    try:
+        entries = load_batch(args.prompts)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    mock_model = build_mock_model_config(args)
+    
+    try:
+        if not args.no_preflight:
+            print_preflight_report(asyncio.run(run_preflight(
+                committee_model_ids(COMMITTEE_MEMBERS, include_fallbacks=not args.no_failover),
+                mock_model=mock_model,
+                deadline=SWARM_CONFIG['preflight_timeout'],
+                rate_limit=not args.no_rate_limit,
+                bedrock_pool=SWARM_CONFIG['bedrock_pool']
+            )))
+        
+        print(f"\nRunning {len(entries)} meetings, {args.concurrency} at a time...")
+        summary = asyncio.run(run_batch(
+            entries,
+            args.output_dir,
+            concurrency=args.concurrency,
+            mock_model=mock_model,
+            questions_per_agent=args.questions_per_agent,
+            show_stats=args.show_stats,
+            facilitator_router=not args.llm_facilitator,
+            prompt_cache=not args.no_prompt_cache,
+            rate_limit=not args.no_rate_limit,
+            failover=not args.no_failover,
+            response_cache=args.response_cache
+        ))
     except KeyboardInterrupt:
-        print("\nMeeting interrupted due to unscheduled stakeholder input.", file=sys.stderr)
+        print("\nBatch interrupted.", file=sys.stderr)
         sys.exit(130)
-    except Exception as e:
-        print(f"\nMeeting encountered an unresolved blocking issue: {e}", file=sys.stderr)
+    
+    print_batch_summary(summary, args.output_dir)
+    if summary['failed']:
+        sys.exit(1)
+
+
+def preflight(args):
+    """Check that every committee model is ready, warming them up concurrently."""
+    import asyncio
+    from dbc.models import committee_model_ids, print_preflight_report, run_preflight
+    
+    model_ids = committee_model_ids(COMMITTEE_MEMBERS, include_fallbacks=not args.no_fallbacks)
+    print(f"Checking {len(model_ids)} committee models...")
+    
+    try:
+        results = asyncio.run(run_preflight(
+            model_ids,
+            mock_model=build_mock_model_config(args),
+            deadline=args.timeout,
+            bedrock_pool=SWARM_CONFIG['bedrock_pool']
+        ))
+    except KeyboardInterrupt:
+        print("\nPreflight interrupted.", file=sys.stderr)
+        sys.exit(130)
+    
+    print_preflight_report(results)
+    if not all(result.ready for result in results):
         sys.exit(1)
 
 
+def bench(args):
+    """Run a benchmark suite against the offline mock model."""
+    from dbc.benchmarks import (
+        print_meeting_benchmark,
+        print_render_benchmark,
+        print_startup_benchmark,
+        print_thinking_filter_benchmark,
+        run_meeting_benchmark,
+        run_render_benchmark,
+        run_startup_benchmark,
+        run_thinking_filter_benchmark,
+        write_results,
+    )
+    
+    if args.suite in ("render", "thinking-filter", "startup"):
+        if args.suite == "startup":
+            results = run_startup_benchmark(runs=args.runs, time_to_first_token=args.ttft)
+            print_startup_benchmark(results)
+        elif args.suite == "render":
+            results = run_render_benchmark(transcript_path=args.transcript, runs=args.runs)
+            print_render_benchmark(results)
+        else:
+            results = run_thinking_filter_benchmark(transcript_path=args.transcript, runs=args.runs)
+            print_thinking_filter_benchmark(results)
+        if args.output:
+            write_results(results, args.output)
+            print(f"Results written to {args.output}")
+        return
+    
+    results = run_meeting_benchmark(
+        runs=args.runs,
+        tokens_per_second=args.tokens_per_second,
+        time_to_first_token=args.ttft,
+        response_tokens=args.response_tokens,
+        show_output=args.show_output,
+        facilitator_router=not args.llm_facilitator,
+        prompt_cache=not args.no_prompt_cache
+    )
+    print_meeting_benchmark(results)
+    
+    if args.output:
+        write_results(results, args.output)
+        print(f"Results written to {args.output}")
+
+
+def replay(args):
+    """Replay a saved meeting transcript through the terminal renderer."""
+    import asyncio
+    from dbc.workflow.transcript_replay import TranscriptReplayer, load_transcript
+    
+    replayer = TranscriptReplayer(
+        load_transcript(args.transcript),
+        show_thinking=args.show_thinking,
+        chunk_chars=args.chunk_chars
+    )
+    
+    try:
+        stats = asyncio.run(replayer.replay(speed=None if args.full_speed else args.speed))
+    except KeyboardInterrupt:
+        print("\nReplay interrupted.", file=sys.stderr)
+        sys.exit(130)
+    
+    print(
+        f"\nReplayed {stats['events']} events ({stats['bytes']} bytes) in {stats['elapsed']:.3f}s: "
+        f"{stats['events_per_second']:,.0f} events/sec, {stats['bytes_per_second']:,.0f} bytes/sec",
+        file=sys.stderr
+    )
+    print(
+        f"Output: {stats['chunks']} chunks in {stats['writes']} writes "
+        f"(~{stats['writes_saved']} writes and ~{stats['flushes_saved']} flushes saved)",
+        file=sys.stderr
+    )
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -64,8 +422,305 @@ def main():
         default=1,
         help="Number of clarification questions each agent can ask during Phase 1 (default: 2)"
     )
+    kickoff_parser.add_argument(
+        "--clarification-timeout",
+        type=float,
+        metavar="SECONDS",
+        help="How long a member waits for your answer before proceeding on assumptions "
+             f"(default: {SWARM_CONFIG['clarification']['timeout']:.0f})"
+    )
+    kickoff_parser.add_argument(
+        "--answers-file",
+        metavar="PATH",
+        help="Answer clarification questions from a JSON file of answers keyed by agent key "
+             "(each a string or a list in order, plus an optional \"default\")"
+    )
+    kickoff_parser.add_argument(
+        "--answer-url",
+        metavar="URL",
+        help="Answer clarification questions by POSTing each one to this URL "
+             "(JSON with agent_key, agent_name and question; reply {\"answer\": \"...\"})"
+    )
+    kickoff_parser.add_argument(
+        "--llm-facilitator",
+        action="store_true",
+        help="Let Morgan Calendar pick every speaker with a model call instead of the rule-based router"
+    )
+    kickoff_parser.add_argument(
+        "--no-prompt-cache",
+        action="store_true",
+        help="Disable Bedrock prompt-cache checkpoints on system prompts and phase context"
+    )
+    kickoff_parser.add_argument(
+        "--show-stats",
+        action="store_true",
+        help="Print orchestration stats (turns, tokens, early phase closures) after the meeting"
+    )
+    kickoff_parser.add_argument(
+        "--no-rate-limit",
+        action="store_true",
+        help="Send model calls without waiting on the per-model request/token quotas"
+    )
+    kickoff_parser.add_argument(
+        "--no-failover",
+        action="store_true",
+        help="Keep every member on its own model instead of failing over to its fallback models"
+    )
+    kickoff_parser.add_argument(
+        "--no-preflight",
+        action="store_true",
+        help="Skip warming up the committee models before the meeting"
+    )
+    kickoff_parser.add_argument(
+        "--response-cache",
+        action="store_true",
+        help="Replay responses to repeated model requests from the on-disk cache instead of paying for them again"
+    )
+    kickoff_parser.add_argument(
+        "--phase-gate",
+        choices=["enter", "auto", "signal"],
+        default=SWARM_CONFIG['phase_gate']['mode'],
+        help="Between phases: wait for Enter, advance automatically, or wait for SIGUSR1 "
+             f"(default: {SWARM_CONFIG['phase_gate']['mode']}; without a terminal, phases advance automatically)"
+    )
+    kickoff_parser.add_argument(
+        "--gate-timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Advance anyway after this many seconds at a phase gate (with --phase-gate auto: delay before advancing)"
+    )
+    kickoff_parser.add_argument(
+        "--speculative",
+        action="store_true",
+        help="Start the next phase's concurrent turns while you review the last one "
+             "(discarded if your note changes the phase context)"
+    )
+    kickoff_parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="Record every model request and response (and clarification answers) to a cassette file"
+    )
+    kickoff_parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="Re-run a recorded meeting from its cassette at full speed, without calling any models; "
+             "exits 1 if the meeting's requests no longer match the recording"
+    )
+    kickoff_parser.add_argument(
+        "--strict-replay",
+        action="store_true",
+        help="With --replay, stop at the first request that does not match the recording"
+    )
+    kickoff_parser.add_argument(
+        "--no-checkpoint",
+        action="store_true",
+        help="Don't save the meeting after every turn and phase (it can't be resumed with dbc resume)"
+    )
+    add_mock_model_arguments(kickoff_parser)
     kickoff_parser.set_defaults(func=kickoff)
     
+    # Resume subcommand
+    resume_parser = subparsers.add_parser(
+        "resume",
+        help="Resume a meeting that stopped early, from its last completed phase"
+    )
+    resume_parser.add_argument(
+        "meeting_id",
+        help="Meeting id printed by dbc kickoff, or 'latest' for the most recent meeting"
+    )
+    resume_parser.add_argument(
+        "--show-thinking",
+        action="store_true",
+        help="Show <thinking> blocks for debugging meeting setup"
+    )
+    resume_parser.add_argument(
+        "--show-stats",
+        action="store_true",
+        help="Print orchestration stats after the meeting"
+    )
+    resume_parser.set_defaults(func=resume)
+    
+    # Batch subcommand
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Run many meetings concurrently from a JSONL file, with no interactive pauses"
+    )
+    batch_parser.add_argument(
+        "prompts",
+        help='JSONL file, one meeting per line: {"id": ..., "prompt": ..., "clarifications": {agent_key: answer}}'
+    )
+    batch_parser.add_argument(
+        "--output-dir",
+        default="batch-results",
+        help="Directory for each meeting's transcript (<id>.txt) and result (<id>.json) (default: batch-results)"
+    )
+    batch_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Most meetings running at once (default: 4)"
+    )
+    batch_parser.add_argument(
+        "--questions-per-agent",
+        type=int,
+        default=1,
+        help="Clarification questions each agent can ask in meetings with answers in the file; "
+             "meetings without answers skip clarification (default: 1)"
+    )
+    batch_parser.add_argument(
+        "--show-stats",
+        action="store_true",
+        help="Append orchestration stats to each transcript"
+    )
+    batch_parser.add_argument(
+        "--llm-facilitator",
+        action="store_true",
+        help="Let Morgan Calendar pick every speaker with a model call instead of the rule-based router"
+    )
+    batch_parser.add_argument(
+        "--no-prompt-cache",
+        action="store_true",
+        help="Disable Bedrock prompt-cache checkpoints on system prompts and phase context"
+    )
+    batch_parser.add_argument(
+        "--no-rate-limit",
+        action="store_true",
+        help="Send model calls without waiting on the per-model request/token quotas"
+    )
+    batch_parser.add_argument(
+        "--no-failover",
+        action="store_true",
+        help="Keep every member on its own model instead of failing over to its fallback models"
+    )
+    batch_parser.add_argument(
+        "--response-cache",
+        action="store_true",
+        help="Replay responses to repeated model requests from the on-disk cache"
+    )
+    batch_parser.add_argument(
+        "--no-preflight",
+        action="store_true",
+        help="Skip warming up the committee models before the batch"
+    )
+    add_mock_model_arguments(batch_parser)
+    batch_parser.set_defaults(func=batch)
+    
+    # Preflight subcommand
+    preflight_parser = subparsers.add_parser(
+        "preflight",
+        help="Check and warm up every committee model concurrently"
+    )
+    preflight_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=SWARM_CONFIG['preflight_timeout'],
+        help=f"Seconds to keep retrying a model that is not ready yet (default: {SWARM_CONFIG['preflight_timeout']:.0f})"
+    )
+    preflight_parser.add_argument(
+        "--no-fallbacks",
+        action="store_true",
+        help="Check only each member's own model, not its fallback models"
+    )
+    add_mock_model_arguments(preflight_parser)
+    preflight_parser.set_defaults(func=preflight)
+    
+    # Benchmark subcommand
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Benchmark full meetings against the offline mock model"
+    )
+    bench_parser.add_argument(
+        "suite",
+        nargs="?",
+        choices=["meeting", "render", "thinking-filter", "startup"],
+        default="meeting",
+        help="Benchmark suite to run: full meetings, transcript rendering, the <thinking> filter, "
+             "or CLI startup and time to first token (default: meeting)"
+    )
+    bench_parser.add_argument(
+        "--transcript",
+        default="examples/dev-portal-full-transcript.txt",
+        help="Transcript used by the render and thinking-filter suites (default: examples/dev-portal-full-transcript.txt)"
+    )
+    bench_parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="Number of runs (default: 3)"
+    )
+    bench_parser.add_argument(
+        "--tokens-per-second",
+        type=float,
+        default=200.0,
+        help="Mock model streaming throughput (default: 200)"
+    )
+    bench_parser.add_argument(
+        "--ttft",
+        type=float,
+        default=0.1,
+        help="Mock model time to first token, in seconds (default: 0.1)"
+    )
+    bench_parser.add_argument(
+        "--response-tokens",
+        type=int,
+        default=80,
+        help="Length of each mock response, in tokens (default: 80)"
+    )
+    bench_parser.add_argument(
+        "--output",
+        metavar="PATH",
+        help="Write machine-readable JSON results to this file"
+    )
+    bench_parser.add_argument(
+        "--show-output",
+        action="store_true",
+        help="Render the benchmarked meetings to the terminal"
+    )
+    bench_parser.add_argument(
+        "--llm-facilitator",
+        action="store_true",
+        help="Benchmark with the LLM facilitator instead of the rule-based router"
+    )
+    bench_parser.add_argument(
+        "--no-prompt-cache",
+        action="store_true",
+        help="Benchmark without prompt-cache checkpoints"
+    )
+    bench_parser.set_defaults(func=bench)
+    
+    # Replay subcommand
+    replay_parser = subparsers.add_parser(
+        "replay",
+        help="Replay a saved meeting transcript without calling any models"
+    )
+    replay_parser.add_argument(
+        "transcript",
+        help="Path to a saved transcript (output of dbc kickoff)"
+    )
+    replay_parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Multiple of the recorded pace, from speaker timestamps (default: 1.0)"
+    )
+    replay_parser.add_argument(
+        "--full-speed",
+        action="store_true",
+        help="Replay as fast as possible, ignoring recorded timing"
+    )
+    replay_parser.add_argument(
+        "--chunk-chars",
+        type=int,
+        default=12,
+        help="Average streamed chunk size in characters (default: 12)"
+    )
+    replay_parser.add_argument(
+        "--show-thinking",
+        action="store_true",
+        help="Show <thinking> blocks"
+    )
+    replay_parser.set_defaults(func=replay)
+    
     args = parser.parse_args()
     
     if not hasattr(args, 'func'):
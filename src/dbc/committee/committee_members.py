@@ -4,8 +4,8 @@ Committee member definitions for the Designed by Committee system.
 This module contains all committee member configurations.
 """
 
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, field
+from typing import Dict, List
 
 
 @dataclass
@@ -19,12 +19,14 @@ class CommitteeMember:
         prompt_module: Importable module path for the system prompt
         model_id: Bedrock model key for this member
         title: Job title or role of the committee member
+        fallback_model_ids: Bedrock model keys to fail over to, in order, when model_id is unavailable
     """
     key: str
     display_name: str
     prompt_module: str
     model_id: str
     title: str
+    fallback_model_ids: List[str] = field(default_factory=list)
 
 
 # Committee member definitions
@@ -36,48 +38,71 @@ COMMITTEE_MEMBERS: Dict[str, CommitteeMember] = {
         display_name='Morgan Calendar',
         prompt_module='dbc.prompts.committee.morgan_calendar',
         model_id='global.anthropic.claude-haiku-4-5-20251001-v1:0',
-        title='Meeting Facilitator'
+        title='Meeting Facilitator',
+        fallback_model_ids=[
+            'global.anthropic.claude-sonnet-4-5-20250929-v1:0',
+        ]
     ),
     'nina_edgecase': CommitteeMember(
         key='nina_edgecase',
         display_name='Nina Edgecase',
         prompt_module='dbc.prompts.committee.nina_edgecase',
         model_id='global.anthropic.claude-opus-4-5-20251101-v1:0',
-        title='Principal Engineer'
+        title='Principal Engineer',
+        fallback_model_ids=[
+            'global.anthropic.claude-sonnet-4-5-20250929-v1:0',
+            'global.anthropic.claude-haiku-4-5-20251001-v1:0',
+        ]
     ),
     'casey_friday': CommitteeMember(
         key='casey_friday',
         display_name='Casey Friday',
         prompt_module='dbc.prompts.committee.casey_friday',
         model_id='global.anthropic.claude-haiku-4-5-20251001-v1:0',
-        title='Product Manager'
+        title='Product Manager',
+        fallback_model_ids=[
+            'global.anthropic.claude-sonnet-4-5-20250929-v1:0',
+        ]
     ),
     'sam_powerpoint': CommitteeMember(
         key='sam_powerpoint',
         display_name='Sam PowerPoint',
         prompt_module='dbc.prompts.committee.sam_powerpoint',
         model_id='global.anthropic.claude-sonnet-4-5-20250929-v1:0',
-        title='Director of Strategy'
+        title='Director of Strategy',
+        fallback_model_ids=[
+            'global.anthropic.claude-haiku-4-5-20251001-v1:0',
+        ]
     ),
     'fontaine_kerning': CommitteeMember(
         key='fontaine_kerning',
         display_name='Fontaine Kerning',
         prompt_module='dbc.prompts.committee.fontaine_kerning',
         model_id='global.anthropic.claude-sonnet-4-5-20250929-v1:0',
-        title='Principal Designer'
+        title='Principal Designer',
+        fallback_model_ids=[
+            'global.anthropic.claude-haiku-4-5-20251001-v1:0',
+        ]
     ),
     'pat_attacksurface': CommitteeMember(
         key='pat_attacksurface',
         display_name='Pat AttackSurface',
         prompt_module='dbc.prompts.committee.pat_attacksurface',
         model_id='global.anthropic.claude-sonnet-4-5-20250929-v1:0',
-        title='Security Architect'
+        title='Security Architect',
+        fallback_model_ids=[
+            'global.anthropic.claude-haiku-4-5-20251001-v1:0',
+        ]
     ),
     'max_token': CommitteeMember(
         key='max_token',
         display_name='Max Token',
         prompt_module='dbc.prompts.committee.max_token',
         model_id='global.anthropic.claude-opus-4-5-20251101-v1:0',
-        title='AI Platform Lead'
+        title='AI Platform Lead',
+        fallback_model_ids=[
+            'global.anthropic.claude-sonnet-4-5-20250929-v1:0',
+            'global.anthropic.claude-haiku-4-5-20251001-v1:0',
+        ]
     ),
 }
@@ -69,6 +69,13 @@ def validate_member_configuration(member: CommitteeMember) -> List[str]:
     if not member.model_id:
         errors.append("Member model_id cannot be empty")
     
+    # Fallbacks are tried in order after model_id, so repeats would only retry a failing model
+    if member.model_id in member.fallback_model_ids:
+        errors.append("Member fallback_model_ids should not include model_id")
+    
+    if len(set(member.fallback_model_ids)) != len(member.fallback_model_ids):
+        errors.append("Member fallback_model_ids should not contain duplicates")
+    
     # Check key format (should be lowercase with underscores)
     if member.key and not member.key.islower():
         errors.append("Member key should be lowercase")
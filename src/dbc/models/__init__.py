@@ -0,0 +1,75 @@
+"""
+Model providers for committee agents.
+
+Committee members normally talk to Amazon Bedrock; the models in this package
+stand in for (or wrap) BedrockModel.
+
+Each name is imported from its module on first access, so lightweight modules
+in this package (e.g. usage) can be used without importing Strands or boto3.
+"""
+
+import importlib
+
+# Exported name -> module it is defined in
+_EXPORTS = {
+    'ModelWrapper': 'wrapper',
+
+    'MockModel': 'mock_model',
+    'MockModelConfig': 'mock_model',
+    'MOCK_ERROR_CODES': 'mock_model',
+
+    'LazyModel': 'lazy',
+
+    'PooledSession': 'bedrock_client',
+    'DEFAULT_POOL_SETTINGS': 'bedrock_client',
+    'bedrock_pool_stats': 'bedrock_client',
+    'create_bedrock_model': 'bedrock_client',
+    'get_bedrock_session': 'bedrock_client',
+
+    'RetryingModel': 'retry',
+    'RetryPolicy': 'retry',
+    'RetryDeadlineExceeded': 'retry',
+    'retry_reason': 'retry',
+
+    'ModelRateLimiter': 'rate_limit',
+    'RateLimitedModel': 'rate_limit',
+    'MODEL_RATE_LIMITS': 'rate_limit',
+    'get_rate_limiter': 'rate_limit',
+    'rate_limiter_stats': 'rate_limit',
+
+    'CircuitBreaker': 'failover',
+    'CircuitOpenError': 'failover',
+    'FailoverModel': 'failover',
+    'circuit_breaker_stats': 'failover',
+    'get_circuit_breaker': 'failover',
+
+    'CachedModel': 'response_cache',
+    'ResponseCache': 'response_cache',
+    'request_key': 'response_cache',
+
+    'Cassette': 'cassette',
+    'CassetteError': 'cassette',
+    'RecordingModel': 'cassette',
+    'ReplayModel': 'cassette',
+    'print_replay_report': 'cassette',
+
+    'BackgroundPreflight': 'preflight',
+    'PreflightResult': 'preflight',
+    'check_model': 'preflight',
+    'committee_model_ids': 'preflight',
+    'print_preflight_report': 'preflight',
+    'run_preflight': 'preflight',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f'.{_EXPORTS[name]}', __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
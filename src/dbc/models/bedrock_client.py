@@ -0,0 +1,166 @@
+"""
+Shared Bedrock runtime client.
+
+A BedrockModel normally builds its own boto3 session and client: its own
+credential resolution, its own connection pool, its own retry settings. Every
+committee member talks to the same bedrock-runtime endpoint, so the models
+built here share one PooledSession per pool configuration, and that session
+hands every model the same client. Credentials are resolved once, TLS
+connections are kept alive and reused across members and across meetings in
+the process, and pool size and keep-alive are set in one place.
+"""
+
+from typing import Dict, Tuple
+import threading
+import time
+
+import boto3
+from botocore.config import Config as BotocoreConfig
+
+
+# Connection pool defaults, applied to the shared bedrock-runtime client.
+# max_pool_connections bounds concurrent model calls per client (botocore's default is 10).
+DEFAULT_POOL_SETTINGS = {
+    'max_pool_connections': 32,
+    'tcp_keepalive': True,
+}
+
+
+class PooledSession(boto3.Session):
+    """boto3 Session that creates each client once and hands the same client to every caller."""
+
+    def __init__(self, pool_settings: dict = None, **session_kwargs):
+        """
+        Args:
+            pool_settings: botocore Config options for every client this session creates
+                           (e.g. max_pool_connections, tcp_keepalive)
+            **session_kwargs: Options passed to boto3.Session (e.g. profile_name, region_name)
+        """
+        super().__init__(**session_kwargs)
+        self.pool_settings = dict(DEFAULT_POOL_SETTINGS, **(pool_settings or {}))
+        self._clients: Dict[Tuple, object] = {}
+        self._lock = threading.Lock()
+
+        self.clients_created = 0
+        self.clients_reused = 0
+        self.client_setup_time = 0.0  # Includes credential resolution, which happens at client creation
+
+    def client(self, service_name, region_name=None, endpoint_url=None, config=None, **kwargs):
+        """Return the shared client for this service, region and endpoint, creating it on first use."""
+        key = (service_name, region_name, endpoint_url)
+        with self._lock:
+            if key in self._clients:
+                self.clients_reused += 1
+                return self._clients[key]
+
+            # The caller's settings (e.g. BedrockModel's read timeout and user agent) plus the pool settings
+            pool_config = BotocoreConfig(**self.pool_settings)
+            config = config.merge(pool_config) if config is not None else pool_config
+
+            started = time.perf_counter()
+            client = super().client(
+                service_name,
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                config=config,
+                **kwargs
+            )
+            self.client_setup_time += time.perf_counter() - started
+            self.clients_created += 1
+            self._clients[key] = client
+            return client
+
+    def connection_stats(self) -> dict:
+        """Return requests sent and connections opened (TLS handshakes) by this session's clients."""
+        requests = 0
+        connections = 0
+        with self._lock:
+            clients = list(self._clients.values())
+
+        for client in clients:
+            # botocore keeps a urllib3 PoolManager per client; each pool counts its own connections
+            manager = getattr(getattr(client._endpoint, 'http_session', None), '_manager', None)
+            if manager is None:
+                continue
+            for pool_key in list(manager.pools.keys()):
+                pool = manager.pools.get(pool_key)
+                if pool is not None:
+                    requests += pool.num_requests
+                    connections += pool.num_connections
+
+        return {'requests': requests, 'connections': connections}
+
+    def stats(self) -> dict:
+        """Return client reuse and connection counters."""
+        return {
+            'clients_created': self.clients_created,
+            'clients_reused': self.clients_reused,
+            'client_setup_time': self.client_setup_time,
+            **self.connection_stats(),
+        }
+
+
+_sessions: Dict[Tuple, PooledSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_bedrock_session(**pool_settings) -> PooledSession:
+    """
+    Return the process-wide session for a pool configuration, creating it on first use.
+
+    Args:
+        **pool_settings: Overrides for DEFAULT_POOL_SETTINGS
+    """
+    settings = dict(DEFAULT_POOL_SETTINGS, **pool_settings)
+    key = tuple(sorted(settings.items()))
+    with _sessions_lock:
+        if key not in _sessions:
+            _sessions[key] = PooledSession(pool_settings=settings)
+        return _sessions[key]
+
+
+def create_bedrock_model(model_id: str, pool_settings: dict = None, **model_config):
+    """
+    Build a BedrockModel that uses the shared, pooled client.
+
+    Args:
+        model_id: Bedrock model id
+        pool_settings: Overrides for DEFAULT_POOL_SETTINGS
+        **model_config: BedrockModel configuration (e.g. max_tokens)
+    """
+    from strands.models.bedrock import BedrockModel
+    return BedrockModel(
+        model_id=model_id,
+        boto_session=get_bedrock_session(**(pool_settings or {})),
+        **model_config
+    )
+
+
+def bedrock_pool_stats(since: dict = None) -> dict:
+    """
+    Return client reuse and connection counters summed over every shared session.
+
+    Args:
+        since: Earlier result of this function; counters are reported relative to it
+               (e.g. for a single meeting)
+
+    Returns:
+        Dictionary with clients_created, clients_reused, client_setup_time, requests and
+        connections, plus setup_time_saved: the client setup (and credential resolution)
+        time each reused client would have cost on its own, at the measured average
+    """
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+
+    totals = {'clients_created': 0, 'clients_reused': 0, 'client_setup_time': 0.0, 'requests': 0, 'connections': 0}
+    for session in sessions:
+        for key, value in session.stats().items():
+            totals[key] += value
+
+    # Average over the whole process, so a period that only reused clients still has a cost per client
+    average_setup = totals['client_setup_time'] / totals['clients_created'] if totals['clients_created'] else 0.0
+
+    if since is not None:
+        totals = {key: value - since.get(key, 0) for key, value in totals.items()}
+    totals['setup_time_saved'] = totals['clients_reused'] * average_setup
+    return totals
@@ -0,0 +1,332 @@
+"""
+Record-and-replay cassettes for committee meetings.
+
+A cassette captures every model request a meeting sends and the events each
+response streamed, tool calls (handoffs, clarification requests) included,
+along with the user's clarification answers. Replaying a cassette serves those
+responses back at full speed with no model (and no network) behind them, so a
+real five-phase meeting becomes a fast, repeatable regression fixture.
+
+Structured-output calls are forced tool calls made through the same stream,
+so they are recorded and replayed like any other call. Responses are matched
+per member, in call order, which holds even when members run concurrently. Each replayed request is compared with the recorded
+one; where they differ, the replay carries on with the recorded response and
+reports where the meeting diverged.
+"""
+
+from typing import Dict, List, Optional
+import copy
+import gzip
+import hashlib
+import json
+import threading
+
+from strands.models.model import Model
+
+from dbc.models.response_cache import _answering_model, _decode, _encode, canonical_json, request_key
+from dbc.models.structured_output import stream_structured_output
+from dbc.models.wrapper import ModelWrapper
+
+
+CASSETTE_FORMAT_VERSION = 1
+
+# Characters of a diverging message shown in replay reports
+PREVIEW_CHARS = 120
+
+
+class CassetteError(Exception):
+    """A cassette cannot be loaded, or has no recorded response for a request."""
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(canonical_json(value).encode('utf-8')).hexdigest()[:16]
+
+
+def _preview(message: dict) -> str:
+    """Short, single-line summary of a message's content."""
+    parts = []
+    for block in message.get('content', []):
+        if 'text' in block:
+            parts.append(block['text'])
+        elif 'toolUse' in block:
+            parts.append(f"[toolUse {block['toolUse'].get('name')}]")
+        elif 'toolResult' in block:
+            parts.append('[toolResult]')
+    text = ' '.join(' '.join(parts).split())
+    return text[:PREVIEW_CHARS] + ('...' if len(text) > PREVIEW_CHARS else '')
+
+
+def request_fingerprint(model_id: str, messages: List[dict], tool_specs=None, system_prompt=None,
+                        tool_choice=None, system_prompt_content=None) -> dict:
+    """
+    Summarize a model request compactly enough to store, yet precisely enough to say where two requests differ.
+
+    Returns:
+        Dictionary with the full request key, the model id, digests of the system
+        prompt and tools, the tool names, and one digest per message
+    """
+    return {
+        'key': request_key(
+            model_id,
+            messages,
+            tool_specs=tool_specs,
+            system_prompt=system_prompt,
+            tool_choice=tool_choice,
+            system_prompt_content=system_prompt_content,
+        ),
+        'model_id': model_id,
+        'system': _digest([system_prompt, system_prompt_content]),
+        'tools': _digest([tool_specs, tool_choice]),
+        'tool_names': sorted(spec.get('name', '') for spec in tool_specs or []),
+        'messages': [_digest(message) for message in messages],
+    }
+
+
+def describe_divergence(recorded: dict, replayed: dict, messages: List[dict]) -> str:
+    """Explain the first difference between a recorded and a replayed request fingerprint."""
+    if recorded['model_id'] != replayed['model_id']:
+        return f"model changed: {recorded['model_id']} -> {replayed['model_id']}"
+    if recorded['system'] != replayed['system']:
+        return "system prompt changed"
+    if recorded['tools'] != replayed['tools']:
+        added = sorted(set(replayed['tool_names']) - set(recorded['tool_names']))
+        removed = sorted(set(recorded['tool_names']) - set(replayed['tool_names']))
+        return f"tools changed (added {added or 'none'}, removed {removed or 'none'})"
+
+    recorded_messages = recorded['messages']
+    replayed_messages = replayed['messages']
+    for index, (old, new) in enumerate(zip(recorded_messages, replayed_messages)):
+        if old != new:
+            message = messages[index]
+            return f"message {index + 1} ({message.get('role')}) changed: {_preview(message)!r}"
+    return f"history has {len(replayed_messages)} messages, recording had {len(recorded_messages)}"
+
+
+class Cassette:
+    """Recorded model interactions and clarification answers for one meeting."""
+
+    def __init__(self, mode: str = 'record', meeting: dict = None, interactions: List[dict] = None,
+                 clarifications: List[dict] = None, strict: bool = False):
+        """
+        Args:
+            mode: 'record' to capture a live meeting, 'replay' to serve a recorded one
+            meeting: What is needed to rebuild the meeting (user prompt and options)
+            interactions: Recorded requests and responses, in call order
+            clarifications: Recorded clarification questions and answers, in order
+            strict: In replay, raise CassetteError at the first divergence instead of reporting it
+        """
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.mode = mode
+        self.meeting = meeting or {}
+        self.interactions = interactions or []
+        self.clarifications = clarifications or []
+        self.strict = strict
+        self.divergences: List[dict] = []
+
+        self._lock = threading.Lock()
+        # Replay position per member, for model calls and for clarification answers
+        self._call_counts: Dict[str, int] = {}
+        self._clarification_counts: Dict[str, int] = {}
+
+    @classmethod
+    def load(cls, path: str, strict: bool = False) -> 'Cassette':
+        """Load a cassette for replay."""
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as cassette_file:
+                data = json.load(cassette_file, object_hook=_decode)
+        except (OSError, ValueError) as e:
+            raise CassetteError(f"Cannot read cassette {path}: {e}")
+        if data.get('version') != CASSETTE_FORMAT_VERSION:
+            raise CassetteError(f"Cassette {path} has format version {data.get('version')}, expected {CASSETTE_FORMAT_VERSION}")
+        return cls(
+            mode='replay',
+            meeting=data['meeting'],
+            interactions=data['interactions'],
+            clarifications=data['clarifications'],
+            strict=strict,
+        )
+
+    def save(self, path: str):
+        """Write the cassette (gzip-compressed JSON)."""
+        data = {
+            'version': CASSETTE_FORMAT_VERSION,
+            'meeting': self.meeting,
+            'interactions': self.interactions,
+            'clarifications': self.clarifications,
+        }
+        with gzip.open(path, 'wt', encoding='utf-8') as cassette_file:
+            json.dump(data, cassette_file, default=_encode, separators=(',', ':'))
+
+    def record_interaction(self, agent_key: str, fingerprint: dict, events: List[dict], model_id: str = None):
+        """Append one model call and the events its response streamed."""
+        with self._lock:
+            call = self._call_counts.get(agent_key, 0)
+            self._call_counts[agent_key] = call + 1
+            self.interactions.append({
+                'agent_key': agent_key,
+                'call': call,
+                'answered_by': model_id,
+                'request': fingerprint,
+                'events': events,
+            })
+
+    def record_clarification(self, agent_key: str, question: str, response: str):
+        """Append one clarification question and the user's answer."""
+        with self._lock:
+            self.clarifications.append({'agent_key': agent_key, 'question': question, 'response': response})
+
+    def _divergence(self, agent_key: str, kind: str, call: int, detail: str):
+        divergence = {'agent_key': agent_key, 'kind': kind, 'call': call + 1, 'detail': detail}
+        with self._lock:
+            self.divergences.append(divergence)
+        if self.strict:
+            raise CassetteError(f"Replay diverged at {agent_key} {kind} #{call + 1}: {detail}")
+
+    def next_interaction(self, agent_key: str, fingerprint: dict, messages: List[dict]) -> dict:
+        """
+        Return the recorded interaction for a member's next model call, noting any divergence.
+
+        Raises:
+            CassetteError: If the member made more calls than were recorded (or on divergence in strict mode)
+        """
+        with self._lock:
+            call = self._call_counts.get(agent_key, 0)
+            self._call_counts[agent_key] = call + 1
+            recorded = [interaction for interaction in self.interactions if interaction['agent_key'] == agent_key]
+
+        if call >= len(recorded):
+            raise CassetteError(f"No recorded response for {agent_key} model call #{call + 1} ({len(recorded)} recorded)")
+
+        interaction = recorded[call]
+        if interaction['request']['key'] != fingerprint['key']:
+            self._divergence(agent_key, 'model call', call, describe_divergence(interaction['request'], fingerprint, messages))
+        return interaction
+
+    def next_clarification(self, agent_key: str, question: str) -> str:
+        """Return the recorded answer to a member's next clarification question, noting any divergence."""
+        with self._lock:
+            index = self._clarification_counts.get(agent_key, 0)
+            self._clarification_counts[agent_key] = index + 1
+            recorded = [entry for entry in self.clarifications if entry['agent_key'] == agent_key]
+
+        if index >= len(recorded):
+            self._divergence(agent_key, 'clarification', index, f"question was not asked in the recording: {question!r}")
+            return ""
+
+        entry = recorded[index]
+        if entry['question'] != question:
+            self._divergence(agent_key, 'clarification', index, f"question changed: {question!r}")
+        return entry['response']
+
+    def unused_interactions(self) -> int:
+        """Recorded model calls the replay never made."""
+        with self._lock:
+            return len(self.interactions) - sum(self._call_counts.values())
+
+    def stats(self) -> dict:
+        """Return interaction, clarification and divergence counts."""
+        with self._lock:
+            calls = sum(self._call_counts.values())
+        return {
+            'mode': self.mode,
+            'recorded': len(self.interactions),
+            'calls': calls,
+            'clarifications': len(self.clarifications),
+            'divergences': len(self.divergences),
+        }
+
+
+def print_replay_report(cassette: Cassette):
+    """Print whether a replay matched its recording, and where it diverged if not."""
+    stats = cassette.stats()
+    unused = cassette.unused_interactions()
+    print(f"\nCassette replay: {stats['calls']}/{stats['recorded']} recorded model calls served, "
+          f"{stats['divergences']} divergences")
+    for divergence in cassette.divergences:
+        print(f"   {divergence['agent_key']} {divergence['kind']} #{divergence['call']}: {divergence['detail']}")
+    if unused:
+        print(f"   {unused} recorded model calls were never made")
+
+
+class RecordingModel(ModelWrapper):
+    """Model wrapper that records every request and streamed response into a cassette."""
+
+    def __init__(self, model: Model, agent_key: str, model_id: str, cassette: Cassette):
+        """
+        Args:
+            model: Model to wrap (the member's full model chain)
+            agent_key: Member the calls belong to (responses are replayed per member)
+            model_id: Model id the requests are addressed to
+            cassette: Cassette to record into
+        """
+        super().__init__(model)
+        self.agent_key = agent_key
+        self.model_id = model_id
+        self.cassette = cassette
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        fingerprint = request_fingerprint(
+            self.model_id,
+            messages,
+            tool_specs=tool_specs,
+            system_prompt=system_prompt,
+            tool_choice=kwargs.get('tool_choice'),
+            system_prompt_content=kwargs.get('system_prompt_content'),
+        )
+
+        events = []
+        async for event in self.model.stream(messages, tool_specs, system_prompt, **kwargs):
+            events.append(copy.deepcopy(event))
+            yield event
+
+        # Only complete responses are recorded; a failed call is retried below this wrapper
+        self.cassette.record_interaction(
+            self.agent_key,
+            fingerprint,
+            events,
+            model_id=_answering_model(self.model) or self.model_id
+        )
+
+
+class ReplayModel(Model):
+    """Model that serves a member's recorded responses from a cassette, at full speed."""
+
+    def __init__(self, agent_key: str, model_id: str, cassette: Cassette):
+        """
+        Args:
+            agent_key: Member whose recorded responses to serve
+            model_id: Model id the member's requests are addressed to
+            cassette: Cassette to replay
+        """
+        self.agent_key = agent_key
+        self.model_id = model_id
+        self.cassette = cassette
+        self.config = {'model_id': model_id}
+        # Model that answered the recorded call being replayed
+        self.answered_by: Optional[str] = None
+
+    def update_config(self, **model_config):
+        self.config.update(model_config)
+
+    def get_config(self):
+        return self.config
+
+    def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        # Recorded as a forced tool call, so the recorded stream is served like any other
+        return stream_structured_output(self, output_model, prompt, system_prompt=system_prompt, **kwargs)
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        fingerprint = request_fingerprint(
+            self.model_id,
+            messages,
+            tool_specs=tool_specs,
+            system_prompt=system_prompt,
+            tool_choice=kwargs.get('tool_choice'),
+            system_prompt_content=kwargs.get('system_prompt_content'),
+        )
+        interaction = self.cassette.next_interaction(self.agent_key, fingerprint, messages)
+        self.answered_by = interaction.get('answered_by') or self.model_id
+
+        for event in interaction['events']:
+            yield copy.deepcopy(event)
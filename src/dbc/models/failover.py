@@ -0,0 +1,257 @@
+"""
+Model failover with per-model circuit breakers.
+
+FailoverModel tries a member's models in order (e.g. Opus, then Sonnet, then
+Haiku). Each model id has one CircuitBreaker for the whole process, shared by
+every member using that model: after repeated failures or latency-SLO
+breaches the breaker opens and calls go straight to the next model, then
+after a cool-down a single call probes the primary again.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+import threading
+import time
+
+from strands.models.model import Model
+from strands.types.exceptions import ModelThrottledException
+
+from dbc.models.retry import retry_reason
+from dbc.models.wrapper import ModelWrapper
+
+
+logger = logging.getLogger(__name__)
+
+# Breaker defaults. The meeting passes SWARM_CONFIG['circuit_breaker'].
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_COOL_DOWN = 60.0
+DEFAULT_LATENCY_SLO = None
+
+
+class CircuitOpenError(ModelThrottledException):
+    """Every model in a failover chain is shedding load; retry after retry_after seconds."""
+
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Health of one model id: closed (in use), open (skipped) or half-open (probing).
+
+    Consecutive failures and latency-SLO breaches both count towards opening the
+    breaker; any healthy response closes it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        model_id: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cool_down: float = DEFAULT_COOL_DOWN,
+        latency_slo: float = DEFAULT_LATENCY_SLO
+    ):
+        """
+        Args:
+            model_id: Model id this breaker tracks
+            failure_threshold: Consecutive failures (or SLO breaches) that open the breaker
+            cool_down: Seconds the breaker stays open before a probe call is let through
+            latency_slo: Time to first output, in seconds, above which a call counts as a
+                         breach (None disables the latency check)
+        """
+        self.model_id = model_id
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+        self.latency_slo = latency_slo
+        self._lock = threading.Lock()
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+
+        self.trips = 0
+        self.slo_breaches = 0
+
+    def allow_request(self) -> bool:
+        """Return whether a call may go to this model now (moving to half-open after the cool-down)."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.cool_down:
+                # Let exactly one probe through; everyone else keeps skipping the model
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def retry_after(self) -> float:
+        """Seconds until the breaker will let a probe through (0 if it would now)."""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(self.cool_down - (time.monotonic() - self.opened_at), 0.0)
+
+    def record_success(self, latency: float = None):
+        """Record a call that produced output, latency seconds after it was sent."""
+        if self.latency_slo is not None and latency is not None and latency > self.latency_slo:
+            with self._lock:
+                self.slo_breaches += 1
+            self.record_failure()
+            return
+
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        """Record a failed call (or SLO breach), opening the breaker at the threshold or on a failed probe."""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.failures >= self.failure_threshold):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self.trips += 1
+
+    def release_probe(self):
+        """Give up a probe that ended without a verdict (e.g. cancelled), so the next call probes instead."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+    def stats(self) -> dict:
+        """Return the breaker's state and counters."""
+        return {
+            'model_id': self.model_id,
+            'state': self.state,
+            'failures': self.failures,
+            'trips': self.trips,
+            'slo_breaches': self.slo_breaches,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(model_id: str, **settings) -> CircuitBreaker:
+    """
+    Return the process-wide breaker for a model id, creating it on first use.
+
+    Args:
+        model_id: Model id to look up
+        **settings: CircuitBreaker settings, used only when the breaker is created
+    """
+    with _breakers_lock:
+        if model_id not in _breakers:
+            _breakers[model_id] = CircuitBreaker(model_id, **settings)
+        return _breakers[model_id]
+
+
+def circuit_breaker_stats(model_id: Optional[str] = None) -> Dict[str, dict]:
+    """Return stats for every breaker created so far (or just one model id)."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {
+        breaker.model_id: breaker.stats()
+        for breaker in breakers
+        if model_id is None or breaker.model_id == model_id
+    }
+
+
+class FailoverModel(ModelWrapper):
+    """Model wrapper that sends each call to the first healthy model in a fallback chain."""
+
+    def __init__(self, models: List[Tuple[str, Model]], label: str = None, breaker_settings: dict = None,
+                 notify: Callable[[str], None] = None):
+        """
+        Args:
+            models: (model_id, model) pairs, primary first
+            label: Name used in failover messages (e.g. the member's display name)
+            breaker_settings: CircuitBreaker settings for breakers created by this chain
+            notify: Called with each failover notice (e.g. to write it to the meeting's
+                    output sink); defaults to this module's logger
+        """
+        if not models:
+            raise ValueError("FailoverModel needs at least one model")
+
+        self.models = models
+        self.label = label or 'model'
+        self.notify = notify or logger.warning
+        self.breakers = {
+            model_id: get_circuit_breaker(model_id, **(breaker_settings or {}))
+            for model_id, _ in models
+        }
+        # Model id that produced the most recent response
+        self.answered_by = None
+
+    @property
+    def primary_model_id(self) -> str:
+        return self.models[0][0]
+
+    def update_config(self, **model_config):
+        # The chain has no single wrapped model; every model in it gets the change
+        for _, model in self.models:
+            model.update_config(**model_config)
+
+    def get_config(self):
+        return self.models[0][1].get_config()
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        """
+        Stream from the first model whose breaker allows it, failing over before any output.
+
+        Raises:
+            CircuitOpenError: If every model is skipped by an open breaker
+            Exception: The last model's error, non-retryable errors, and errors raised mid-stream
+        """
+        last_error = None
+
+        for model_id, model in self.models:
+            breaker = self.breakers[model_id]
+            if not breaker.allow_request():
+                continue
+
+            if last_error is not None:
+                self.notify(f"Falling back to {model_id} for {self.label}")
+
+            started = time.monotonic()
+            produced_output = False
+            verdict = False
+            try:
+                async for event in model.stream(messages, tool_specs, system_prompt, **kwargs):
+                    if not produced_output:
+                        produced_output = True
+                        breaker.record_success(latency=time.monotonic() - started)
+                        verdict = True
+                        self.answered_by = model_id
+                    yield event
+                return
+            except Exception as error:
+                if not produced_output:
+                    if retry_reason(error) is None:
+                        # Not a health signal (e.g. a validation error); another model would fail the same way
+                        raise
+                    breaker.record_failure()
+                    verdict = True
+                    last_error = error
+                    self.notify(f"{model_id} unavailable for {self.label} ({retry_reason(error)})")
+                    continue
+                breaker.record_failure()
+                raise
+            finally:
+                if not verdict:
+                    breaker.release_probe()
+
+        if last_error is not None:
+            raise last_error
+
+        # Every breaker is open: wait (via the retry wrapper) until the first one will probe again
+        retry_after = min(self.breakers[model_id].retry_after() for model_id, _ in self.models)
+        raise CircuitOpenError(
+            f"{self.label}: all models unavailable ({', '.join(model_id for model_id, _ in self.models)})",
+            retry_after=retry_after
+        )
@@ -0,0 +1,65 @@
+"""
+Deferred model construction.
+
+Building a BedrockModel creates a boto3 session and client, which costs about
+a tenth of a second per model, and a meeting holds one per member plus each
+member's fallbacks. LazyModel stands in for a model until the first call, so
+members that never speak (and fallbacks that are never needed) are never built.
+"""
+
+from typing import Callable
+import threading
+
+from strands.models.model import Model
+
+from dbc.models.wrapper import ModelWrapper
+
+
+class LazyModel(ModelWrapper):
+    """Model wrapper that builds the wrapped model on first use."""
+
+    def __init__(self, factory: Callable[[], Model], model_id: str = None):
+        """
+        Args:
+            factory: Called once, with no arguments, to build the real model
+            model_id: Model id reported by get_config until the model is built
+        """
+        # ModelWrapper.__init__ is not called: the wrapped model is built on first access
+        self.factory = factory
+        self._config = {'model_id': model_id} if model_id else {}
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def built(self) -> bool:
+        """Whether the wrapped model has been built yet."""
+        return self._model is not None
+
+    @property
+    def model(self) -> Model:
+        """The wrapped model, built on first access."""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    model = self.factory()
+                    # Config changes made before the model existed still apply
+                    pending = {key: value for key, value in self._config.items() if key != 'model_id'}
+                    if pending:
+                        model.update_config(**pending)
+                    self._model = model
+        return self._model
+
+    def update_config(self, **model_config):
+        if self._model is None:
+            self._config.update(model_config)
+        else:
+            self._model.update_config(**model_config)
+
+    def get_config(self):
+        if self._model is None:
+            return self._config
+        return self._model.get_config()
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        async for event in self.model.stream(messages, tool_specs, system_prompt, **kwargs):
+            yield event
@@ -0,0 +1,368 @@
+"""
+Offline stand-in for BedrockModel.
+
+MockModel speaks the same converse-stream event protocol as BedrockModel, so
+CommitteeAgent and CommitteeMeetingSwarm run unchanged without AWS credentials.
+Output is synthetic (or scripted) text streamed at a configurable throughput,
+handoffs follow a per-member script, and Bedrock errors can be injected to
+exercise retry paths. Structured output works as it does on Bedrock: a forced
+tool call, filled from a scripted JSON response or seeded mock values.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import asyncio
+import json
+import random
+
+from botocore.exceptions import ClientError
+from strands.models.model import Model
+from strands.types.exceptions import ModelThrottledException
+
+from dbc.models.structured_output import stream_structured_output
+from dbc.models.usage import estimate_request_tokens, estimate_tokens
+
+
+# Error codes MockModel knows how to raise, matching what BedrockModel surfaces
+MOCK_ERROR_CODES = ('ThrottlingException', 'AccessDeniedException')
+
+HANDOFF_TOOL_NAME = 'handoff_to_agent'
+
+_SYNTHETIC_WORDS = (
+    'alignment', 'roadmap', 'stakeholder', 'requirement', 'latency', 'security', 'scope', 'timeline',
+    'architecture', 'design', 'review', 'workflow', 'automation', 'risk', 'proposal', 'consensus',
+    'the', 'we', 'should', 'consider', 'before', 'after', 'and', 'with', 'for', 'a', 'this', 'plan',
+)
+
+
+@dataclass
+class MockModelConfig:
+    """
+    Behaviour of the offline model, shared by every committee member.
+
+    Per-member scripts are keyed by agent key (e.g. 'nina_edgecase').
+
+    Attributes:
+        tokens_per_second: Streaming throughput; 0 streams as fast as possible
+        time_to_first_token: Seconds to wait before the first chunk of every response
+        response_tokens: Length of synthetic responses, in tokens (words)
+        chunk_tokens: Tokens per streamed chunk
+        responses: Scripted responses per member, used in order before falling back to synthetic text
+        handoffs: Handoff targets per member, one per turn (display names; None for no handoff)
+        errors: Error codes per member, raised on that member's first calls in order
+        error_rate: Probability of raising a ThrottlingException on any call
+        retry_after: Retry-after hint (seconds) attached to injected throttling errors
+        down_models: Model ids that throttle every call (e.g. to exercise failover)
+        model_latency: Extra time to first token per model id, in seconds
+        seed: Seed for synthetic text and random error injection
+    """
+    tokens_per_second: float = 0.0
+    time_to_first_token: float = 0.0
+    response_tokens: int = 80
+    chunk_tokens: int = 4
+    responses: Dict[str, List[str]] = field(default_factory=dict)
+    handoffs: Dict[str, List[Optional[str]]] = field(default_factory=dict)
+    errors: Dict[str, List[str]] = field(default_factory=dict)
+    error_rate: float = 0.0
+    retry_after: Optional[float] = None
+    down_models: List[str] = field(default_factory=list)
+    model_latency: Dict[str, float] = field(default_factory=dict)
+    seed: int = 0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'MockModelConfig':
+        """Create a config from a dictionary (e.g. a JSON script), ignoring unknown keys."""
+        known = cls.__dataclass_fields__.keys()
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+    @classmethod
+    def from_file(cls, path: str) -> 'MockModelConfig':
+        """Load a config from a JSON script file."""
+        with open(path) as script_file:
+            return cls.from_dict(json.load(script_file))
+
+    def create_model(self, agent_key: str, model_id: str = None, fallback: bool = False) -> 'MockModel':
+        """
+        Create the model for one committee member.
+
+        Args:
+            agent_key: Agent key of the member, used to look up its scripts
+            model_id: Bedrock model id the member would normally use (reported by get_config)
+            fallback: Whether this is one of the member's fallback models, which
+                      skip the member's scripted errors (use down_models to fail them)
+        """
+        return MockModel(
+            agent_key=agent_key,
+            model_id=model_id,
+            tokens_per_second=self.tokens_per_second,
+            time_to_first_token=self.time_to_first_token + self.model_latency.get(model_id, 0.0),
+            response_tokens=self.response_tokens,
+            chunk_tokens=self.chunk_tokens,
+            responses=self.responses.get(agent_key),
+            handoffs=self.handoffs.get(agent_key),
+            errors=None if fallback else self.errors.get(agent_key),
+            error_rate=self.error_rate,
+            retry_after=self.retry_after,
+            down=model_id in self.down_models,
+            seed=self.seed,
+        )
+
+
+def _throttling_error(model_id: str, retry_after: float = None) -> ClientError:
+    """Build the ThrottlingException Bedrock raises when a quota is exceeded."""
+    headers = {'retry-after': str(retry_after)} if retry_after is not None else {}
+    return ClientError(
+        {
+            'Error': {'Code': 'ThrottlingException', 'Message': f'Too many requests, please wait before trying again. ({model_id})'},
+            'ResponseMetadata': {'HTTPHeaders': headers},
+        },
+        'ConverseStream'
+    )
+
+
+def _access_denied_error(model_id: str) -> ClientError:
+    """Build the AccessDeniedException Bedrock raises while a marketplace subscription activates."""
+    return ClientError(
+        {
+            'Error': {
+                'Code': 'AccessDeniedException',
+                'Message': f'Model access is denied due to IAM user or service role is not authorized to perform '
+                           f'the required AWS Marketplace actions (aws-marketplace:Subscribe) for {model_id}.',
+            }
+        },
+        'ConverseStream'
+    )
+
+
+class MockModel(Model):
+    """Local model that streams synthetic or scripted responses through the Bedrock event protocol."""
+
+    def __init__(
+        self,
+        agent_key: str = None,
+        model_id: str = None,
+        tokens_per_second: float = 0.0,
+        time_to_first_token: float = 0.0,
+        response_tokens: int = 80,
+        chunk_tokens: int = 4,
+        responses: List[str] = None,
+        handoffs: List[Optional[str]] = None,
+        errors: List[str] = None,
+        error_rate: float = 0.0,
+        retry_after: float = None,
+        down: bool = False,
+        seed: int = 0
+    ):
+        """
+        Args:
+            agent_key: Agent key of the member using this model (seeds synthetic text)
+            model_id: Model id reported by get_config
+            tokens_per_second: Streaming throughput; 0 streams as fast as possible
+            time_to_first_token: Seconds to wait before the first chunk
+            response_tokens: Length of synthetic responses, in tokens (words)
+            chunk_tokens: Tokens per streamed chunk
+            responses: Scripted responses, used in order before falling back to synthetic text
+            handoffs: Handoff targets, one per turn (display names; None for no handoff)
+            errors: Error codes raised on the first calls, in order
+            error_rate: Probability of raising a ThrottlingException on any call
+            retry_after: Retry-after hint (seconds) attached to injected throttling errors
+            down: Whether every call throttles, as for a model with no capacity
+            seed: Seed for synthetic text and random error injection
+        """
+        for code in errors or []:
+            if code not in MOCK_ERROR_CODES:
+                raise ValueError(f"Unsupported mock error code '{code}'. Expected one of {MOCK_ERROR_CODES}")
+
+        self.agent_key = agent_key or 'mock'
+        self.config = {'model_id': model_id or f'mock.{self.agent_key}'}
+        self.tokens_per_second = tokens_per_second
+        self.time_to_first_token = time_to_first_token
+        self.response_tokens = response_tokens
+        self.chunk_tokens = max(chunk_tokens, 1)
+        self.responses = list(responses or [])
+        self.handoffs = list(handoffs or [])
+        self.errors = list(errors or [])
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.down = down
+        self.seed = seed
+        self._random = random.Random(f'{seed}:{self.agent_key}:errors')
+        self._cached_prefixes = set()
+        self.call_count = 0
+
+    def update_config(self, **model_config):
+        self.config.update(model_config)
+
+    def get_config(self) -> dict:
+        return self.config
+
+    def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        """Answer through a forced tool call, so latency and injected errors apply as for any other call."""
+        return stream_structured_output(self, output_model, prompt, system_prompt=system_prompt, **kwargs)
+
+    def _raise_injected_error(self):
+        """Raise the next scripted error, or a random throttle when error_rate is set."""
+        if self.down:
+            code = 'ThrottlingException'
+        elif self.errors:
+            code = self.errors.pop(0)
+        elif self.error_rate and self._random.random() < self.error_rate:
+            code = 'ThrottlingException'
+        else:
+            return
+
+        if code == 'ThrottlingException':
+            # BedrockModel converts throttling ClientErrors into ModelThrottledException
+            error = _throttling_error(self.config['model_id'], self.retry_after)
+            raise ModelThrottledException(error.response['Error']['Message']) from error
+        raise _access_denied_error(self.config['model_id'])
+
+    def _next_response(self) -> str:
+        """Return the next scripted response, or deterministic synthetic text."""
+        if self.responses:
+            return self.responses.pop(0)
+
+        words = random.Random(f'{self.seed}:{self.agent_key}:{self.call_count}').choices(
+            _SYNTHETIC_WORDS, k=self.response_tokens
+        )
+        return ' '.join(words).capitalize() + '.'
+
+    def _forced_tool(self, tool_specs, tool_choice) -> Optional[dict]:
+        """Return the spec of the tool a tool_choice forces the model to call, if any."""
+        if not tool_specs or not tool_choice or 'auto' in tool_choice:
+            return None
+        name = tool_choice.get('tool', {}).get('name')
+        return next((spec for spec in tool_specs if name in (None, spec['name'])), None)
+
+    def _tool_input(self, tool_spec: dict) -> dict:
+        """Return the next scripted response if it is a JSON object, else seeded values matching the tool's schema."""
+        if self.responses:
+            try:
+                scripted = json.loads(self.responses[0])
+            except ValueError:
+                scripted = None
+            if isinstance(scripted, dict):
+                self.responses.pop(0)
+                return scripted
+
+        schema = tool_spec['inputSchema']['json']
+        rng = random.Random(f'{self.seed}:{self.agent_key}:{self.call_count}:tool')
+        return self._mock_value(schema, schema.get('$defs', {}), rng)
+
+    def _mock_value(self, schema: dict, definitions: dict, rng: random.Random):
+        """Return a seeded value matching a JSON schema (the subset pydantic models produce)."""
+        if '$ref' in schema:
+            return self._mock_value(definitions[schema['$ref'].split('/')[-1]], definitions, rng)
+        for combined in ('anyOf', 'oneOf', 'allOf'):
+            if combined in schema:
+                options = [option for option in schema[combined] if option.get('type') != 'null']
+                return self._mock_value(options[0] if options else {'type': 'null'}, definitions, rng)
+        if 'enum' in schema:
+            return rng.choice(schema['enum'])
+        if 'const' in schema:
+            return schema['const']
+
+        schema_type = schema.get('type', 'object')
+        if isinstance(schema_type, list):
+            schema_type = next((option for option in schema_type if option != 'null'), 'null')
+        if schema_type == 'object':
+            return {
+                name: self._mock_value(property_schema, definitions, rng)
+                for name, property_schema in schema.get('properties', {}).items()
+            }
+        if schema_type == 'array':
+            count = max(schema.get('minItems', 1), 1)
+            return [self._mock_value(schema.get('items', {}), definitions, rng) for _ in range(count)]
+        if schema_type == 'integer':
+            return rng.randint(schema.get('minimum', 0), schema.get('maximum', 100))
+        if schema_type == 'number':
+            return round(rng.uniform(schema.get('minimum', 0), schema.get('maximum', 100)), 2)
+        if schema_type == 'boolean':
+            return rng.random() < 0.5
+        if schema_type == 'string':
+            return ' '.join(rng.choices(_SYNTHETIC_WORDS, k=4)).capitalize()
+        return None
+
+    def _cache_usage(self, system_prompt_content) -> dict:
+        """Report prompt-cache writes/reads for a system prompt followed by a cache point."""
+        blocks = system_prompt_content or []
+        if not any('cachePoint' in block for block in blocks):
+            return {}
+
+        prefix = ''.join(block.get('text', '') for block in blocks)
+        tokens = estimate_tokens(prefix)
+        if prefix in self._cached_prefixes:
+            return {'cacheReadInputTokens': tokens}
+        self._cached_prefixes.add(prefix)
+        return {'cacheWriteInputTokens': tokens}
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, *, tool_choice=None,
+                     system_prompt_content=None, **kwargs):
+        """Stream one synthetic response as Bedrock converse-stream events."""
+        self.call_count += 1
+        started = asyncio.get_running_loop().time()
+
+        if self.time_to_first_token:
+            await asyncio.sleep(self.time_to_first_token)
+        self._raise_injected_error()
+
+        yield {'messageStart': {'role': 'assistant'}}
+
+        # A forced tool call (e.g. structured output) is answered with the call alone, as Bedrock does
+        forced_tool = self._forced_tool(tool_specs, tool_choice)
+        if forced_tool is not None:
+            tool_input = json.dumps(self._tool_input(forced_tool))
+            yield {'contentBlockStart': {'start': {'toolUse': {
+                'toolUseId': f'mock-{self.agent_key}-{self.call_count}',
+                'name': forced_tool['name'],
+            }}}}
+            yield {'contentBlockDelta': {'delta': {'toolUse': {'input': tool_input}}}}
+            yield {'contentBlockStop': {}}
+            yield {'messageStop': {'stopReason': 'tool_use'}}
+            yield self._metadata_event(messages, system_prompt, system_prompt_content, estimate_tokens(tool_input), started)
+            return
+
+        # Stream words in chunks, paced to the configured throughput
+        words = self._next_response().split(' ')
+        output_tokens = 0
+        for start in range(0, len(words), self.chunk_tokens):
+            chunk = words[start:start + self.chunk_tokens]
+            text = ' '.join(chunk) + (' ' if start + self.chunk_tokens < len(words) else '')
+            output_tokens += len(chunk)
+            yield {'contentBlockDelta': {'delta': {'text': text}}}
+            if self.tokens_per_second:
+                await asyncio.sleep(len(chunk) / self.tokens_per_second)
+        yield {'contentBlockStop': {}}
+
+        # Hand off on script, but only on a fresh turn (not right after a tool result)
+        stop_reason = 'end_turn'
+        tool_names = [spec['name'] for spec in tool_specs or []]
+        last_content = messages[-1]['content'] if messages else []
+        after_tool_result = any('toolResult' in block for block in last_content)
+        if self.handoffs and HANDOFF_TOOL_NAME in tool_names and not after_tool_result:
+            target = self.handoffs.pop(0)
+            if target:
+                tool_input = json.dumps({'agent_name': target, 'message': f'Handing off to {target}.'})
+                yield {'contentBlockStart': {'start': {'toolUse': {
+                    'toolUseId': f'mock-{self.agent_key}-{self.call_count}',
+                    'name': HANDOFF_TOOL_NAME,
+                }}}}
+                yield {'contentBlockDelta': {'delta': {'toolUse': {'input': tool_input}}}}
+                yield {'contentBlockStop': {}}
+                output_tokens += estimate_tokens(tool_input)
+                stop_reason = 'tool_use'
+
+        yield {'messageStop': {'stopReason': stop_reason}}
+        yield self._metadata_event(messages, system_prompt, system_prompt_content, output_tokens, started)
+
+    def _metadata_event(self, messages, system_prompt, system_prompt_content, output_tokens: int, started: float) -> dict:
+        """Build the closing usage/latency event of a response."""
+        input_tokens = estimate_request_tokens(messages, system_prompt)
+        usage = {
+            'inputTokens': input_tokens,
+            'outputTokens': output_tokens,
+            'totalTokens': input_tokens + output_tokens,
+        }
+        usage.update(self._cache_usage(system_prompt_content))
+        latency_ms = int((asyncio.get_running_loop().time() - started) * 1000)
+        return {'metadata': {'usage': usage, 'metrics': {'latencyMs': latency_ms}}}
@@ -0,0 +1,190 @@
+"""
+Preflight warm-up for committee models.
+
+The first call to a Bedrock model in a new account triggers a marketplace
+subscription that takes about two minutes to activate. Preflight sends one
+tiny request to every distinct model id concurrently, so activation (and
+connection setup) is paid once and in parallel before the meeting starts,
+and reports readiness and latency per model.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import asyncio
+import threading
+import time
+
+from dbc.models.bedrock_client import create_bedrock_model
+from dbc.models.mock_model import MockModelConfig
+from dbc.models.rate_limit import RateLimitedModel
+from dbc.models.retry import DEFAULT_RETRY_DEADLINE, RetryingModel, RetryPolicy
+
+
+PREFLIGHT_PROMPT = "Reply with OK."
+
+
+@dataclass
+class PreflightResult:
+    """
+    Readiness of one model id.
+
+    Attributes:
+        model_id: Model id that was checked
+        ready: Whether the model answered
+        latency: Seconds to the first streamed event (None if the check had to retry)
+        elapsed: Seconds from the first attempt until the check finished (includes retries)
+        retries: Number of retries (e.g. while a subscription activated)
+        error: Error message if the model is not ready
+    """
+    model_id: str
+    ready: bool
+    latency: Optional[float] = None
+    elapsed: float = 0.0
+    retries: int = 0
+    error: Optional[str] = None
+
+
+def committee_model_ids(members: Dict, include_fallbacks: bool = True) -> List[str]:
+    """
+    Return the distinct model ids used by committee members, in first-use order.
+
+    Args:
+        members: Committee member definitions keyed by agent key
+        include_fallbacks: Whether to include each member's fallback models
+    """
+    model_ids = []
+    for member in members.values():
+        candidates = [member.model_id] + (member.fallback_model_ids if include_fallbacks else [])
+        model_ids.extend(model_id for model_id in candidates if model_id not in model_ids)
+    return model_ids
+
+
+async def check_model(model_id: str, mock_model: MockModelConfig = None, deadline: float = DEFAULT_RETRY_DEADLINE,
+                      rate_limit: bool = True, bedrock_pool: dict = None) -> PreflightResult:
+    """
+    Send one tiny request to a model and time it.
+
+    Args:
+        model_id: Model id to check
+        mock_model: Offline model config to use instead of Bedrock
+        deadline: Seconds to keep retrying (subscription activation takes about two minutes)
+        rate_limit: Whether the request waits for admission from the model's shared limiter
+        bedrock_pool: Connection pool settings; use the meeting's, so warm-up also opens its connections
+
+    Returns:
+        PreflightResult for the model
+    """
+    messages = [{'role': 'user', 'content': [{'text': PREFLIGHT_PROMPT}]}]
+    started = time.monotonic()
+    latency = None
+    model = None
+    try:
+        # Building the client can fail too (e.g. no credentials or region), which makes the model not ready
+        if mock_model is not None:
+            inner = mock_model.create_model('preflight', model_id=model_id)
+        else:
+            inner = create_bedrock_model(model_id, pool_settings=bedrock_pool, max_tokens=1)
+        if rate_limit:
+            inner = RateLimitedModel(inner, model_id)
+        model = RetryingModel(inner, label=model_id, policy=RetryPolicy(deadline=deadline), quiet=True)
+
+        async for event in model.stream(messages):
+            if latency is None:
+                latency = time.monotonic() - started
+    except Exception as error:
+        return PreflightResult(
+            model_id=model_id,
+            ready=False,
+            elapsed=time.monotonic() - started,
+            retries=model.retries if model is not None else 0,
+            error=str(error),
+        )
+
+    return PreflightResult(
+        model_id=model_id,
+        ready=True,
+        # Time spent backing off is not model latency; elapsed covers it instead
+        latency=None if model.retries else latency,
+        elapsed=time.monotonic() - started,
+        retries=model.retries,
+    )
+
+
+async def run_preflight(model_ids: List[str], mock_model: MockModelConfig = None,
+                        deadline: float = DEFAULT_RETRY_DEADLINE, rate_limit: bool = True,
+                        bedrock_pool: dict = None) -> List[PreflightResult]:
+    """
+    Check every model id concurrently.
+
+    Args:
+        model_ids: Model ids to check
+        mock_model: Offline model config to use instead of Bedrock
+        deadline: Seconds each check may keep retrying
+        rate_limit: Whether requests wait for admission from the shared limiters
+        bedrock_pool: Connection pool settings for the shared Bedrock client
+
+    Returns:
+        One PreflightResult per model id, in the given order
+    """
+    return list(await asyncio.gather(*(
+        check_model(model_id, mock_model=mock_model, deadline=deadline, rate_limit=rate_limit, bedrock_pool=bedrock_pool)
+        for model_id in model_ids
+    )))
+
+
+class BackgroundPreflight:
+    """
+    Runs preflight on its own thread and event loop.
+
+    Lets kickoff warm the models while the main thread blocks on input().
+    Retry notices are suppressed so nothing prints over the user's typing.
+    """
+
+    def __init__(self, model_ids: List[str], **preflight_options):
+        """
+        Args:
+            model_ids: Model ids to check
+            **preflight_options: Options passed to run_preflight
+        """
+        self.model_ids = model_ids
+        self.preflight_options = preflight_options
+        self.results: List[PreflightResult] = None
+        self._thread = threading.Thread(target=self._run, name='dbc-preflight', daemon=True)
+
+    def _run(self):
+        try:
+            self.results = asyncio.run(run_preflight(self.model_ids, **self.preflight_options))
+        except Exception as error:
+            # Report the failure per model rather than leaving callers without results
+            self.results = [
+                PreflightResult(model_id=model_id, ready=False, error=f"preflight failed: {error}")
+                for model_id in self.model_ids
+            ]
+
+    def start(self) -> 'BackgroundPreflight':
+        """Start checking models in the background."""
+        self._thread.start()
+        return self
+
+    @property
+    def done(self) -> bool:
+        return not self._thread.is_alive()
+
+    def wait(self, timeout: float = None) -> Optional[List[PreflightResult]]:
+        """Wait for every check to finish and return the results (None on timeout)."""
+        self._thread.join(timeout)
+        if not self.done:
+            return None
+        return self.results if self.results is not None else []
+
+
+def print_preflight_report(results: List[PreflightResult]):
+    """Print readiness and latency for each model."""
+    print("\nCommittee models:")
+    for result in results:
+        if not result.ready:
+            print(f"   {result.model_id}: NOT READY ({result.error})")
+        elif result.latency is None:
+            print(f"   {result.model_id}: ready after {result.elapsed:.1f}s ({result.retries} retries)")
+        else:
+            print(f"   {result.model_id}: ready, {result.latency * 1000:.0f}ms to first token")
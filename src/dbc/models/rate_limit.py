@@ -0,0 +1,213 @@
+"""
+Process-wide admission control for Bedrock models.
+
+Several committee members share a model, and concurrent meetings share the
+same account quota. Each model id gets one ModelRateLimiter for the whole
+process: a pair of token buckets capping requests/min and tokens/min, in
+front of a first-come, first-served queue. Callers wait for admission
+instead of tripping ThrottlingException and retrying in a storm.
+"""
+
+from typing import Dict, Optional
+import asyncio
+import collections
+import threading
+import time
+
+from strands.models.model import Model
+
+from dbc.models.usage import estimate_request_tokens
+from dbc.models.wrapper import ModelWrapper
+
+
+# Per-model quotas. Adjust to your account's Bedrock service quotas
+# ("On-demand model inference requests/tokens per minute").
+MODEL_RATE_LIMITS: Dict[str, dict] = {
+    'global.anthropic.claude-opus-4-5-20251101-v1:0': {'requests_per_minute': 50, 'tokens_per_minute': 400_000},
+    'global.anthropic.claude-sonnet-4-5-20250929-v1:0': {'requests_per_minute': 100, 'tokens_per_minute': 800_000},
+    'global.anthropic.claude-haiku-4-5-20251001-v1:0': {'requests_per_minute': 200, 'tokens_per_minute': 1_000_000},
+}
+
+# Used for model ids without their own entry
+DEFAULT_RATE_LIMIT = {'requests_per_minute': 50, 'tokens_per_minute': 400_000}
+
+
+class _TokenBucket:
+    """Token bucket holding up to one minute of capacity, refilled continuously."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount is available (0 if it is available now)."""
+        # A request larger than the bucket would never fit; let it through once the bucket is full
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+
+def _wake(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+class ModelRateLimiter:
+    """
+    Admission controller for one model id.
+
+    Callers queue in arrival order; only the caller at the head of the queue may
+    take capacity, so a large request is not starved by a stream of small ones.
+    Safe to share between event loops and threads (e.g. concurrent meetings).
+    """
+
+    def __init__(self, model_id: str, requests_per_minute: float, tokens_per_minute: float):
+        """
+        Args:
+            model_id: Model id this limiter admits requests for
+            requests_per_minute: Request quota
+            tokens_per_minute: Token quota (input estimate at admission, corrected with real usage)
+        """
+        self.model_id = model_id
+        self.requests = _TokenBucket(requests_per_minute)
+        self.tokens = _TokenBucket(tokens_per_minute)
+        self._lock = threading.Lock()
+        self._queue = collections.deque()  # (loop, future) per waiting caller, head first
+
+        self.admitted = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers waiting for admission."""
+        return len(self._queue)
+
+    def _wake_head_locked(self):
+        if self._queue:
+            loop, future = self._queue[0]
+            loop.call_soon_threadsafe(_wake, future)
+
+    async def acquire(self, estimated_tokens: int = 0) -> float:
+        """
+        Wait until a request of about estimated_tokens may be sent.
+
+        Args:
+            estimated_tokens: Token estimate for the request
+
+        Returns:
+            Seconds spent waiting for admission
+        """
+        loop = asyncio.get_running_loop()
+        turn = loop.create_future()
+        entry = (loop, turn)
+        enqueued = time.monotonic()
+
+        with self._lock:
+            self._queue.append(entry)
+            if self._queue[0] is entry:
+                turn.set_result(None)
+
+        try:
+            # Wait to reach the head of the queue, then for bucket capacity
+            await turn
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    self.requests.refill(now)
+                    self.tokens.refill(now)
+                    wait = max(self.requests.wait_time(1), self.tokens.wait_time(estimated_tokens))
+                    if wait <= 0:
+                        self.requests.level -= 1
+                        self.tokens.level -= min(estimated_tokens, self.tokens.capacity)
+                        self._queue.popleft()
+                        self._wake_head_locked()
+
+                        waited = now - enqueued
+                        self.admitted += 1
+                        self.total_wait += waited
+                        self.max_wait = max(self.max_wait, waited)
+                        return waited
+                await asyncio.sleep(wait)
+        except BaseException:
+            # Cancelled (e.g. a meeting shutting down): leave the queue and pass the turn on
+            with self._lock:
+                if entry in self._queue:
+                    was_head = self._queue[0] is entry
+                    self._queue.remove(entry)
+                    if was_head:
+                        self._wake_head_locked()
+            raise
+
+    def settle(self, estimated_tokens: int, actual_tokens: int):
+        """Correct the token bucket once the model has reported the request's real usage."""
+        with self._lock:
+            self.tokens.level -= actual_tokens - min(estimated_tokens, self.tokens.capacity)
+
+    def stats(self) -> dict:
+        """Return queue depth and admission wait times."""
+        return {
+            'model_id': self.model_id,
+            'queue_depth': self.queue_depth,
+            'admitted': self.admitted,
+            'wait_total': self.total_wait,
+            'wait_max': self.max_wait,
+            'wait_mean': self.total_wait / self.admitted if self.admitted else 0.0,
+        }
+
+
+_limiters: Dict[str, ModelRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(model_id: str) -> ModelRateLimiter:
+    """Return the process-wide limiter for a model id, creating it on first use."""
+    with _limiters_lock:
+        if model_id not in _limiters:
+            limits = MODEL_RATE_LIMITS.get(model_id, DEFAULT_RATE_LIMIT)
+            _limiters[model_id] = ModelRateLimiter(model_id, **limits)
+        return _limiters[model_id]
+
+
+def rate_limiter_stats(model_id: Optional[str] = None) -> Dict[str, dict]:
+    """Return stats for every limiter created so far (or just one model id)."""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {
+        limiter.model_id: limiter.stats()
+        for limiter in limiters
+        if model_id is None or limiter.model_id == model_id
+    }
+
+
+class RateLimitedModel(ModelWrapper):
+    """Model wrapper that waits for admission from the model id's shared limiter."""
+
+    def __init__(self, model: Model, model_id: str, limiter: ModelRateLimiter = None):
+        """
+        Args:
+            model: Model to wrap
+            model_id: Model id whose quota the calls count against
+            limiter: Limiter to use (defaults to the process-wide limiter for model_id)
+        """
+        super().__init__(model)
+        self.limiter = limiter or get_rate_limiter(model_id)
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        estimated_tokens = estimate_request_tokens(messages, system_prompt)
+        await self.limiter.acquire(estimated_tokens)
+
+        actual_tokens = estimated_tokens
+        async for event in self.model.stream(messages, tool_specs, system_prompt, **kwargs):
+            if 'metadata' in event:
+                actual_tokens = event['metadata'].get('usage', {}).get('totalTokens', actual_tokens)
+            yield event
+
+        self.limiter.settle(estimated_tokens, actual_tokens)
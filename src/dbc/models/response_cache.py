@@ -0,0 +1,230 @@
+"""
+Content-addressed cache for model responses.
+
+Regression runs and repeated prompts send identical requests (model id,
+system prompt, message history, tools) and pay for the same generations
+again. CachedModel keys each request by a stable hash of everything the model
+sees and stores the streamed events on disk. A repeated request replays the
+stored events chunk by chunk, so the agent, the swarm and the stream handler
+behave exactly as they did the first time. The cache is bounded in bytes and
+evicts the least recently used responses first.
+"""
+
+from typing import List, Optional
+import base64
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from strands.models.model import Model
+
+from dbc.models.wrapper import ModelWrapper
+
+
+# Bumped when the key or entry format changes, so stale entries are never replayed
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_USAGE_KEYS = ('inputTokens', 'outputTokens', 'totalTokens', 'cacheReadInputTokens', 'cacheWriteInputTokens')
+
+
+def _encode(value):
+    """JSON default for the few non-JSON values in requests and events (e.g. image or redacted reasoning bytes)."""
+    if isinstance(value, (bytes, bytearray)):
+        return {'__bytes__': base64.b64encode(value).decode('ascii')}
+    return str(value)
+
+
+def _decode(value):
+    """json object_hook reversing _encode."""
+    if len(value) == 1 and '__bytes__' in value:
+        return base64.b64decode(value['__bytes__'])
+    return value
+
+
+def canonical_json(value) -> str:
+    """Serialize a value to stable, compact JSON (sorted keys; bytes base64-encoded)."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), default=_encode)
+
+
+def request_key(model_id: str, messages: List[dict], tool_specs=None, system_prompt=None,
+                tool_choice=None, system_prompt_content=None) -> str:
+    """
+    Return the cache key for a model request: a SHA-256 of its canonical JSON form.
+
+    Args:
+        model_id: Model the request is addressed to
+        messages: Full message history sent to the model
+        tool_specs: Tools offered to the model
+        system_prompt: System prompt text
+        tool_choice: Tool choice sent with the request
+        system_prompt_content: System prompt content blocks (e.g. with cache points)
+    """
+    request = {
+        'version': CACHE_FORMAT_VERSION,
+        'model_id': model_id,
+        'system_prompt': system_prompt,
+        'system_prompt_content': system_prompt_content,
+        'tool_specs': tool_specs,
+        'tool_choice': tool_choice,
+        'messages': messages,
+    }
+    return hashlib.sha256(canonical_json(request).encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """On-disk, size-bounded LRU store of streamed model responses, one file per request key."""
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            directory: Directory holding cached responses (shared safely between processes)
+            max_bytes: Total size the cache is trimmed to after each new response
+        """
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.tokens_saved = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached entry for a key (None on a miss), marking it recently used."""
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as entry_file:
+                entry = json.load(entry_file, object_hook=_decode)
+            # Last use is the file's modification time, which eviction sorts by
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            usage = entry.get('usage') or {}
+            self.tokens_saved += usage.get('totalTokens', 0)
+        return entry
+
+    def put(self, key: str, events: List[dict], model_id: str = None):
+        """Store a complete response, then evict least recently used responses over max_bytes."""
+        usage = {}
+        for event in events:
+            if 'metadata' in event:
+                usage = event['metadata'].get('usage', {})
+        entry = {'version': CACHE_FORMAT_VERSION, 'model_id': model_id, 'usage': usage, 'events': events}
+
+        os.makedirs(self.directory, exist_ok=True)
+        # Write then rename, so a concurrent reader never sees a partial entry
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as entry_file:
+            json.dump(entry, entry_file, default=_encode, separators=(',', ':'))
+        os.replace(temp_path, self._path(key))
+
+        with self._lock:
+            self.stores += 1
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used responses until the cache fits in max_bytes."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue  # Evicted by another process
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            total -= size
+            with self._lock:
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        """Return hit, miss and eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'tokens_saved': self.tokens_saved,
+            }
+
+
+def _answering_model(model: Model) -> Optional[str]:
+    """Model id reported by the first wrapper in the chain that tracks which model answered."""
+    while model is not None:
+        if getattr(model, 'answered_by', None):
+            return model.answered_by
+        model = getattr(model, 'model', None)
+    return None
+
+
+class CachedModel(ModelWrapper):
+    """Model wrapper that replays cached responses for requests it has seen before."""
+
+    def __init__(self, model: Model, model_id: str, cache: ResponseCache):
+        """
+        Args:
+            model: Model to wrap (the full retry/failover chain, so a hit skips all of it)
+            model_id: Model id the requests are addressed to (part of the cache key)
+            cache: Response store, usually shared by every member of a meeting
+        """
+        super().__init__(model)
+        self.model_id = model_id
+        self.cache = cache
+        # Set on a cache hit to the model that originally answered; cleared on a miss
+        self.answered_by = None
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        key = request_key(
+            self.model_id,
+            messages,
+            tool_specs=tool_specs,
+            system_prompt=system_prompt,
+            tool_choice=kwargs.get('tool_choice'),
+            system_prompt_content=kwargs.get('system_prompt_content'),
+        )
+
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.answered_by = entry.get('model_id') or self.model_id
+            for event in entry['events']:
+                if 'metadata' in event:
+                    # A cache hit costs no tokens; report zero usage so meeting stats stay honest
+                    usage = event['metadata'].get('usage', {})
+                    event['metadata']['usage'] = {field: 0 for field in usage if field in _USAGE_KEYS}
+                yield event
+            return
+
+        self.answered_by = None
+        events = []
+        async for event in self.model.stream(messages, tool_specs, system_prompt, **kwargs):
+            events.append(copy.deepcopy(event))
+            yield event
+
+        # Only complete responses reach here; errors and abandoned streams are never cached
+        self.cache.put(key, events, model_id=_answering_model(self.model) or self.model_id)
@@ -0,0 +1,209 @@
+"""
+Non-blocking retry for committee member model calls.
+
+RetryingModel wraps a model (usually BedrockModel) and retries a call that
+fails before producing any output. It waits with asyncio.sleep, so other
+members keep streaming while one member backs off. Delays use full-jitter
+exponential backoff, honor a service's retry-after hint, and stop at a
+deadline tied to SWARM_CONFIG['node_timeout'] (passed in by the meeting).
+"""
+
+from typing import Callable, Optional
+import asyncio
+import logging
+import random
+import time
+
+from botocore.exceptions import ClientError
+from strands.models.model import Model
+from strands.types.exceptions import ModelThrottledException
+
+from dbc.models.wrapper import ModelWrapper
+
+
+logger = logging.getLogger(__name__)
+
+# Bedrock error codes worth retrying (the call may succeed later without any change)
+RETRYABLE_ERROR_CODES = (
+    'ThrottlingException',
+    'ServiceUnavailableException',
+    'ModelNotReadyException',
+    'InternalServerException',
+)
+
+# Headers a service may use to say how long to wait before retrying
+RETRY_AFTER_HEADERS = ('retry-after', 'x-amzn-retry-after')
+
+# Backoff defaults, in seconds. The deadline default matches SWARM_CONFIG['node_timeout'].
+DEFAULT_BASE_DELAY = 2.0
+DEFAULT_MAX_DELAY = 60.0
+DEFAULT_RETRY_DEADLINE = 600.0
+
+
+class RetryDeadlineExceeded(Exception):
+    """A model call kept failing until its retry deadline ran out."""
+
+
+def _client_error(error: Exception) -> Optional[ClientError]:
+    """Return the botocore ClientError behind an error, if any."""
+    while error is not None:
+        if isinstance(error, ClientError):
+            return error
+        error = error.__cause__
+    return None
+
+
+def retry_reason(error: Exception) -> Optional[str]:
+    """
+    Classify an error as retryable.
+
+    Returns:
+        'throttled', 'subscription' (marketplace subscription still activating),
+        'unavailable', or None if the error should not be retried
+    """
+    if isinstance(error, ModelThrottledException):
+        return 'throttled'
+
+    client_error = _client_error(error)
+    if client_error is None:
+        return None
+
+    error_code = client_error.response.get('Error', {}).get('Code')
+    if error_code == 'AccessDeniedException' and 'aws-marketplace' in str(client_error):
+        return 'subscription'
+    if error_code == 'ThrottlingException':
+        return 'throttled'
+    if error_code in RETRYABLE_ERROR_CODES:
+        return 'unavailable'
+    return None
+
+
+def retry_after_hint(error: Exception) -> Optional[float]:
+    """Return the wait (in seconds) the service asked for, if the error carries one."""
+    # Errors raised locally (e.g. an open circuit breaker) carry the hint directly
+    if getattr(error, 'retry_after', None) is not None:
+        return float(error.retry_after)
+
+    client_error = _client_error(error)
+    if client_error is None:
+        return None
+
+    headers = client_error.response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+    for header in RETRY_AFTER_HEADERS:
+        try:
+            return float(headers[header])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+class RetryPolicy:
+    """Full-jitter exponential backoff bounded by a deadline."""
+
+    def __init__(
+        self,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        deadline: float = DEFAULT_RETRY_DEADLINE,
+        rng: random.Random = None
+    ):
+        """
+        Args:
+            base_delay: Backoff cap for the first retry, in seconds
+            max_delay: Largest backoff cap, in seconds
+            deadline: Seconds after the first attempt by which a retry must have started
+            rng: Random source for jitter (seed it for repeatable delays)
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.rng = rng or random.Random()
+
+    def delay(self, attempt: int, error: Exception = None) -> float:
+        """
+        Delay before retry number attempt (0-based).
+
+        Full jitter: a uniform delay between 0 and the exponential cap, so members
+        throttled at the same moment do not all retry at the same moment. A
+        retry-after hint from the service is a lower bound.
+        """
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = self.rng.uniform(0, cap)
+
+        hint = retry_after_hint(error) if error is not None else None
+        if hint is not None:
+            delay = max(delay, hint)
+        return delay
+
+
+class RetryingModel(ModelWrapper):
+    """Model wrapper that retries failed calls without blocking the event loop."""
+
+    def __init__(self, model: Model, label: str = None, policy: RetryPolicy = None, quiet: bool = False,
+                 notify: Callable[[str], None] = None):
+        """
+        Args:
+            model: Model to wrap
+            label: Name used in retry messages (e.g. the member's display name)
+            policy: Backoff and deadline settings
+            quiet: Whether to retry without any notices (e.g. in background warm-up)
+            notify: Called with each retry and throttling notice (e.g. to write it to the
+                    meeting's output sink); defaults to this module's logger
+        """
+        super().__init__(model)
+        self.label = label or 'model'
+        self.policy = policy or RetryPolicy()
+        self.quiet = quiet
+        self.notify = notify or logger.warning
+        self.retries = 0
+
+    def _announce_retry(self, reason: str, error: Exception, delay: float, attempt: int):
+        """Send a retry notice in the same style as CommitteeAgent._invoke_with_retry."""
+        if reason == 'subscription':
+            self.notify(f"Model subscription activating for {self.label} (first-time setup)...")
+        elif reason == 'throttled':
+            self.notify(f"Encountered throttling exception for {self.label}")
+        else:
+            self.notify(f"Model temporarily unavailable for {self.label}: {error}")
+        self.notify(f"Retrying in {delay:.1f} seconds... (attempt {attempt + 1})")
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        """
+        Stream from the wrapped model, retrying failures that happen before any output.
+
+        Once an event has been yielded the call is not retried, since the output
+        has already reached the caller.
+
+        Raises:
+            RetryDeadlineExceeded: If the call is still failing at the retry deadline
+            Exception: Non-retryable errors, and errors raised mid-stream
+        """
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            produced_output = False
+            try:
+                async for event in self.model.stream(messages, tool_specs, system_prompt, **kwargs):
+                    produced_output = True
+                    yield event
+                return
+            except Exception as error:
+                reason = retry_reason(error)
+                if produced_output or reason is None:
+                    raise
+
+                delay = self.policy.delay(attempt, error)
+                if time.monotonic() - started + delay > self.policy.deadline:
+                    if not self.quiet:
+                        self.notify(f"Retries exhausted for {self.label}.")
+                    # Not a throttling exception, so the agent loop does not retry past the deadline
+                    raise RetryDeadlineExceeded(
+                        f"{self.label}: model call still failing after {attempt + 1} attempts ({reason})"
+                    ) from error
+
+                if not self.quiet:
+                    self._announce_retry(reason, error, delay, attempt)
+                self.retries += 1
+                attempt += 1
+                await asyncio.sleep(delay)
@@ -0,0 +1,42 @@
+"""
+Structured output as a forced tool call.
+
+BedrockModel produces structured output by offering the output model as the
+only tool, forcing the model to call it, and building the output from the
+call's input. Doing the same through a model's own stream means a structured
+call takes the same path as any other call: mock latency and injected errors,
+retries, rate limiting, failover, caching, and cassette record and replay.
+"""
+
+from strands.event_loop import streaming
+from strands.tools import convert_pydantic_to_tool_spec
+
+
+async def stream_structured_output(model, output_model, prompt, system_prompt=None, **kwargs):
+    """
+    Get structured output from a model through its stream, the way BedrockModel does.
+
+    Args:
+        model: Model whose stream serves the call
+        output_model: Pydantic model to build the output as
+        prompt: Messages to send
+        system_prompt: System prompt text
+        **kwargs: Passed through to stream
+
+    Yields:
+        The streamed events, then {'output': output_model instance}
+
+    Raises:
+        ValueError: If the response does not call the output_model tool
+    """
+    tool_spec = convert_pydantic_to_tool_spec(output_model)
+    response = model.stream(prompt, [tool_spec], system_prompt, tool_choice={'any': {}}, **kwargs)
+    async for event in streaming.process_stream(response):
+        yield event
+
+    stop_reason, message, _, _ = event['stop']
+    for block in message['content']:
+        if block.get('toolUse', {}).get('name') == tool_spec['name']:
+            yield {'output': output_model(**block['toolUse']['input'])}
+            return
+    raise ValueError(f"No structured output in the response (stop_reason: {stop_reason})")
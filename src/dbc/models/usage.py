@@ -0,0 +1,34 @@
+"""
+Token estimates for model requests.
+
+Used where a token count is needed before the model reports real usage
+(e.g. admission control and the mock model's usage metadata).
+"""
+
+from typing import List
+import json
+import math
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate token count from text (characters / 4)."""
+    return math.ceil(len(text) / 4)
+
+
+def message_text(messages: List[dict]) -> str:
+    """Concatenate the text-like content of a list of messages."""
+    parts = []
+    for message in messages:
+        for block in message.get('content', []):
+            if 'text' in block:
+                parts.append(block['text'])
+            elif 'toolUse' in block:
+                parts.append(json.dumps(block['toolUse'].get('input', {})))
+            elif 'toolResult' in block:
+                parts.extend(str(item.get('text', '')) for item in block['toolResult'].get('content', []))
+    return ''.join(parts)
+
+
+def estimate_request_tokens(messages: List[dict], system_prompt: str = None) -> int:
+    """Estimate the input tokens of a model request."""
+    return estimate_tokens(message_text(messages) + (system_prompt or ''))
@@ -0,0 +1,33 @@
+"""
+Base class for model wrappers.
+
+Each member's model is a chain of wrappers (rate limiting, failover, retries,
+caching, recording) around the real model. ModelWrapper holds the delegation
+they all share, and serves structured output through the wrapper's own
+stream, so a structured call gets the same treatment as any other call.
+"""
+
+from strands.models.model import Model
+
+from dbc.models.structured_output import stream_structured_output
+
+
+class ModelWrapper(Model):
+    """Model that wraps another model; subclasses implement stream."""
+
+    def __init__(self, model: Model):
+        """
+        Args:
+            model: Model to wrap
+        """
+        self.model = model
+
+    def update_config(self, **model_config):
+        self.model.update_config(**model_config)
+
+    def get_config(self):
+        return self.model.get_config()
+
+    def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        # Through this wrapper's stream, never straight to the wrapped model
+        return stream_structured_output(self, output_model, prompt, system_prompt=system_prompt, **kwargs)
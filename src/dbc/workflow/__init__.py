@@ -1 +1,13 @@
-from .committee_meeting_swarm import CommitteeMeetingSwarm
+"""
+Committee meeting workflow.
+
+CommitteeMeetingSwarm is imported on first access, so lightweight modules in
+this package (e.g. swarm_config) can be used without importing Strands.
+"""
+
+
+def __getattr__(name):
+    if name == 'CommitteeMeetingSwarm':
+        from .committee_meeting_swarm import CommitteeMeetingSwarm
+        return CommitteeMeetingSwarm
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
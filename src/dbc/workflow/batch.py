@@ -0,0 +1,248 @@
+"""
+Unattended batch meetings.
+
+Runs many committee meetings concurrently in one process, so they share the
+per-model rate limiters, circuit breakers and pooled Bedrock client, with a
+bound on how many run at once. Nothing waits for a terminal: phases advance
+without pauses, and clarification questions are answered from the batch file
+or skipped. Everything a meeting prints is routed to its own transcript file.
+"""
+
+from contextvars import ContextVar
+from typing import List, Optional, TextIO
+import asyncio
+import json
+import math
+import os
+import re
+import sys
+import time
+
+from dbc.committee import COMMITTEE_MEMBERS
+from dbc.models import MockModelConfig
+from dbc.workflow.clarification_sources import ScriptedAnswerSource
+
+
+# Transcript stream of the meeting running in the current task (None outside a meeting)
+_meeting_output: ContextVar[Optional[TextIO]] = ContextVar('meeting_output', default=None)
+
+
+class MeetingStdout:
+    """
+    Stand-in for sys.stdout that writes to the current meeting's transcript.
+
+    Each meeting runs in its own asyncio task, and the tasks, timers and tool
+    threads it starts inherit its context, so every print() and output sink
+    write lands in the right file. Output from outside a meeting goes to the
+    real stdout.
+    """
+
+    def __init__(self, stream: TextIO):
+        """
+        Args:
+            stream: Stream for output from outside any meeting (the real stdout)
+        """
+        self.stream = stream
+
+    def _target(self) -> TextIO:
+        return _meeting_output.get() or self.stream
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return False
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def _meeting_file_name(meeting_id: str) -> str:
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', meeting_id)
+
+
+def load_batch(path: str) -> List[dict]:
+    """
+    Load meeting requests from a JSON Lines file.
+
+    Each line is an object with a required "prompt", an optional "id" (defaults
+    to the line number) and optional "clarifications": answers keyed by agent key,
+    each a string or a list of answers in the order the member asks, with an
+    optional "default" answer for members without their own. Members without an
+    answer get SWARM_CONFIG['clarification']['default_answer'].
+
+    Raises:
+        ValueError: If a line is not valid JSON or has no prompt
+    """
+    entries = []
+    with open(path, encoding='utf-8') as batch_file:
+        for line_number, line in enumerate(batch_file, start=1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON ({e})")
+            if not isinstance(entry, dict) or not str(entry.get('prompt', '')).strip():
+                raise ValueError(f"{path}:{line_number}: each line needs a \"prompt\"")
+            entry.setdefault('id', f"meeting-{line_number:03d}")
+            entries.append(entry)
+
+    ids = [str(entry['id']) for entry in entries]
+    duplicates = sorted({meeting_id for meeting_id in ids if ids.count(meeting_id) > 1})
+    if duplicates:
+        raise ValueError(f"{path}: duplicate meeting ids {duplicates}")
+    return entries
+
+
+def _percentile(values: List[float], percent: float) -> Optional[float]:
+    """Nearest-rank percentile of the values, or None if there are none."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+
+async def run_batch_meeting(entry: dict, output_dir: str, mock_model: MockModelConfig = None,
+                            questions_per_agent: int = 1, show_stats: bool = False,
+                            **meeting_options) -> dict:
+    """
+    Run one meeting from a batch file, writing its transcript and result to output_dir.
+
+    Args:
+        entry: Batch file entry (id, prompt, optional clarifications)
+        output_dir: Directory for <id>.txt (transcript) and <id>.json (result)
+        mock_model: Offline model config to use instead of Bedrock
+        questions_per_agent: Clarification questions each member may ask when the entry
+            has answers for them (without answers, members are not offered the tool)
+        show_stats: Whether to append orchestration stats to the transcript
+        **meeting_options: Options passed to CommitteeMeetingSwarm.from_members
+
+    Returns:
+        The meeting's result record (also written to <id>.json)
+    """
+    from dbc.workflow import CommitteeMeetingSwarm
+
+    meeting_id = str(entry['id'])
+    file_name = _meeting_file_name(meeting_id)
+    transcript_path = os.path.join(output_dir, f"{file_name}.txt")
+    answers = entry.get('clarifications')
+
+    meeting = CommitteeMeetingSwarm.from_members(
+        COMMITTEE_MEMBERS,
+        mock_model=mock_model,
+        clarification_source=ScriptedAnswerSource(answers) if answers else None,
+        **meeting_options
+    )
+
+    record = {
+        'id': meeting_id,
+        'prompt': entry['prompt'],
+        'status': 'completed',
+        'result': None,
+        'error': None,
+        'latency': None,
+        'transcript': transcript_path,
+    }
+
+    started = time.perf_counter()
+    with open(transcript_path, 'w', encoding='utf-8') as transcript:
+        token = _meeting_output.set(transcript)
+        try:
+            result = await meeting.run_async(
+                entry['prompt'],
+                questions_per_agent=questions_per_agent if answers else 0,
+                show_stats=show_stats,
+                pause_between_phases=False
+            )
+            record['result'] = str(result) if result is not None else None
+        except Exception as e:
+            record['status'] = 'failed'
+            record['error'] = f"{type(e).__name__}: {e}"
+            print(f"\nMeeting encountered an unresolved blocking issue: {e}")
+        finally:
+            meeting.output_sink.flush()
+            _meeting_output.reset(token)
+    record['latency'] = time.perf_counter() - started
+
+    record['clarifications'] = meeting.state.get('clarification_history', [])
+    record['token_usage'] = meeting.state.get('token_usage', {})
+    with open(os.path.join(output_dir, f"{file_name}.json"), 'w', encoding='utf-8') as result_file:
+        json.dump(record, result_file, indent=2, default=str)
+        result_file.write('\n')
+
+    return record
+
+
+async def run_batch(entries: List[dict], output_dir: str, concurrency: int = 4,
+                    **meeting_options) -> dict:
+    """
+    Run every meeting in a batch, at most `concurrency` at a time.
+
+    Args:
+        entries: Batch file entries (see load_batch)
+        output_dir: Directory for per-meeting transcripts and results, and summary.json
+        concurrency: Most meetings in flight at once
+        **meeting_options: Options passed to run_batch_meeting (e.g. mock_model, show_stats)
+
+    Returns:
+        Summary with per-meeting records, wall time, throughput and latency percentiles
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    semaphore = asyncio.Semaphore(concurrency)
+    console = sys.stdout
+
+    async def run_one(entry: dict) -> dict:
+        async with semaphore:
+            record = await run_batch_meeting(entry, output_dir, **meeting_options)
+        console.write(f"[{record['status']}] {record['id']} in {record['latency']:.1f}s\n")
+        console.flush()
+        return record
+
+    started = time.perf_counter()
+    sys.stdout = MeetingStdout(console)
+    try:
+        records = await asyncio.gather(*(run_one(entry) for entry in entries))
+    finally:
+        sys.stdout = console
+    wall_time = time.perf_counter() - started
+
+    latencies = [record['latency'] for record in records if record['status'] == 'completed']
+    summary = {
+        'meetings': len(records),
+        'completed': len(latencies),
+        'failed': len(records) - len(latencies),
+        'concurrency': concurrency,
+        'wall_time': wall_time,
+        'meetings_per_hour': len(latencies) / wall_time * 3600 if wall_time else 0.0,
+        'latency_p50': _percentile(latencies, 50),
+        'latency_p95': _percentile(latencies, 95),
+        'records': [
+            {key: record[key] for key in ('id', 'status', 'latency', 'error', 'transcript')}
+            for record in records
+        ],
+    }
+    with open(os.path.join(output_dir, 'summary.json'), 'w', encoding='utf-8') as summary_file:
+        json.dump(summary, summary_file, indent=2)
+        summary_file.write('\n')
+
+    return summary
+
+
+def print_batch_summary(summary: dict, output_dir: str):
+    """Print throughput and latency for a finished batch."""
+    def seconds(value):
+        return f"{value:.1f}s" if value is not None else "n/a"
+
+    print("\n" + "=" * 80)
+    print(f"BATCH: {summary['completed']}/{summary['meetings']} meetings completed "
+          f"({summary['failed']} failed), concurrency {summary['concurrency']}")
+    print("=" * 80)
+    print(f"\nWall time: {seconds(summary['wall_time'])}")
+    print(f"Throughput: {summary['meetings_per_hour']:.1f} meetings/hour")
+    print(f"Meeting latency: p50 {seconds(summary['latency_p50'])}, p95 {seconds(summary['latency_p95'])}")
+    print(f"Transcripts and results: {output_dir}")
+    print("\n" + "=" * 80 + "\n")
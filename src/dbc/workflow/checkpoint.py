@@ -0,0 +1,205 @@
+"""
+Durable meeting checkpoints.
+
+Each meeting writes an append-only JSON Lines log: one record describing the
+meeting, one record per member turn (the messages the turn added), and one
+record per completed phase holding only the meeting state that changed. A
+meeting that dies mid-way can be rebuilt from the log and resumed at the
+phase after the last completed one, without paying for earlier model calls or
+asking earlier clarification questions again.
+"""
+
+from typing import Dict, List, Optional
+import copy
+import json
+import os
+import secrets
+import time
+
+from dbc.workflow.swarm_config import SWARM_CONFIG
+
+
+def _default_directory() -> str:
+    return os.path.expanduser(SWARM_CONFIG['checkpoint_dir'])
+
+
+def new_meeting_id() -> str:
+    """Return a new meeting id: a sortable timestamp plus a short random suffix."""
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(2)}"
+
+
+class CheckpointError(Exception):
+    """A checkpoint is missing or cannot be resumed."""
+
+
+class MeetingCheckpoint:
+    """Append-only checkpoint log for one meeting."""
+
+    def __init__(self, meeting_id: str, directory: str = None, state_keys: List[str] = None):
+        """
+        Args:
+            meeting_id: Meeting id (also the log's file name)
+            directory: Directory holding checkpoint logs (defaults to SWARM_CONFIG['checkpoint_dir'])
+            state_keys: Meeting state keys to checkpoint (None checkpoints every key).
+                Anything else in the state (e.g. objects Strands adds) is left out.
+        """
+        self.meeting_id = meeting_id
+        self.directory = directory or _default_directory()
+        self.path = os.path.join(self.directory, f"{meeting_id}.jsonl")
+        self.state_keys = state_keys
+        # Last state written, so each phase record holds only what changed
+        self._written: Dict[str, object] = {}
+
+    @classmethod
+    def create(cls, user_prompt: str, options: dict = None, directory: str = None) -> 'MeetingCheckpoint':
+        """
+        Start the checkpoint log for a new meeting.
+
+        Args:
+            user_prompt: The user's request to the committee
+            options: Meeting options needed to resume it (JSON-serializable)
+            directory: Directory holding checkpoint logs
+
+        Returns:
+            The new checkpoint
+        """
+        checkpoint = cls(new_meeting_id(), directory=directory)
+        os.makedirs(checkpoint.directory, exist_ok=True)
+        checkpoint._append({
+            'type': 'meeting',
+            'meeting_id': checkpoint.meeting_id,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'user_prompt': user_prompt,
+            'options': options or {},
+        })
+        return checkpoint
+
+    def _append(self, record: dict):
+        """Append one record and make sure it reached the disk."""
+        with open(self.path, 'a', encoding='utf-8') as log_file:
+            log_file.write(json.dumps(record, default=str) + '\n')
+            log_file.flush()
+            os.fsync(log_file.fileno())
+
+    def append_turn(self, phase_number: int, agent_key: str, agent_name: str, messages: List[dict]):
+        """Record the messages one member turn added to its conversation."""
+        self._append({
+            'type': 'turn',
+            'phase': phase_number,
+            'agent_key': agent_key,
+            'agent_name': agent_name,
+            'messages': messages,
+        })
+
+    def append_resume(self, phase_number: int):
+        """Mark that the meeting resumed at phase_number, discarding turns of the interrupted attempt."""
+        self._append({'type': 'resume', 'phase': phase_number, 'resumed': time.strftime('%Y-%m-%dT%H:%M:%S%z')})
+
+    def append_phase(self, phase_number: int, state: dict):
+        """
+        Record a completed phase with the meeting state that changed since the last phase.
+
+        Lists only ever grow during a meeting, so only their new items are written.
+        """
+        extend = {}
+        updates = {}
+        for key, value in state.items():
+            if self.state_keys is not None and key not in self.state_keys:
+                continue
+
+            written = self._written.get(key)
+            if isinstance(value, list) and isinstance(written, list) and value[:len(written)] == written:
+                if len(value) > len(written):
+                    extend[key] = value[len(written):]
+            elif value != written or key not in self._written:
+                updates[key] = value
+            self._written[key] = copy.deepcopy(value)
+
+        self._append({'type': 'phase', 'phase': phase_number, 'set': updates, 'extend': extend})
+
+    @classmethod
+    def load(cls, meeting_id: str, directory: str = None, state_keys: List[str] = None) -> 'MeetingCheckpoint':
+        """
+        Open an existing checkpoint log to resume it.
+
+        Raises:
+            CheckpointError: If there is no log for the meeting id
+        """
+        checkpoint = cls(meeting_id, directory=directory, state_keys=state_keys)
+        if not os.path.exists(checkpoint.path):
+            raise CheckpointError(f"No checkpoint for meeting '{meeting_id}' in {checkpoint.directory}")
+        return checkpoint
+
+    def read(self) -> dict:
+        """
+        Rebuild the meeting from the log.
+
+        Turns from a phase attempt that never completed are dropped, since that
+        phase is run again on resume.
+
+        Returns:
+            Dictionary with meeting (the meeting record), completed_phase (0 if none),
+            state (meeting state as of the last completed phase) and turns
+            (turn records of completed phases, in order)
+        """
+        meeting = None
+        state = {}
+        completed_phase = 0
+        turns = []
+        pending_turns = []  # Turns of the phase in progress, kept once the phase completes
+
+        with open(self.path, encoding='utf-8') as log_file:
+            lines = log_file.readlines()
+
+        for index, line in enumerate(lines):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A write cut short by a crash can only be the last line
+                if index == len(lines) - 1:
+                    break
+                raise CheckpointError(f"Corrupt checkpoint record on line {index + 1} of {self.path}")
+
+            if record['type'] == 'meeting':
+                meeting = record
+            elif record['type'] == 'turn':
+                pending_turns.append(record)
+            elif record['type'] == 'resume':
+                pending_turns = []
+            elif record['type'] == 'phase':
+                turns.extend(pending_turns)
+                pending_turns = []
+                state.update(record['set'])
+                for key, items in record['extend'].items():
+                    state.setdefault(key, []).extend(items)
+                completed_phase = record['phase']
+
+        if meeting is None:
+            raise CheckpointError(f"Checkpoint {self.path} has no meeting record")
+
+        # Later phases append to this log, so pick up the deltas from where it left off
+        self._written = copy.deepcopy(state)
+
+        return {
+            'meeting': meeting,
+            'completed_phase': completed_phase,
+            'state': state,
+            'turns': turns,
+        }
+
+
+def list_checkpoints(directory: str = None) -> List[str]:
+    """Return the ids of saved meetings, newest first."""
+    directory = directory or _default_directory()
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        (name[:-len('.jsonl')] for name in os.listdir(directory) if name.endswith('.jsonl')),
+        reverse=True
+    )
+
+
+def latest_checkpoint(directory: str = None) -> Optional[str]:
+    """Return the id of the most recent saved meeting, if any."""
+    checkpoints = list_checkpoints(directory)
+    return checkpoints[0] if checkpoints else None
@@ -0,0 +1,179 @@
+"""
+Where answers to members' clarification questions come from.
+
+A member's clarification question is answered asynchronously by an answer
+source, so the event loop keeps running while it waits: concurrent turns keep
+streaming, and so do other meetings in the same process. The clarification
+tool enforces the deadline and falls back to a default answer, so a source
+only has to produce an answer (or None when it has none).
+"""
+
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, Optional, Union
+import asyncio
+import inspect
+import json
+import urllib.request
+
+from dbc.workflow.swarm_config import SWARM_CONFIG
+from dbc.workflow.terminal_input import read_line
+
+
+class AnswerSource(ABC):
+    """Answers members' clarification questions."""
+
+    # Whether answering needs the user at the terminal (such questions are asked one at a time)
+    interactive = False
+
+    @abstractmethod
+    async def answer(self, agent_key: str, agent_name: str, question: str) -> Optional[str]:
+        """
+        Return the answer to a member's question.
+
+        Args:
+            agent_key: Key of the member asking
+            agent_name: Display name of the member asking
+            question: The question
+
+        Returns:
+            The answer, or None if there is none (the member then gets the default answer)
+        """
+
+
+class TerminalAnswerSource(AnswerSource):
+    """Asks the user at the terminal, reading the answer without blocking the event loop."""
+
+    interactive = True
+
+    def __init__(self):
+        # Held by the clarification tool while a question is on screen, so prompts never interleave
+        self.lock = asyncio.Lock()
+
+    async def answer(self, agent_key: str, agent_name: str, question: str) -> Optional[str]:
+        text = await read_line()
+        # readline() returns '' only once stdin is closed
+        return text.strip() if text else None
+
+
+class CallbackAnswerSource(AnswerSource):
+    """Answers with a function of (agent_key, question), plain or async (e.g. a test stub)."""
+
+    def __init__(self, callback: Callable[[str, str], Union[Optional[str], Awaitable[Optional[str]]]]):
+        """
+        Args:
+            callback: Called with (agent_key, question); may return the answer or an awaitable of it
+        """
+        self.callback = callback
+
+    async def answer(self, agent_key: str, agent_name: str, question: str) -> Optional[str]:
+        response = self.callback(agent_key, question)
+        if inspect.isawaitable(response):
+            response = await response
+        return response
+
+
+class ScriptedAnswerSource(AnswerSource):
+    """Answers from prepared answers per member, in the order each member asks."""
+
+    def __init__(self, answers: Dict[str, object]):
+        """
+        Args:
+            answers: Answers keyed by agent key (a string or a list, in order), plus an optional
+                "default" for members without (or out of) their own answers
+        """
+        self.queues = {
+            agent_key: [value] if isinstance(value, str) else list(value)
+            for agent_key, value in answers.items()
+            if agent_key != 'default'
+        }
+        self.default = answers.get('default')
+
+    async def answer(self, agent_key: str, agent_name: str, question: str) -> Optional[str]:
+        queue = self.queues.get(agent_key)
+        if queue:
+            return queue.pop(0)
+        return self.default
+
+
+class FileAnswerSource(ScriptedAnswerSource):
+    """Answers from a JSON file of prepared answers (same shape as ScriptedAnswerSource)."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: JSON file with answers keyed by agent key, plus an optional "default"
+
+        Raises:
+            ValueError: If the file is not a JSON object
+        """
+        with open(path, encoding='utf-8') as answers_file:
+            answers = json.load(answers_file)
+        if not isinstance(answers, dict):
+            raise ValueError(f"{path}: expected a JSON object of answers keyed by agent key")
+        self.path = path
+        super().__init__(answers)
+
+
+class HttpAnswerSource(AnswerSource):
+    """
+    Posts each question to an HTTP callback and answers with its reply.
+
+    The callback receives a JSON object with agent_key, agent_name and question,
+    and replies with {"answer": "..."} (or a plain-text body). An empty reply or
+    {"answer": null} means no answer.
+    """
+
+    def __init__(self, url: str, headers: Dict[str, str] = None, request_timeout: float = None):
+        """
+        Args:
+            url: Callback URL
+            headers: Extra request headers (e.g. authorization)
+            request_timeout: Seconds before the request is abandoned (defaults to
+                SWARM_CONFIG['clarification']['timeout'])
+        """
+        self.url = url
+        self.headers = headers or {}
+        self.request_timeout = request_timeout or SWARM_CONFIG['clarification']['timeout']
+
+    def _post(self, payload: dict) -> Optional[str]:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(payload).encode('utf-8'),
+            headers={'Content-Type': 'application/json', **self.headers},
+            method='POST'
+        )
+        with urllib.request.urlopen(request, timeout=self.request_timeout) as response:
+            body = response.read().decode('utf-8').strip()
+            content_type = response.headers.get('Content-Type', '')
+
+        if not body:
+            return None
+        if 'json' not in content_type:
+            return body
+        reply = json.loads(body)
+        return reply.get('answer') if isinstance(reply, dict) else str(reply)
+
+    async def answer(self, agent_key: str, agent_name: str, question: str) -> Optional[str]:
+        payload = {'agent_key': agent_key, 'agent_name': agent_name, 'question': question}
+        # urllib blocks, so the request runs on a worker thread while the loop carries on
+        return await asyncio.to_thread(self._post, payload)
+
+
+def create_answer_source(answers_file: str = None, answer_url: str = None) -> AnswerSource:
+    """
+    Build the answer source for a meeting.
+
+    Args:
+        answers_file: JSON file of prepared answers (see FileAnswerSource)
+        answer_url: HTTP callback to post questions to (see HttpAnswerSource)
+
+    Returns:
+        The source; the terminal when neither is given
+    """
+    if answers_file and answer_url:
+        raise ValueError("Use either an answers file or an answer URL, not both")
+    if answers_file:
+        return FileAnswerSource(answers_file)
+    if answer_url:
+        return HttpAnswerSource(answer_url)
+    return TerminalAnswerSource()
@@ -3,12 +3,35 @@ Clarification tool factory for committee agents.
 
 This module provides a factory function to create per-agent clarification tools
 that allow agents to request user input during the proposal generation phase.
+The tool is async: while a member waits for an answer, the event loop keeps
+running every other turn and meeting.
 """
 
+from typing import AsyncContextManager, Callable
+import asyncio
+import contextlib
+import time
+
 from strands import tool
 
+from dbc.workflow.clarification_sources import AnswerSource, TerminalAnswerSource
+from dbc.workflow.output_sink import OutputSink
+from dbc.workflow.swarm_config import SWARM_CONFIG
+
+
+def _describe_timeout(timeout: float) -> str:
+    if timeout is None:
+        return "no timeout"
+    if timeout >= 60 and timeout % 60 == 0:
+        return f"{timeout / 60:.0f}min timeout"
+    return f"{timeout:.0f}s timeout"
 
-def create_clarification_tool(agent_key: str, agent_name: str, state: dict, max_questions: int = 1):
+
+def create_clarification_tool(agent_key: str, agent_name: str, state: dict, max_questions: int = 1,
+                              output_sink: OutputSink = None, answer_source: AnswerSource = None,
+                              timeout: float = None, default_answer: str = None,
+                              on_answer: Callable[[str, str], None] = None,
+                              hold_output: Callable[[], AsyncContextManager] = None):
     """Factory function to create a per-agent clarification tool.
     
     Args:
@@ -16,12 +39,54 @@ def create_clarification_tool(agent_key: str, agent_name: str, state: dict, max_
         agent_name: Display name of the agent
         state: Shared state dictionary
         max_questions: Maximum questions allowed per agent
+        output_sink: Meeting output sink the question and answer are written to
+        answer_source: Where answers come from (default: ask at the terminal)
+        timeout: Seconds to wait for an answer (defaults to SWARM_CONFIG['clarification']['timeout'];
+                 None in the config waits indefinitely)
+        default_answer: Answer given when none arrives in time or the source has none
+                        (defaults to SWARM_CONFIG['clarification']['default_answer'])
+        on_answer: Called with (question, response) once the member has its answer (e.g. to record it)
+        hold_output: Returns a context that pauses live streamed output while a question is on screen
+                     (e.g. CommitteeStreamHandler.hold_live_output)
         
     Returns:
         A tool function decorated with @tool
     """
+    answer_source = answer_source or TerminalAnswerSource()
+    timeout = timeout if timeout is not None else SWARM_CONFIG['clarification']['timeout']
+    default_answer = default_answer if default_answer is not None else SWARM_CONFIG['clarification']['default_answer']
+    output_sink = output_sink or OutputSink()
+    hold_output = hold_output or contextlib.nullcontext
+    
+    def write_question(question: str):
+        output_sink.write(
+            f"\n{'=' * 80}\n[**CLARIFICATION REQUESTED BY {agent_name.upper()}**]\n{'=' * 80}\n\n{question}\n\n",
+            flush=True
+        )
+    
+    async def get_answer(answering):
+        """Wait for an answer until the deadline.
+        
+        Args:
+            answering: Awaitable producing the source's answer
+        
+        Returns:
+            Tuple of (response, how it was answered, note to show the user or None)
+        """
+        try:
+            response = await asyncio.wait_for(answering, timeout)
+        except asyncio.TimeoutError:
+            return default_answer, 'timeout', f"[No answer within {timeout:.0f}s; {agent_name} will proceed on assumptions]"
+        except Exception as e:
+            # A source that fails (e.g. an unreachable callback) must not fail the member's turn
+            return default_answer, 'error', f"[Could not get an answer ({type(e).__name__}: {e}); {agent_name} will proceed on assumptions]"
+        
+        if response is None:
+            return default_answer, 'default', None
+        return response, 'answered', None
+    
     @tool
-    def request_user_clarification(question: str) -> str:
+    async def request_user_clarification(question: str) -> str:
         """Request clarification from the user when information is missing, unclear, or ambiguous.
         
         IMPORTANT: If you're unsure about ANY aspect of the request, ASK rather than assume.
@@ -41,6 +106,10 @@ def create_clarification_tool(agent_key: str, agent_name: str, state: dict, max_
         Returns:
             The user's response to your question
         """
+        # Nobody is asked anything while turns run speculatively during a review pause
+        if state.get('clarifications_paused'):
+            return "[System: The user is not available to answer right now. Proceed with your best assumptions and state them.]"
+        
         # Initialize tracking
         if 'agent_questions_asked' not in state:
             state['agent_questions_asked'] = {}
@@ -53,14 +122,36 @@ def create_clarification_tool(agent_key: str, agent_name: str, state: dict, max_
         # Increment counter
         state['agent_questions_asked'][agent_key] = questions_asked + 1
         
-        # Display question
-        print(f"\n{'=' * 80}")
-        print(f"[**CLARIFICATION REQUESTED BY {agent_name.upper()}**]")
-        print(f"{'=' * 80}")
-        print(f"\n{question}\n")
-        print(f"Your response (10min timeout):")
-        user_response = input("> ")
-        print()
+        started = time.monotonic()
+        if answer_source.interactive:
+            shown = False
+            
+            async def answer_at_terminal():
+                nonlocal shown
+                # One question on screen at a time, even when agents run concurrently.
+                # Waiting for the lock counts against the deadline, so a queued question cannot wait longer.
+                async with answer_source.lock:
+                    write_question(question)
+                    output_sink.write(f"Your response ({_describe_timeout(timeout)}):\n", flush=True)
+                    shown = True
+                    return await answer_source.answer(agent_key, agent_name, question)
+            
+            # Every speaker's output waits while the user reads and answers
+            async with hold_output():
+                user_response, answered, note = await get_answer(answer_at_terminal())
+                if not shown:
+                    # Timed out behind another member's question
+                    write_question(question)
+                output_sink.write(f"{note}\n\n" if note else "\n", flush=True)
+        else:
+            # Other sources answer concurrently; the question and answer are shown together
+            user_response, answered, note = await get_answer(answer_source.answer(agent_key, agent_name, question))
+            async with hold_output():
+                write_question(question)
+                output_sink.write((f"{note}\n" if note else "") + f"> {user_response}\n\n", flush=True)
+        
+        if on_answer is not None:
+            on_answer(question, user_response)
         
         # Store in history
         if 'clarification_history' not in state:
@@ -70,7 +161,9 @@ def create_clarification_tool(agent_key: str, agent_name: str, state: dict, max_
             'agent_key': agent_key,
             'agent_name': agent_name,
             'question': question,
-            'response': user_response
+            'response': user_response,
+            'answered': answered,  # 'answered', 'timeout', 'default' or 'error'
+            'waited': time.monotonic() - started,
         })
         
         return user_response
@@ -7,21 +7,52 @@ the prototype, this allows agents to self-organize and hand off to
 each other dynamically.
 """
 
-from typing import Dict
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from typing import Dict, List, Tuple
 import asyncio
-import sys
+import copy
 import time
-from strands.multiagent import Swarm
+from strands.multiagent import Status, Swarm
 from dbc.committee import CommitteeMember
-from dbc.agents import CommitteeAgent
+from dbc.models import (
+    Cassette,
+    MockModelConfig,
+    ResponseCache,
+    bedrock_pool_stats,
+    circuit_breaker_stats,
+    rate_limiter_stats,
+)
+from dbc.models.usage import estimate_tokens
+from dbc.agents import CommitteeAgent, cache_point_block
+from dbc.workflow.checkpoint import MeetingCheckpoint
+from dbc.workflow.clarification_sources import AnswerSource, CallbackAnswerSource, TerminalAnswerSource
 from dbc.workflow.clarification_tool import create_clarification_tool
-from dbc.workflow.swarm_config import AGENT_DESCRIPTIONS, PHASE_CONFIG, SWARM_CONFIG
+from dbc.workflow.conversation import PhaseConversationManager
+from dbc.workflow.output_sink import BufferedOutputSink, OutputSink
+from dbc.workflow.facilitator import FALLBACK_TO_FACILITATOR, FacilitatorRouter
+from dbc.workflow.phase_completion import PhaseCompletionTracker
+from dbc.workflow.phase_gate import PhaseGate, create_phase_gate
+from dbc.workflow.phase_prompts import (
+    CONCURRENT_TURN_PROMPT_TEMPLATES,
+    PHASE_PROMPT_TEMPLATES,
+    SYNTHESIS_PROMPT_TEMPLATES,
+)
+from dbc.workflow.swarm_config import AGENT_DESCRIPTIONS, FACILITATOR_KEY, PHASE_CONFIG, SWARM_CONFIG
+from dbc.workflow.thinking_filter import ThinkingBlockFilter, strip_thinking_blocks
+
+
+# Token usage fields tracked per member (cache fields are only reported by Bedrock when caching is active)
+USAGE_KEYS = ('inputTokens', 'outputTokens', 'cacheReadInputTokens', 'cacheWriteInputTokens')
+
+# Tool the Swarm adds to every member; a handoff made outside a swarm phase goes nowhere
+SWARM_HANDOFF_TOOL = 'handoff_to_agent'
 
 
 class CommitteeStreamHandler:
     """Custom handler for committee meeting swarm events."""
     
-    def __init__(self, agents_dict: Dict[str, CommitteeAgent], show_thinking: bool = False):
+    def __init__(self, agents_dict: Dict[str, CommitteeAgent], show_thinking: bool = False,
+                 output_sink: OutputSink = None):
         self.agents_dict = agents_dict
         # Create a reverse mapping from agent name to key
         self.name_to_key = {
@@ -32,11 +63,110 @@ class CommitteeStreamHandler:
         self.buffer = []
         self.result = None
         self.show_thinking = show_thinking
-        self.in_thinking_block = False
-        self.partial_tag_buffer = ""  # Buffer for partial tags at chunk boundaries
+        # Streaming <thinking> filter; buffers partial tags at chunk boundaries
+        self.thinking_filter = ThinkingBlockFilter()
+        # Coalesces streamed chunks into fewer terminal writes
+        self.output_sink = output_sink or BufferedOutputSink()
+        # Ordered rendering of concurrent speakers (see begin_ordered_rendering)
+        self.render_order = []
+        self.pending_events = {}
+        # Events held while a clarification question is on screen (see hold_live_output)
+        self.holds = 0
+        self.releasing = False
+        self.held_events = []
+        self.speaker_open = False  # current_speaker has started and not yet stopped
+    
+    def begin_ordered_rendering(self, node_ids: List[str]):
+        """
+        Render events from concurrently running speakers one speaker at a time.
         
+        Events for the speaker at the head of node_ids are printed live. Events for
+        every other speaker are buffered per member and printed, in order, once all
+        speakers ahead of them have stopped.
+        
+        Args:
+            node_ids: Agent names in the order their output should appear
+        """
+        self.render_order = list(node_ids)
+        self.pending_events = {node_id: [] for node_id in node_ids}
+    
     async def handle_event(self, event: dict):
         """Process swarm streaming events."""
+        # Nothing is rendered while the user answers a clarification question, or while held events catch up
+        if self.holds or self.releasing:
+            self.held_events.append(event)
+            return
+        
+        await self._dispatch_event(event)
+    
+    @asynccontextmanager
+    async def hold_live_output(self):
+        """
+        Hold every speaker's output, the live speaker's included, while a clarification question is on screen.
+        
+        Held events are rendered in order once the last hold ends, after the
+        interrupted speaker's header is shown again.
+        """
+        self.holds += 1
+        self.output_sink.flush()
+        try:
+            yield
+        finally:
+            self.holds -= 1
+            if not self.holds and not self.releasing:
+                await self._release_held_events()
+    
+    async def _release_held_events(self):
+        """Render events held during clarification prompts, keeping their order."""
+        self.releasing = True
+        try:
+            # The question interrupted the live speaker's section, so name them again
+            if self.speaker_open and self.held_events:
+                self._print_speaker_header(self.current_speaker)
+            # Events arriving meanwhile join the end of the backlog; a new hold stops the catch-up
+            while self.held_events and not self.holds:
+                await self._dispatch_event(self.held_events.pop(0))
+        finally:
+            self.releasing = False
+    
+    async def _dispatch_event(self, event: dict):
+        """Render an event now, or buffer it until its speaker reaches the head of the render order."""
+        node_id = event.get('node_id')
+        
+        # Buffer events from concurrent speakers that are not yet at the head of the order
+        if self.render_order and node_id in self.pending_events and node_id != self.render_order[0]:
+            self.pending_events[node_id].append(event)
+            return
+        
+        await self._render_event(event)
+        
+        if self.render_order and event.get('type') == 'multiagent_node_stop' and node_id == self.render_order[0]:
+            await self._advance_render_order()
+    
+    async def _advance_render_order(self):
+        """Move to the next buffered speaker once the current one has stopped."""
+        while self.render_order:
+            finished = self.render_order.pop(0)
+            del self.pending_events[finished]
+            
+            if not self.render_order:
+                break
+            
+            next_node = self.render_order[0]
+            self._print_handoff([finished], [next_node])
+            
+            # Flush everything the next speaker produced while waiting its turn
+            buffered = self.pending_events[next_node]
+            self.pending_events[next_node] = []
+            for event in buffered:
+                await self._render_event(event)
+            
+            # Keep advancing only if the next speaker has already finished too
+            if not any(event.get('type') == 'multiagent_node_stop' for event in buffered):
+                break
+    
+    async def _render_event(self, event: dict):
+        """Print a single swarm streaming event."""
         event_type = event.get('type')
         
         if event_type == 'multiagent_node_start':
@@ -44,9 +174,9 @@ class CommitteeStreamHandler:
             node_id = event['node_id']
             self._print_speaker_header(node_id)
             self.current_speaker = node_id
+            self.speaker_open = True
             # Reset thinking block state and buffer for new speaker
-            self.in_thinking_block = False
-            self.partial_tag_buffer = ""
+            self.thinking_filter.reset()
             
         elif event_type == 'multiagent_node_stream':
             # Agent generating response - stream arrives incrementally from LLM
@@ -59,9 +189,19 @@ class CommitteeStreamHandler:
                         text = self._filter_thinking_blocks(text)
                     
                     if text:  # Only print if there's text after filtering
-                        sys.stdout.write(text)
-                        sys.stdout.flush()
+                        self.output_sink.write(text)
                 
+        elif event_type == 'multiagent_node_stop':
+            self.speaker_open = False
+            # Speaker finished: release a partial tag the filter was holding (e.g. a trailing "<"),
+            # then push out the rest of their text before anything else prints
+            if not self.show_thinking:
+                held = self.thinking_filter.flush()
+                if held:
+                    self.output_sink.write(held)
+            self.output_sink.flush()
+            self._print_fallback_note(event.get('node_id'), event.get('model_id'))
+            
         elif event_type == 'multiagent_handoff':
             # Agent handing off to another
             from_nodes = event.get('from_node_ids', [])
@@ -71,6 +211,7 @@ class CommitteeStreamHandler:
         elif event_type == 'multiagent_result':
             # Swarm completed
             self.result = event.get('result')
+            self.output_sink.flush()
             # Only print meeting end message if this is the final phase
     
     def _print_speaker_header(self, node_id: str):
@@ -81,102 +222,178 @@ class CommitteeStreamHandler:
         if agent_key in self.agents_dict:
             agent = self.agents_dict[agent_key]
             timestamp = time.strftime('%H:%M:%S')
-            print(f"\n[{timestamp}] {agent.agent.name.upper()} ({agent.member.title}):")
+            self.output_sink.write(f"\n[{timestamp}] {agent.agent.name.upper()} ({agent.member.title}):\n", flush=True)
         else:
-            print(f"\n[Unknown Agent: {node_id}]")
+            self.output_sink.write(f"\n[Unknown Agent: {node_id}]\n", flush=True)
         
         
+    def _print_fallback_note(self, node_id: str, model_id: str = None):
+        """Note in the transcript when a fallback model answered instead of the member's own model."""
+        agent = self.agents_dict.get(self.name_to_key.get(node_id, node_id))
+        if agent is not None and model_id and model_id != agent.member.model_id:
+            self.output_sink.write(f"\n[Answered by fallback model {model_id}]\n", flush=True)
+    
     def _print_handoff(self, from_nodes: list, to_nodes: list):
         """Print handoff notification."""
         if from_nodes and to_nodes:
-            print(f"\n\n[Handoff: {', '.join(from_nodes)} → {', '.join(to_nodes)}]\n")
+            self.output_sink.write(f"\n\n[Handoff: {', '.join(from_nodes)} → {', '.join(to_nodes)}]\n\n", flush=True)
     
     def _filter_thinking_blocks(self, text: str) -> str:
         """
         Filter out <thinking> blocks from streamed text with robust boundary handling.
         
         Handles partial tags split across chunk boundaries by buffering potential
-        partial tags and prepending them to the next chunk.
+        partial tags and prepending them to the next chunk. Tags are matched
+        case-insensitively and may nest (see ThinkingBlockFilter).
         """
-        # Prepend any buffered partial tag from previous chunk
-        text = self.partial_tag_buffer + text
-        self.partial_tag_buffer = ""
-        
-        result = []
-        i = 0
-        
-        while i < len(text):
-            # Check if we're entering a thinking block
-            if not self.in_thinking_block:
-                # Look for <thinking> tag (case-insensitive, need at least 10 chars)
-                if i <= len(text) - 10:
-                    if text[i:i+10].lower() == '<thinking>':
-                        self.in_thinking_block = True
-                        i += 10
-                        continue
-                # Buffer potential partial opening tag at end of chunk
-                elif i > len(text) - 10:
-                    remaining = text[i:]
-                    # Check if remaining text could be start of '<thinking>'
-                    opening_tag = '<thinking>'
-                    for tag_len in range(1, len(opening_tag)):
-                        if remaining.lower() == opening_tag[:tag_len].lower():
-                            self.partial_tag_buffer = remaining
-                            return ''.join(result)
-            
-            # Check if we're exiting a thinking block
-            if self.in_thinking_block:
-                # Look for </thinking> tag (case-insensitive, need at least 11 chars)
-                if i <= len(text) - 11:
-                    if text[i:i+11].lower() == '</thinking>':
-                        self.in_thinking_block = False
-                        i += 11
-                        # Skip any trailing whitespace/newlines after closing tag
-                        while i < len(text) and text[i] in ('\n', ' ', '\r', '\t'):
-                            i += 1
-                        continue
-                # Buffer potential partial closing tag at end of chunk
-                elif i > len(text) - 11:
-                    remaining = text[i:]
-                    # Check if remaining text could be start of '</thinking>'
-                    closing_tag = '</thinking>'
-                    for tag_len in range(1, len(closing_tag)):
-                        if remaining.lower() == closing_tag[:tag_len].lower():
-                            self.partial_tag_buffer = remaining
-                            return ''.join(result)
-                
-                # If we're in a thinking block, skip this character
-                i += 1
-                continue
-            
-            # If not in thinking block, keep the character
-            result.append(text[i])
-            i += 1
-        
-        return ''.join(result)
+        return self.thinking_filter.feed(text)
+
+
+class DeferredStreamHandler:
+    """Buffers a turn's events until a real stream handler is attached, then forwards them live."""
+    
+    def __init__(self):
+        self.events = []
+        self.target = None
+    
+    async def handle_event(self, event: dict):
+        if self.target is None:
+            self.events.append(event)
+        else:
+            await self.target.handle_event(event)
+    
+    async def attach(self, target: 'CommitteeStreamHandler'):
+        """Replay everything buffered so far to target, then forward new events as they arrive."""
+        # Events arriving while the buffer is replayed join the end of it, so order is kept
+        while self.events:
+            await target.handle_event(self.events.pop(0))
+        self.target = target
+    
+    @property
+    def text(self) -> str:
+        """Text streamed so far (for estimating the cost of discarded turns)."""
+        return ''.join(
+            event['event'].get('data', '') for event in self.events
+            if event.get('type') == 'multiagent_node_stream' and isinstance(event.get('event'), dict)
+        )
+
+
+class SpeculativeTurns:
+    """The first turns of the next phase, started while the user reviews the last one."""
+    
+    def __init__(self, phase_number: int, context: str, participants: List[str]):
+        """
+        Args:
+            phase_number: Phase the turns belong to
+            context: Phase prompt the turns were built from; they are discarded if it changes
+            participants: Agent keys taking a turn
+        """
+        self.phase_number = phase_number
+        self.context = context
+        self.participants = participants
+        self.started = time.perf_counter()
+        self.handlers = {agent_key: DeferredStreamHandler() for agent_key in participants}
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.finished: Dict[str, float] = {}  # {agent_key: perf_counter when the turn ended}
 
 
 class CommitteeMeetingSwarm:
     """Swarm-based committee meeting orchestration."""
     
-    def __init__(self, agents: Dict[str, CommitteeAgent]):
+    # Renders swarm events to the terminal; subclasses may swap in an instrumented handler
+    stream_handler_class = CommitteeStreamHandler
+    
+    def __init__(
+        self,
+        agents: Dict[str, CommitteeAgent],
+        facilitator_router: bool = SWARM_CONFIG['facilitator_router'],
+        prompt_cache: bool = SWARM_CONFIG['prompt_cache'],
+        conversation_manager: PhaseConversationManager = None,
+        checkpoint: MeetingCheckpoint = None,
+        response_cache: ResponseCache = None,
+        cassette: Cassette = None,
+        clarification_source: AnswerSource = None,
+        clarification_timeout: float = None,
+        phase_gate: PhaseGate = None,
+        speculative: bool = SWARM_CONFIG['speculative_phases'],
+        output_sink: OutputSink = None
+    ):
         self.agents = agents
         self.swarm = None
         self.state = {}
+        self.facilitator_router = facilitator_router
+        self.prompt_cache = prompt_cache
+        # Decides what history each member carries between phases (None keeps the swarm default)
+        self.conversation_manager = conversation_manager
+        # Shared by every phase's stream handler, the clarification prompts and the members' model notices
+        self.output_sink = output_sink or BufferedOutputSink()
+        # Reverse mapping from swarm node id (agent name) to agent key
+        self.name_to_key = {agent.agent.name: key for key, agent in agents.items()}
+        # Shared Bedrock client counters when the meeting started, to report this meeting's share
+        self.bedrock_pool_start = None
+        # Append-only log of turns and completed phases, so a failed meeting can be resumed (None disables)
+        self.checkpoint = checkpoint
+        # Response cache shared by every member, for hit/miss stats (None when caching is off)
+        self.response_cache = response_cache
+        # Cassette the members record into or replay from (None for a live meeting)
+        self.cassette = cassette
+        # Where clarification answers come from (None asks at the terminal)
+        self.clarification_source = clarification_source
+        # Seconds a member waits for an answer (None uses SWARM_CONFIG['clarification']['timeout'])
+        self.clarification_timeout = clarification_timeout
+        # Decides when the meeting moves on between phases (None builds one from SWARM_CONFIG['phase_gate'])
+        self.phase_gate = phase_gate
+        # Start the next concurrent phase's turns while the user reviews the last one
+        self.speculative = speculative
+        self._speculation = None  # SpeculativeTurns kept for the next phase, if any
+        # Handler rendering the current phase, so clarification prompts can pause its live output
+        self.stream_handler = None
         
     @classmethod
-    def from_members(cls, members: Dict[str, CommitteeMember]):
-        """Create swarm meeting from committee member definitions."""
+    def from_members(cls, members: Dict[str, CommitteeMember], prompt_cache: bool = SWARM_CONFIG['prompt_cache'],
+                     mock_model: MockModelConfig = None, rate_limit: bool = SWARM_CONFIG['rate_limit'],
+                     failover: bool = SWARM_CONFIG['failover'],
+                     response_cache: bool = SWARM_CONFIG['response_cache'], cassette: Cassette = None,
+                     **kwargs):
+        """Create swarm meeting from committee member definitions.
+        
+        Args:
+            members: Committee member definitions keyed by agent key
+            prompt_cache: Whether to mark stable prompt prefixes as Bedrock cache points
+            mock_model: Offline model config to use instead of Bedrock (e.g. for benchmarks)
+            rate_limit: Whether to admit model calls through the shared per-model rate limiters
+            failover: Whether members fail over to their fallback models behind circuit breakers
+            response_cache: Whether to replay responses to repeated model requests from the on-disk cache
+            cassette: Cassette to record every model call into, or to replay recorded calls from
+            **kwargs: Meeting options passed to the constructor (e.g. facilitator_router, checkpoint)
+        """
+        cache = ResponseCache(**SWARM_CONFIG['response_cache_store']) if response_cache else None
+        # Members report failovers and retries into the meeting's output, in order with what is streaming
+        output_sink = kwargs.setdefault('output_sink', BufferedOutputSink())
+        
+        def notify(notice: str):
+            output_sink.write(f"{notice}\n", flush=True)
+        
         # Create agents with descriptions and streaming enabled
         agents = {
             key: CommitteeAgent.from_member(
                 member, 
                 description=AGENT_DESCRIPTIONS[key],
-                enable_streaming=True
+                enable_streaming=True,
+                prompt_cache=prompt_cache,
+                mock_model=mock_model,
+                retry_deadline=SWARM_CONFIG['node_timeout'],
+                rate_limit=rate_limit,
+                failover=failover,
+                circuit_breaker=SWARM_CONFIG['circuit_breaker'],
+                bedrock_pool=SWARM_CONFIG['bedrock_pool'],
+                response_cache=cache,
+                cassette=cassette,
+                notify=notify
             )
             for key, member in members.items()
         }
-        return cls(agents)
+        return cls(agents, prompt_cache=prompt_cache, response_cache=cache, cassette=cassette, **kwargs)
     
     def _initialize_swarm(self):
         """Initialize the swarm with all agents (called once)."""
@@ -209,6 +426,12 @@ class CommitteeMeetingSwarm:
             'agent_questions_asked': {},      # {agent_key: count}
             'clarification_history': [],      # [{agent_key, agent_name, question, response}]
             'max_questions_per_agent': 1,     # Configurable limit
+            'phase_stats': [],                # [{phase, turns, tokens, closed_early, handoffs_saved, tokens_saved}]
+            'token_usage': {},                # {agent_key: {inputTokens, outputTokens, cacheRead..., cacheWrite...}}
+            'turn_models': [],                # [{phase, agent_key, model_id}] model that answered each turn
+            'gate_stats': [],                 # [{phase, advanced_by, waited}] how each phase gate was passed
+            'speculation_stats': [],          # [{phase, turns, adopted, latency_hidden, tokens_wasted}]
+            'clarifications_paused': False,   # Set while speculative turns run, so nobody prompts during review
         }
     
     def _build_clarification_context(self) -> str:
@@ -239,230 +462,216 @@ class CommitteeMeetingSwarm:
         
         print("\n" + "=" * 80 + "\n")
     
+    def _build_phase_prompt_parts(self, phase_number: int, templates: dict = PHASE_PROMPT_TEMPLATES) -> Tuple[str, str]:
+        """Build the prompt for a specific phase as (static prefix, per-meeting suffix).
+        
+        Args:
+            phase_number: Phase to build the prompt for
+            templates: Templates to build from (SYNTHESIS_PROMPT_TEMPLATES for a synthesizer turn)
+        """
+        template = templates.get(phase_number)
+        if template is None:
+            return "Continue the committee discussion.", ""
+        
+        return template.render(self.state, self._build_clarification_context())
+    
     def _build_phase_prompt(self, phase_number: int) -> str:
         """Build the prompt for a specific phase."""
+        static_prefix, meeting_context = self._build_phase_prompt_parts(phase_number)
+        return static_prefix + meeting_context
+    
+    def _compose_prompt(self, *cached_sections: str, suffix: str = ""):
+        """Combine cacheable prompt sections with an uncached per-turn suffix.
+        
+        With prompt caching enabled every cached section is followed by a Bedrock
+        cache point, so requests sharing those sections are billed as cache reads.
+        Sections must be ordered from most to least stable.
+        
+        Returns:
+            A prompt string, or a list of content blocks when prompt caching is enabled
+        """
+        if not self.prompt_cache:
+            return "".join(cached_sections) + suffix
+        
+        blocks = []
+        for section in cached_sections:
+            if not section:
+                continue
+            blocks.append({'text': section})
+            blocks.append(cache_point_block())
+        if suffix:
+            blocks.append({'text': suffix})
+        return blocks
+    
+    def _build_phase_task(self, phase_number: int):
+        """Build the swarm task for a phase: static prefix first, then the carried-forward context."""
+        return self._compose_prompt(*self._build_phase_prompt_parts(phase_number))
+    
+    def _build_concurrent_turn_prompt(self, phase_number: int, agent_key: str):
+        """Build the prompt for a member invoked concurrently in a fan-out or parallel phase."""
         phase_config = PHASE_CONFIG[phase_number]
+        agent_name = self.agents[agent_key].agent.name
         
-        if phase_number == 1:
-            # Phase 1: Proposal Generation
-            return f"""COMMITTEE MEETING - Phase 1: {phase_config['name']}
-
-REQUEST:
-{self.state['user_prompt']}
-
-PHASE CONTEXT:
-- Objective: {phase_config['objective']}
-- Tension Level: {phase_config['tension_level']}
-
---- ROLE-SPECIFIC INSTRUCTIONS ---
-
-IF YOU ARE SAM POWERPOINT (FACILITATOR):
-- Your role is to FACILITATE proposal generation, not create it yourself.
-
-DO NOT create the proposal yourself. Your role is to coordinate specialists and synthesize their input.
-
-IF YOU ARE A SPECIALIST (Nina Edgecase, Casey Friday, Fontaine Kerning, or Max Token):
-- Provide your domain expertise on the request above. Focus on your area of specialization.
-- Hand off to specialists to gather their proposals
-- Keep your input focused and concise. You're contributing to a proposal that will be reviewed by the full committee.
-
---- SHARED GUIDELINES ---
-
-Remember: You're in a committee meeting. Other members will review and debate this proposal.
-
-REQUIRED ACTIONS:
-1. Briefly acknowledge the request (1-2 sentences)
-2. Hand off to specialists to gather their proposals:
-   - Nina Edgecase for technical architecture and implementation approach
-   - Casey Friday for product/MVP scope and timeline
-   - Fontaine Kerning for design/UX perspective
-   - Max Token for AI/automation opportunities and considerations
-3. After gathering specialist input, synthesize their proposals into a unified initial proposal
-
-CRITICAL - Clarification Questions:
-You have access to the request_user_clarification tool. DO NOT make assumptions
-when information is unclear or ambiguous - ASK THE USER instead.
-
-Guidelines for using clarification questions:
-- If ANY aspect of the request is unclear, vague, or could be interpreted multiple ways - ASK
-- If you're unsure about scope, scale, constraints, or success criteria - ASK
-- If you find yourself making assumptions about what the user wants - STOP and ASK
-- If multiple valid approaches exist and you need direction - ASK
-- Make your questions clear, specific, and focused on eliminating ambiguity
-
-Each committee member has a limited number of questions, so prioritize the most
-important clarifications. However, it's better to ask and be certain than to
-assume and build the wrong thing.
-
-Remember: Assumptions lead to rework. Questions lead to clarity."""
+        # Members get their own instructions: the phase's tell the facilitator to hand off to each of them
+        prompt_parts = self._build_phase_prompt_parts(phase_number, CONCURRENT_TURN_PROMPT_TEMPLATES)
         
-        elif phase_number == 2:
-            # Phase 2: Initial Review
-            clarification_context = self._build_clarification_context()
-            return f"""COMMITTEE MEETING - Phase 2: {phase_config['name']}
-
-PHASE CONTEXT:
-- Objective: {phase_config['objective']}
-- Tension Level: {phase_config['tension_level']}
-
-PROPOSAL UNDER DISCUSSION:
-{self.state.get('proposal', 'No proposal recorded yet')}
-{clarification_context}
-
---- ROLE-SPECIFIC INSTRUCTIONS ---
-
-IF YOU ARE THE FACILITATOR (Sam Powerpoint or Morgan Calendar):
-Guide the committee through initial feedback. Hand off to committee members to gather their perspectives.
-
-DO NOT provide feedback yourself. Your role is to coordinate discussion and synthesize input from the committee.
+        if phase_config.get('execution_mode') == 'fan_out':
+            return self._compose_prompt(*prompt_parts, suffix=f"""
 
-IF YOU ARE A COMMITTEE MEMBER (Nina, Casey, Pat, Fontaine, or Max):
-- Provide your initial feedback on the proposal above.
-- Hand off to specialists to gather their proposals
-- Keep your response brief - around one paragraph. Focus on key concerns and feedback.
+--- SPECIALIST REQUEST ---
 
---- SHARED GUIDELINES ---
-
-CLARIFICATION QUESTIONS:
-If you need additional information from the user to provide meaningful feedback, use the request_user_clarification tool. You have a limited number of questions available.
-
-IMPORTANT: Keep responses brief - around one paragraph per committee member. Focus on key concerns and feedback."""
+You are {agent_name}. Provide your proposal contribution for your area of specialization now.""")
         
-        elif phase_number == 3:
-            # Phase 3: Cross-Committee Deliberation
-            clarification_context = self._build_clarification_context()
-            return f"""COMMITTEE MEETING - Phase 3: {phase_config['name']}
-
-PHASE CONTEXT:
-- Objective: {phase_config['objective']}
-- Tension Level: {phase_config['tension_level']}
-
-PROPOSAL UNDER DISCUSSION:
-{self.state.get('proposal', 'No proposal recorded yet')}
-
-STAKEHOLDER CLARIFICATION:
-{self.state.get('user_input', 'No user input provided')}
-{clarification_context}
-
---- ROLE-SPECIFIC INSTRUCTIONS ---
-
-IF YOU ARE THE FACILITATOR (Morgan Calendar or Sam Powerpoint):
-- You MUST hand off to committee members to start the discussion.
-- DO NOT provide your own analysis or close the phase.
-
-IF YOU ARE A COMMITTEE MEMBER (Nina, Casey, Pat, Fontaine, or Max):
-Engage in cross-committee discussion. React to specific points from your colleagues:
-- Build on or challenge ideas from other members
-- Raise concerns about approaches suggested by others
-- Propose alternatives or refinements
-- Identify tensions between different perspectives (technical vs. timeline, security vs. UX, etc.)
-- Keep your response brief - around one paragraph. React to specific points from colleagues, not just general commentary.
-
---- SHARED GUIDELINES ---
+        return self._compose_prompt(*prompt_parts, suffix=f"""
 
-REQUIRED ACTIONS:
-1. Hand off to at least 3 committee members (Nina, Casey, Pat, Fontaine, or Max)
-2. Ensure each member has a chance to react to specific points from colleagues
-3. Hand off to Sam to generate a summary of the discussion
-4. Only after gathering multiple perspectives should you consider the phase complete
+--- POSITION REQUEST ---
 
-CLARIFICATION QUESTIONS:
-If you need additional information from the user to support your arguments or address concerns, use the request_user_clarification tool. You have a limited number of questions available."""
+You are {agent_name}. State your final position on the proposal now.""")
+    
+    def _build_synthesis_prompt(self, phase_number: int, contributions: List[dict]):
+        """Build the synthesizer prompt from the collected concurrent contributions."""
+        phase_config = PHASE_CONFIG[phase_number]
         
-        elif phase_number == 4:
-            # Phase 4: Final Positions
-            clarification_context = self._build_clarification_context()
-            return f"""COMMITTEE MEETING - Phase 4: {phase_config['name']}
-
-PHASE CONTEXT:
-- Objective: {phase_config['objective']}
-- Tension Level: {phase_config['tension_level']}
-
-This is the final round of discussion before the committee delivers their go-forward plan.
-
-PROPOSAL UNDER DISCUSSION:
-{self.state.get('proposal', 'No proposal recorded yet')}
-
-STAKEHOLDER CLARIFICATION:
-{self.state.get('user_input', 'No user input provided')}
-{clarification_context}
-
---- ROLE-SPECIFIC INSTRUCTIONS ---
-
-IF YOU ARE THE FACILITATOR (Morgan Calendar):
-DO NOT provide your own summary or analysis. Your ONLY role is to hand off to each committee member.
-
-DO NOT skip any committee member. DO NOT provide your own commentary. Your role is ONLY to facilitate handoffs.
-
-IF YOU ARE A COMMITTEE MEMBER (Nina, Casey, Pat, Fontaine, or Max):
-State your final position on the proposal. This is your last chance to influence the decision:
-- Clearly state whether you support, oppose, or conditionally support the proposal
-- Highlight your most critical concerns or requirements
-- Specify any non-negotiable constraints from your domain
-- Be concise but definitive
-- Keep your response brief - around one paragraph. State your final position clearly and concisely.
-
-IF YOU ARE SAM POWERPOINT:
-After all committee members have stated their positions, acknowledge that you've heard all perspectives and prepare to move to the final decision phase. DO NOT make the decision yet - that happens in Phase 5.
-
---- SHARED GUIDELINES ---
-
-YOU MUST COMPLETE THESE HANDOFFS:
-1. Hand off to Nina Edgecase for technical concerns and architectural position
-2. Hand off to Casey Friday for product perspective and timeline stance
-3. Hand off to Pat Attacksurface for security and compliance position
-4. Hand off to Fontaine Kerning for design and user experience stance
-5. Hand off to Max Token for AI/automation considerations
-6. After ALL five positions are heard, hand off to Sam Powerpoint to prepare for the final decision phase
-
-CLARIFICATION QUESTIONS:
-If you need critical information from the user to finalize your position, use the request_user_clarification tool. You have a limited number of questions available."""
+        committee_input = ""
+        for contribution in contributions:
+            agent = self.agents[contribution['agent_key']]
+            committee_input += f"\n{agent.agent.name} ({agent.member.title}):\n"
+            committee_input += f"{contribution['text'] or 'No input provided'}\n"
         
-        elif phase_number == 5:
-            # Phase 5: Decision
-            clarification_context = self._build_clarification_context()
-            return f"""COMMITTEE MEETING - Phase 5: {phase_config['name']}
-
-PHASE CONTEXT:
-- Objective: {phase_config['objective']}
-- Tension Level: {phase_config['tension_level']}
-
-The committee must now create a consensus-driven recommendation and go-forward plan.
-
-ORIGINAL PROPOSAL:
-{self.state.get('proposal', 'No proposal recorded yet')}
-
-STAKEHOLDER CLARIFICATION:
-{self.state.get('user_input', 'No user input provided')}
-{clarification_context}
-
---- ROLE-SPECIFIC INSTRUCTIONS ---
-
-IF YOU ARE SAM POWERPOINT:
-Your role is to create the final synthesis and recommendation:
-1. Generate the final unified proposal with all committee feedback integrated
-2. Review the key tensions, agreements, and positions from the discussion
-3. Synthesize these into a clear, actionable go-forward plan
-4. If you need facilitation support, hand off to Morgan Calendar
-5. Create a comprehensive recommendation that addresses the stakeholder's needs
-
-Structure your recommendation clearly with:
-- Executive summary of the decision
-- Key changes from the original proposal
-- How major concerns were addressed
-- Clear next steps and deliverables
+        # The synthesizer gets its own instructions: the phase's tell it to coordinate and hand off
+        prompt_parts = self._build_phase_prompt_parts(phase_number, SYNTHESIS_PROMPT_TEMPLATES)
+        
+        if phase_config.get('execution_mode') == 'fan_out':
+            return self._compose_prompt(*prompt_parts, suffix=f"""
 
-IF YOU ARE MORGAN CALENDAR:
-Hand off to Sam Powerpoint to create the synthesis and final recommendation. Your facilitation role is complete.
+--- SPECIALIST PROPOSALS ---
+{committee_input}
+--- SYNTHESIS REQUEST ---
 
---- SHARED GUIDELINES ---
+All specialist input has been gathered above. Synthesize their proposals into a unified
+initial proposal now.""")
+        
+        return self._compose_prompt(*prompt_parts, suffix=f"""
 
-CLARIFICATION QUESTIONS:
-If you need final clarification from the user to complete the recommendation, use the request_user_clarification tool. You have a limited number of questions available.
+--- COMMITTEE POSITIONS ---
+{committee_input}
+--- WRAP-UP REQUEST ---
 
-IMPORTANT: This is the final deliverable - make it comprehensive, clear, and actionable."""
+Every committee member has stated their final position above. Wrap up the phase now.""")
+    
+    def _record_usage(self, agent_key: str, usage: dict):
+        """Accumulate a turn's token usage (including prompt-cache reads/writes) per member."""
+        totals = self.state['token_usage'].setdefault(agent_key, {key: 0 for key in USAGE_KEYS})
+        for key in USAGE_KEYS:
+            totals[key] += (usage or {}).get(key, 0)
+    
+    def _record_answering_model(self, agent_key: str, model_id: str = None) -> str:
+        """Record which model answered a member's turn in the current phase, and return its id."""
+        model_id = model_id or self.agents[agent_key].answered_by
+        self.state['turn_models'].append({'phase': self.state['phase'], 'agent_key': agent_key, 'model_id': model_id})
+        return model_id
+    
+    def _print_meeting_stats(self):
+        """Print orchestration stats collected during the meeting."""
+        print("\n" + "=" * 80)
+        print("MEETING STATS")
+        print("=" * 80)
+        
+        for stats in self.state.get('phase_stats', []):
+            phase_name = PHASE_CONFIG[stats['phase']]['name']
+            print(f"\nPhase {stats['phase']} ({phase_name}): {stats['turns']} turns, {stats['tokens']} tokens")
+            if stats['closed_early']:
+                print(f"   Closed early: {stats['handoffs_saved']} pending handoff cancelled, ~{stats['tokens_saved']} tokens saved")
+        
+        if self.state.get('token_usage'):
+            print("\nToken usage by member:")
+            for agent_key, usage in self.state['token_usage'].items():
+                print(
+                    f"   {self.agents[agent_key].agent.name}: "
+                    f"{usage['inputTokens']} in / {usage['outputTokens']} out, "
+                    f"cache read {usage['cacheReadInputTokens']} / cache write {usage['cacheWriteInputTokens']}"
+                )
+        
+        model_ids = {agent.member.model_id for agent in self.agents.values()}
+        limiter_stats = [stats for model_id, stats in rate_limiter_stats().items() if model_id in model_ids]
+        if limiter_stats:
+            print("\nRate limiter admission (per model):")
+            for stats in limiter_stats:
+                print(
+                    f"   {stats['model_id']}: {stats['admitted']} admitted, queue depth {stats['queue_depth']}, "
+                    f"wait mean {stats['wait_mean']:.2f}s / max {stats['wait_max']:.2f}s"
+                )
+        
+        fallback_turns = [
+            turn for turn in self.state.get('turn_models', [])
+            if turn['model_id'] != self.agents[turn['agent_key']].member.model_id
+        ]
+        model_ids |= {model_id for agent in self.agents.values() for model_id in agent.member.fallback_model_ids}
+        tripped = [
+            stats for model_id, stats in circuit_breaker_stats().items()
+            if model_id in model_ids and (stats['trips'] or stats['slo_breaches'])
+        ]
+        if fallback_turns or tripped:
+            print(f"\nModel failover: {len(fallback_turns)} turns answered by fallback models")
+            for stats in tripped:
+                print(
+                    f"   {stats['model_id']}: breaker {stats['state']}, {stats['trips']} trips, "
+                    f"{stats['slo_breaches']} latency SLO breaches"
+                )
+        
+        pool_stats = bedrock_pool_stats(since=self.bedrock_pool_start)
+        if pool_stats['clients_created'] or pool_stats['clients_reused']:
+            models_served = pool_stats['clients_created'] + pool_stats['clients_reused']
+            print(
+                f"\nBedrock client pool: {models_served} models on {pool_stats['clients_created']} new client(s) "
+                f"(~{pool_stats['setup_time_saved']:.2f}s of client setup and credential resolution saved); "
+                f"{pool_stats['requests']} requests over {pool_stats['connections']} new connections "
+                f"(~{max(pool_stats['requests'] - pool_stats['connections'], 0)} TLS handshakes saved)"
+            )
+        
+        if self.state.get('gate_stats'):
+            gate_stats = self.state['gate_stats']
+            advanced_by = {}
+            for gate in gate_stats:
+                advanced_by[gate['advanced_by']] = advanced_by.get(gate['advanced_by'], 0) + 1
+            print(
+                f"\nPhase gates: {sum(gate['waited'] for gate in gate_stats):.1f}s waiting between phases ("
+                + ", ".join(f"{count} by {how}" for how, count in advanced_by.items()) + ")"
+            )
+        
+        if self.state.get('clarification_history'):
+            clarifications = self.state['clarification_history']
+            unanswered = [entry for entry in clarifications if entry.get('answered', 'answered') != 'answered']
+            print(
+                f"\nClarifications: {len(clarifications)} asked, "
+                f"{sum(entry.get('waited', 0.0) for entry in clarifications):.1f}s waiting for answers, "
+                f"{len(unanswered)} given the default answer"
+            )
+        
+        if self.state.get('speculation_stats'):
+            speculation_stats = self.state['speculation_stats']
+            adopted = [stats for stats in speculation_stats if stats['adopted']]
+            print(
+                f"\nSpeculative phases: {len(adopted)}/{len(speculation_stats)} adopted, "
+                f"~{sum(stats['latency_hidden'] for stats in adopted):.1f}s of turn latency hidden behind review pauses, "
+                f"~{sum(stats['tokens_wasted'] for stats in speculation_stats)} tokens wasted on discarded turns"
+            )
+        
+        if self.response_cache is not None:
+            cache_stats = self.response_cache.stats()
+            print(
+                f"\nResponse cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                f"({cache_stats['hit_rate']:.0%} hit rate, ~{cache_stats['tokens_saved']} tokens saved), "
+                f"{cache_stats['stores']} responses stored, {cache_stats['evictions']} evicted"
+            )
+        
+        sink_stats = self.output_sink.stats()
+        print(
+            f"\nStreamed output: {sink_stats['chunks']} chunks in {sink_stats['writes']} writes "
+            f"(~{sink_stats['writes_saved']} writes and ~{sink_stats['flushes_saved']} flushes saved)"
+        )
         
-        return "Continue the committee discussion."
+        print("\n" + "=" * 80 + "\n")
     
     def _print_phase_separator(self, phase_number: int):
         """Print a visual separator for phase transitions."""
@@ -479,6 +688,9 @@ IMPORTANT: This is the final deliverable - make it comprehensive, clear, and act
         """
         agents_with_clarification = ['sam_powerpoint', 'nina_edgecase', 'casey_friday', 'fontaine_kerning', 'pat_attacksurface', 'max_token']
         
+        # One source for every member, so terminal prompts are never on screen at the same time
+        answer_source = self._clarification_answer_source()
+        
         for agent_key in agents_with_clarification:
             if agent_key in self.agents:
                 agent = self.agents[agent_key]
@@ -488,14 +700,37 @@ IMPORTANT: This is the final deliverable - make it comprehensive, clear, and act
                     agent_key=agent_key,
                     agent_name=agent.agent.name,
                     state=self.state,
-                    max_questions=self.state['max_questions_per_agent']
+                    max_questions=self.state['max_questions_per_agent'],
+                    output_sink=self.output_sink,
+                    answer_source=answer_source,
+                    timeout=self.clarification_timeout,
+                    on_answer=self._clarification_recorder(agent_key),
+                    hold_output=self._hold_live_output
                 )
                 
                 # Register tool with the agent's tool registry
                 agent.agent.tool_registry.register_tool(clarification_tool)
     
-    async def _run_phase_swarm(self, phase_number: int, show_thinking: bool = False):
-        """Run a single phase of the swarm."""
+    def _clarification_answer_source(self) -> AnswerSource:
+        """Return where the members' clarification answers come from."""
+        if self.cassette is not None and self.cassette.mode == 'replay':
+            return CallbackAnswerSource(self.cassette.next_clarification)
+        return self.clarification_source or TerminalAnswerSource()
+    
+    def _hold_live_output(self):
+        """Context pausing the current phase's live output while a clarification question is on screen."""
+        if self.stream_handler is None:
+            return nullcontext()
+        return self.stream_handler.hold_live_output()
+    
+    def _clarification_recorder(self, agent_key: str):
+        """Return the callback recording a member's clarification answers into the cassette, if recording."""
+        if self.cassette is None or self.cassette.mode != 'record':
+            return None
+        return lambda question, response: self.cassette.record_clarification(agent_key, question, response)
+    
+    def _begin_phase(self, phase_number: int):
+        """Update meeting state and print the separator for a new phase."""
         phase_config = PHASE_CONFIG[phase_number]
         
         # Update state
@@ -505,78 +740,590 @@ IMPORTANT: This is the final deliverable - make it comprehensive, clear, and act
         
         # Print phase separator
         self._print_phase_separator(phase_number)
+    
+    async def _run_phase(self, phase_number: int, show_thinking: bool = False):
+        """Run a single phase using the execution mode configured in PHASE_CONFIG."""
+        execution_mode = PHASE_CONFIG[phase_number].get('execution_mode', 'swarm')
         
-        # Add clarification tools once before first phase (tools persist across all phases)
-        if phase_number == 1 and self.state['max_questions_per_agent'] > 0:
-            self._add_clarification_tools_to_agents()
+        if execution_mode in ('fan_out', 'parallel'):
+            result = await self._run_phase_concurrent(phase_number, show_thinking=show_thinking)
+        else:
+            result = await self._run_phase_swarm(phase_number, show_thinking=show_thinking)
+        
+        self.output_sink.flush()
+        
+        # Compact every member's history before the next phase starts
+        if phase_number + 1 in PHASE_CONFIG:
+            self._compact_conversations(phase_number + 1)
+        
+        return result
+    
+    def _record_turn(self, agent_key: str):
+        """Hand the messages a member added during its last turn to the conversation manager and checkpoint."""
+        if self.conversation_manager is None and self.checkpoint is None:
+            return
+        
+        agent = self.agents[agent_key]
+        # Every turn starts from the manager's history (or an empty one), so anything after it is new
+        history = self.conversation_manager.history(agent_key) if self.conversation_manager else []
+        turn_messages = agent.agent.messages[len(history):]
+        
+        if self.conversation_manager is not None:
+            self.conversation_manager.record_turn(agent_key, agent.agent.name, self.state['phase'], turn_messages)
+        if self.checkpoint is not None:
+            self.checkpoint.append_turn(self.state['phase'], agent_key, agent.agent.name, turn_messages)
+    
+    def _compact_conversations(self, next_phase: int):
+        """Replace each member's raw history with its compacted history for the next phase."""
+        if self.conversation_manager is None:
+            return
+        
+        token_limit = PHASE_CONFIG[next_phase].get('context_token_limit', SWARM_CONFIG['context_token_limit'])
+        
+        for agent_key in self.agents:
+            self.conversation_manager.compact(agent_key, next_phase, token_limit)
+            self._seed_history(agent_key, self.conversation_manager.history(agent_key))
+    
+    def _seed_history(self, agent_key: str, history: List[dict]):
+        """Set the history a member starts its turns with, for both swarm and direct turns."""
+        agent = self.agents[agent_key]
+        agent.agent.messages = copy.deepcopy(history)
+        
+        # Swarm resets every node to this snapshot before each of its turns
+        if self.swarm is not None:
+            self.swarm.nodes[agent.agent.name]._initial_messages = copy.deepcopy(history)
+    
+    async def _run_phase_swarm(self, phase_number: int, show_thinking: bool = False):
+        """Run a single phase of the swarm."""
+        phase_config = PHASE_CONFIG[phase_number]
+        self._begin_phase(phase_number)
+        
+        # Pick speakers in code when possible; the LLM facilitator is only a fallback
+        router = None
+        if self.facilitator_router:
+            router = FacilitatorRouter(phase_number, list(self.agents.keys()))
+        
+        # Close the phase as soon as everyone expected has spoken and the synthesizer is done
+        tracker = PhaseCompletionTracker(
+            phase_number,
+            list(self.agents.keys()),
+            skip_facilitator=router is not None
+        )
         
         # Update swarm configuration for this phase
         entry_point_key = phase_config.get('entry_point', 'sam_powerpoint')
+        if router:
+            entry_point_key = router.first_speaker()
         self.swarm.entry_point = self.agents[entry_point_key].agent
         self.swarm.max_handoffs = phase_config.get('max_handoffs', SWARM_CONFIG['max_handoffs'])
         
         # Build phase prompt
-        phase_prompt = self._build_phase_prompt(phase_number)
+        phase_prompt = self._build_phase_task(phase_number)
         
         # Stream the swarm execution (mark if this is the final phase)
-        handler = CommitteeStreamHandler(self.agents, show_thinking=show_thinking)
+        handler = self.stream_handler_class(self.agents, show_thinking=show_thinking, output_sink=self.output_sink)
+        self.stream_handler = handler
         
         async for event in self.swarm.stream_async(
             phase_prompt,
             invocation_state=self.state
         ):
+            # Node stop arrives before the swarm applies the pending handoff, so it can be changed here
+            if event.get('type') == 'multiagent_node_stop':
+                self._handle_node_stop(event, tracker, router)
             await handler.handle_event(event)
         
+        self.state['phase_stats'].append(tracker.summary())
+        
         return handler.result
     
-    async def run_async(self, user_prompt: str, show_thinking: bool = False, questions_per_agent: int = 1):
-        """Run the swarm-based committee meeting asynchronously."""
+    def _handle_node_stop(self, event: dict, tracker: PhaseCompletionTracker, router: FacilitatorRouter = None):
+        """Record a finished turn, then close the phase or pick the next speaker."""
+        node_result = event.get('node_result')
+        if getattr(node_result, 'status', None) != Status.COMPLETED:
+            return
+        
+        last_speaker = self.name_to_key.get(event['node_id'], event['node_id'])
+        requested_node = self.swarm.state.handoff_node
+        requested = self.name_to_key.get(requested_node.node_id) if requested_node else None
+        
+        tracker.record_turn(last_speaker, node_result)
+        self._record_usage(last_speaker, node_result.accumulated_usage)
+        event['model_id'] = self._record_answering_model(last_speaker)
+        self._record_turn(last_speaker)
+        
+        if tracker.is_complete:
+            # Cancel further handoffs: clearing the pending handoff lets the swarm finish
+            tracker.close(requested)
+            self.swarm.state.handoff_node = None
+        elif router:
+            self._route_next_speaker(router, last_speaker, requested)
+    
+    def _route_next_speaker(self, router: FacilitatorRouter, last_speaker: str, requested: str = None):
+        """Override the swarm's pending handoff with the facilitator router's decision."""
+        next_speaker = router.next_speaker(last_speaker, requested)
+        if next_speaker == FALLBACK_TO_FACILITATOR:
+            next_speaker = router.facilitator_key
+        
+        if next_speaker is None:
+            # Phase is complete: clearing the handoff lets the swarm finish
+            self.swarm.state.handoff_node = None
+            return
+        
+        if next_speaker != requested:
+            facilitator_name = self.agents[router.facilitator_key].agent.name
+            self.swarm.state.handoff_node = self.swarm.nodes[self.agents[next_speaker].agent.name]
+            self.swarm.state.handoff_message = f"{facilitator_name} is handing the floor to you for your input on this phase."
+    
+    def _get_concurrent_participants(self, phase_number: int) -> List[str]:
+        """Return the agent keys invoked concurrently in a fan-out or parallel phase."""
+        phase_config = PHASE_CONFIG[phase_number]
+        
+        if phase_config.get('execution_mode') == 'fan_out':
+            participants = phase_config['required_handoffs']
+        else:
+            # Parallel rounds skip the facilitator and the synthesizer, who wraps up afterwards
+            participants = [
+                key for key in phase_config['expected_participants']
+                if key not in (FACILITATOR_KEY, phase_config.get('synthesizer'))
+            ]
+        
+        return [key for key in participants if key in self.agents]
+    
+    async def _stream_agent_turn(self, agent_key: str, prompt, handler: 'CommitteeStreamHandler') -> dict:
+        """Invoke one agent directly, forwarding its stream to the handler, and record the turn.
+        
+        Returns:
+            Dictionary with the agent key, streamed chunks, filtered text and AgentResult
+        """
+        turn = await self._invoke_agent_turn(agent_key, prompt, handler)
+        self._record_agent_turn(turn)
+        return turn
+    
+    async def _invoke_agent_turn(self, agent_key: str, prompt, handler) -> dict:
+        """Invoke one agent directly, forwarding its stream to the handler as swarm events.
+        
+        Nothing is recorded, so a speculative turn can still be thrown away.
+        
+        Returns:
+            Dictionary with the agent key, streamed chunks, filtered text, AgentResult and answering model
+        """
+        agent = self.agents[agent_key]
+        node_id = agent.agent.name
+        chunks = []
+        result = None
+        
+        # Start from the carried-over history, as the swarm does for every node turn. This also keeps
+        # cache points from earlier turns from piling up past Bedrock's per-request limit.
+        history = self.conversation_manager.history(agent_key) if self.conversation_manager else []
+        agent.agent.messages = history
+        
+        await handler.handle_event({'type': 'multiagent_node_start', 'node_id': node_id, 'node_type': 'agent'})
+        
+        with self._without_handoff_tool(agent_key):
+            async for event in agent.stream_async(prompt, invocation_state=self.state):
+                if 'result' in event:
+                    result = event['result']
+                    continue
+                if event.get('data'):
+                    chunks.append(event['data'])
+                await handler.handle_event({'type': 'multiagent_node_stream', 'node_id': node_id, 'event': event})
+        
+        model_id = agent.answered_by
+        await handler.handle_event({
+            'type': 'multiagent_node_stop',
+            'node_id': node_id,
+            'node_result': result,
+            'model_id': model_id,
+        })
+        
+        return {
+            'agent_key': agent_key,
+            'chunks': chunks,
+            'text': strip_thinking_blocks(''.join(chunks)).strip(),
+            'result': result,
+            'model_id': model_id,
+        }
+    
+    @contextmanager
+    def _without_handoff_tool(self, agent_key: str):
+        """Hide the Swarm's handoff tool from a member during a direct turn, so it is never offered."""
+        registry = self.agents[agent_key].agent.tool_registry.registry
+        handoff_tool = registry.pop(SWARM_HANDOFF_TOOL, None)
+        try:
+            yield
+        finally:
+            if handoff_tool is not None:
+                registry[SWARM_HANDOFF_TOOL] = handoff_tool
+    
+    def _record_agent_turn(self, turn: dict):
+        """Record a finished direct turn: answering model, token usage and the messages it added."""
+        agent_key = turn['agent_key']
+        self._record_answering_model(agent_key, turn['model_id'])
+        if turn['result'] is not None and turn['result'].metrics:
+            self._record_usage(agent_key, turn['result'].metrics.accumulated_usage)
+        self._record_turn(agent_key)
+    
+    def _can_speculate(self, phase_number: int) -> bool:
+        """Whether the first turns of phase_number can start during the review pause before it."""
+        if not self.speculative or phase_number not in PHASE_CONFIG:
+            return False
+        # A recorded cassette must hold exactly the calls a replay (which never pauses) will make
+        if self.cassette is not None:
+            return False
+        # Swarm phases build each node's input inside Strands, so only direct concurrent turns are started early
+        return PHASE_CONFIG[phase_number].get('execution_mode') in ('fan_out', 'parallel')
+    
+    @contextmanager
+    def _as_of_phase(self, phase_number: int):
+        """Temporarily give the meeting state the values _begin_phase sets, to build a later phase's prompts."""
+        phase_config = PHASE_CONFIG[phase_number]
+        current = {key: self.state[key] for key in ('phase', 'phase_name', 'tension_level')}
+        self.state.update({
+            'phase': phase_number,
+            'phase_name': phase_config['name'],
+            'tension_level': phase_config['tension_level'],
+        })
+        try:
+            yield
+        finally:
+            self.state.update(current)
+    
+    def _start_speculation(self, phase_number: int) -> SpeculativeTurns:
+        """Start the participants' turns of a concurrent phase in the background, buffering their output."""
+        # Build the prompts as they will look once the phase begins
+        with self._as_of_phase(phase_number):
+            participants = self._get_concurrent_participants(phase_number)
+            speculation = SpeculativeTurns(phase_number, self._build_phase_prompt(phase_number), participants)
+            prompts = {key: self._build_concurrent_turn_prompt(phase_number, key) for key in participants}
+        
+        self.state['clarifications_paused'] = True
+        
+        async def speculate(agent_key: str) -> dict:
+            try:
+                return await self._invoke_agent_turn(agent_key, prompts[agent_key], speculation.handlers[agent_key])
+            finally:
+                speculation.finished[agent_key] = time.perf_counter()
+        
+        speculation.tasks = {key: asyncio.create_task(speculate(key)) for key in participants}
+        return speculation
+    
+    async def _discard_speculation(self, speculation: SpeculativeTurns, reason: str = None):
+        """Cancel speculative turns whose context no longer holds, counting the tokens they used."""
+        tasks = list(speculation.tasks.values())
+        for task in tasks:
+            task.cancel()
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        self.state['clarifications_paused'] = False
+        
+        tokens_wasted = 0
+        for agent_key, outcome in zip(speculation.tasks, outcomes):
+            if isinstance(outcome, dict) and outcome['result'] is not None and outcome['result'].metrics:
+                usage = outcome['result'].metrics.accumulated_usage
+                # Discarded turns were still paid for
+                self._record_usage(agent_key, usage)
+                tokens_wasted += usage.get('totalTokens', 0)
+            else:
+                # Cancelled mid-stream: usage is never reported, so estimate what was generated
+                tokens_wasted += estimate_tokens(speculation.handlers[agent_key].text)
+        
+        self.state['speculation_stats'].append({
+            'phase': speculation.phase_number,
+            'turns': len(tasks),
+            'adopted': False,
+            'latency_hidden': 0.0,
+            'tokens_wasted': tokens_wasted,
+        })
+        if reason:
+            print(f"\n[Discarded {len(tasks)} turns started early for Phase {speculation.phase_number}: {reason}]")
+    
+    def _take_speculation(self, phase_number: int) -> SpeculativeTurns:
+        """Return speculative turns for the phase that just began, if they are still valid."""
+        speculation, self._speculation = self._speculation, None
+        if speculation is None or speculation.phase_number != phase_number:
+            return None
+        
+        adopted_at = time.perf_counter()
+        # How far the turns got during the pause is time the user no longer waits for
+        latency_hidden = (
+            max(speculation.finished.values(), default=adopted_at)
+            if len(speculation.finished) == len(speculation.tasks) else adopted_at
+        ) - speculation.started
+        self.state['speculation_stats'].append({
+            'phase': phase_number,
+            'turns': len(speculation.tasks),
+            'adopted': True,
+            'latency_hidden': latency_hidden,
+            'tokens_wasted': 0,
+        })
+        return speculation
+    
+    async def _run_phase_concurrent(self, phase_number: int, show_thinking: bool = False):
+        """Run a phase by invoking its participants concurrently.
+        
+        Every participant is invoked at the same time. Their streams are buffered per
+        member and rendered in the configured order, so the transcript reads like a
+        sequence of handoffs. The synthesizer takes a single turn once every
+        participant has finished.
+        """
+        phase_config = PHASE_CONFIG[phase_number]
+        self._begin_phase(phase_number)
+        
+        participants = self._get_concurrent_participants(phase_number)
+        synthesizer_key = phase_config.get('synthesizer', phase_config.get('entry_point', 'sam_powerpoint'))
+        # Concurrent phases end with the synthesizer's turn; the tracker only collects their stats
+        tracker = PhaseCompletionTracker(phase_number, list(self.agents.keys()))
+        
+        handler = self.stream_handler_class(self.agents, show_thinking=show_thinking, output_sink=self.output_sink)
+        self.stream_handler = handler
+        handler.begin_ordered_rendering([self.agents[key].agent.name for key in participants])
+        
+        speculation = self._take_speculation(phase_number)
+        if speculation is not None:
+            # Turns started during the review pause: show what they streamed so far, then follow them live
+            for key in participants:
+                await speculation.handlers[key].attach(handler)
+            tasks = [speculation.tasks[key] for key in participants]
+        else:
+            tasks = [
+                asyncio.create_task(self._stream_agent_turn(
+                    key,
+                    self._build_concurrent_turn_prompt(phase_number, key),
+                    handler
+                ))
+                for key in participants
+            ]
+        
+        try:
+            # gather preserves the configured order of contributions
+            contributions = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            self.state['clarifications_paused'] = False
+        
+        if speculation is not None:
+            # Speculative turns are recorded only once adopted
+            for contribution in contributions:
+                self._record_agent_turn(contribution)
+        
+        # Synthesizer wraps up only after every participant is in
+        if participants:
+            await handler.handle_event({
+                'type': 'multiagent_handoff',
+                'from_node_ids': [self.agents[participants[-1]].agent.name],
+                'to_node_ids': [self.agents[synthesizer_key].agent.name],
+            })
+        
+        synthesis = await self._stream_agent_turn(
+            synthesizer_key,
+            self._build_synthesis_prompt(phase_number, contributions),
+            handler
+        )
+        
+        for turn in [*contributions, synthesis]:
+            tracker.record_turn(turn['agent_key'], getattr(turn['result'], 'metrics', None))
+        self.state['phase_stats'].append(tracker.summary())
+        
+        return synthesis['result']
+    
+    async def _pause(self, phase_number: int, message: str, enabled: bool = True):
+        """Wait at the phase gate after a phase, without blocking the event loop."""
+        if not enabled:
+            return
+        
+        if self.phase_gate is None:
+            self.phase_gate = create_phase_gate()
+        gate_result = await self.phase_gate.wait(message)
+        
+        # A note typed at the gate reaches the committee as stakeholder input in later phases
+        if gate_result.text:
+            notes = [self.state['user_input'], gate_result.text] if self.state['user_input'] else [gate_result.text]
+            self.state['user_input'] = "\n".join(notes)
+        
+        self.state['gate_stats'].append({
+            'phase': phase_number,
+            'advanced_by': gate_result.advanced_by,
+            'waited': gate_result.waited,
+        })
+    
+    async def _run_phases(self, start_phase: int = 1, show_thinking: bool = False, pause_between_phases: bool = True):
+        """Run the meeting from start_phase through the final phase, checkpointing each completed phase.
+        
+        Returns:
+            Result of the final phase
+        """
+        pause_messages = {
+            1: "\nPlease review the initial proposal above.\nPress Enter to bring the committee into the discussion.",
+            2: "\nPlease review the committee discussion above.\nPress Enter to continue deliberation.",
+            3: "\nPlease review the committee discussion above.\nPress Enter to continue deliberation.",
+            4: "\nPlease review the committee's final positions above.\nPress Enter to review the committee decision and go-forward plan.",
+        }
+        
+        # Add clarification tools once before the first phase (tools persist across all phases)
+        if self.state['max_questions_per_agent'] > 0:
+            self._add_clarification_tools_to_agents()
+        
+        result = None
+        try:
+            for phase_number in sorted(PHASE_CONFIG):
+                if phase_number < start_phase:
+                    continue
+                
+                result = await self._run_phase(phase_number, show_thinking=show_thinking)
+                
+                if phase_number == 1:
+                    # Store proposal if available
+                    if result:
+                        self.state['proposal'] = str(result)
+                    
+                    # Display clarification summary
+                    self._print_clarification_summary()
+                
+                self.state['phase_history'].append({
+                    'phase': phase_number,
+                    'name': PHASE_CONFIG[phase_number]['name'],
+                    'result': str(result) if result is not None else None,
+                })
+                if self.checkpoint is not None:
+                    self.checkpoint.append_phase(phase_number, self.state)
+                
+                if phase_number in pause_messages:
+                    next_phase = phase_number + 1
+                    if pause_between_phases and self._can_speculate(next_phase):
+                        self._speculation = self._start_speculation(next_phase)
+                    
+                    await self._pause(phase_number, pause_messages[phase_number], pause_between_phases)
+                    
+                    if self._speculation is not None:
+                        # A note typed at the gate changes the next phase's context, so its early turns are stale
+                        with self._as_of_phase(next_phase):
+                            changed = self._build_phase_prompt(next_phase) != self._speculation.context
+                        if changed:
+                            speculation, self._speculation = self._speculation, None
+                            await self._discard_speculation(speculation, "your note changed the phase context")
+        finally:
+            # Stop turns started early for a phase the meeting never reached
+            if self._speculation is not None:
+                for task in self._speculation.tasks.values():
+                    task.cancel()
+                self._speculation = None
+                self.state['clarifications_paused'] = False
+        
+        return result
+    
+    def _finish_meeting(self, show_stats: bool = False):
+        """Print the end of the meeting and, optionally, its stats."""
+        print("\n\n[**Meeting has ended.**]")
+        
+        if show_stats:
+            self._print_meeting_stats()
+    
+    async def run_async(self, user_prompt: str, show_thinking: bool = False, questions_per_agent: int = 1,
+                        show_stats: bool = False, pause_between_phases: bool = True):
+        """Run the swarm-based committee meeting asynchronously.
+        
+        Args:
+            user_prompt: The user's request to the committee
+            show_thinking: Whether to display agent thinking blocks
+            questions_per_agent: Number of clarification questions each agent can ask
+            show_stats: Whether to print orchestration stats after the meeting
+            pause_between_phases: Whether to stop at the phase gate between phases (disable for unattended runs)
+        """
         self._initialize_state(user_prompt)
         self.state['max_questions_per_agent'] = questions_per_agent
+        self.bedrock_pool_start = bedrock_pool_stats()
+        
+        if self.checkpoint is not None:
+            # Only the meeting's own state is checkpointed, not what Strands adds during a phase
+            self.checkpoint.state_keys = list(self.state)
         
         # Initialize swarm once for all phases
         self._initialize_swarm()
         
-        # Phase 1: Proposal Generation
-        phase1_result = await self._run_phase_swarm(1, show_thinking=show_thinking)
+        final_result = await self._run_phases(
+            show_thinking=show_thinking,
+            pause_between_phases=pause_between_phases
+        )
         
-        # Store proposal if available
-        if phase1_result:
-            self.state['proposal'] = str(phase1_result)
+        self._finish_meeting(show_stats)
         
-        # Display clarification summary
-        self._print_clarification_summary()
+        return final_result
+    
+    async def resume_async(self, show_thinking: bool = False, show_stats: bool = False,
+                           pause_between_phases: bool = True):
+        """Resume a checkpointed meeting from the phase after the last completed one.
         
-        input("\nPlease review the initial proposal above.\nPress Enter to bring the committee into the discussion.")
+        Completed phases are not run again: the meeting state is restored from the
+        checkpoint and every member's carried-over history is rebuilt from the
+        recorded turns, as if the meeting had never stopped.
         
-        # Phase 2: Initial Review
-        phase2_result = await self._run_phase_swarm(2, show_thinking=show_thinking)
+        Args:
+            show_thinking: Whether to display agent thinking blocks
+            show_stats: Whether to print orchestration stats after the meeting
+            pause_between_phases: Whether to stop at the phase gate between phases (disable for unattended runs)
         
-        input("\nPlease review the committee discussion above.\nPress Enter to continue deliberation.")
+        Returns:
+            Result of the final phase, or the last recorded result if the meeting had already ended
+        """
+        saved = self.checkpoint.read()
+        completed_phase = saved['completed_phase']
         
-        # Phase 3: Cross-Committee Deliberation
-        phase3_result = await self._run_phase_swarm(3, show_thinking=show_thinking)
+        self._initialize_state(saved['meeting']['user_prompt'])
+        self.checkpoint.state_keys = list(self.state)
+        self.state.update(saved['state'])
+        self.bedrock_pool_start = bedrock_pool_stats()
         
-        input("\nPlease review the committee discussion above.\nPress Enter to continue deliberation.")
-
-        # Phase 4: Final Positions
-        phase5_result = await self._run_phase_swarm(4, show_thinking=show_thinking)
+        self._initialize_swarm()
         
-        input("\nPlease review the committee's final positions above.\nPress Enter to review the committee decision and go-forward plan.")
+        if completed_phase >= max(PHASE_CONFIG):
+            print(f"\nMeeting {self.checkpoint.meeting_id} already ended; nothing to resume.")
+            phase_history = self.state['phase_history']
+            return phase_history[-1]['result'] if phase_history else None
         
-        # Phase 5: Decision
-        final_result = await self._run_phase_swarm(5, show_thinking=show_thinking)
-
-        print("\n\n[**Meeting has ended.**]")
+        next_phase = completed_phase + 1
+        self.checkpoint.append_resume(next_phase)
+        
+        # Replay completed turns so every member carries the history it had when the meeting stopped
+        if self.conversation_manager is not None and completed_phase > 0:
+            for turn in saved['turns']:
+                self.conversation_manager.record_turn(turn['agent_key'], turn['agent_name'], turn['phase'], turn['messages'])
+            
+            token_limit = PHASE_CONFIG[next_phase].get('context_token_limit', SWARM_CONFIG['context_token_limit'])
+            for agent_key in self.agents:
+                self.conversation_manager.compact(agent_key, next_phase, token_limit)
+                self._seed_history(agent_key, self.conversation_manager.history(agent_key))
+        
+        print(f"\nResuming meeting {self.checkpoint.meeting_id} from Phase {next_phase}: "
+              f"{PHASE_CONFIG[next_phase]['name']} ({completed_phase} completed phase(s) restored)")
+        
+        final_result = await self._run_phases(
+            start_phase=next_phase,
+            show_thinking=show_thinking,
+            pause_between_phases=pause_between_phases
+        )
+        
+        self._finish_meeting(show_stats)
         
         return final_result
     
-    def run(self, user_prompt: str, show_thinking: bool = False, questions_per_agent: int = 2):
+    def run(self, user_prompt: str, show_thinking: bool = False, questions_per_agent: int = 2,
+            show_stats: bool = False, pause_between_phases: bool = True):
         """Run the swarm-based committee meeting (synchronous wrapper).
         
         Args:
             user_prompt: The user's request to the committee
             show_thinking: Whether to display agent thinking blocks
             questions_per_agent: Number of clarification questions each agent can ask (default: 2)
+            show_stats: Whether to print orchestration stats after the meeting
+            pause_between_phases: Whether to stop at the phase gate between phases (disable for unattended runs)
         """
-        return asyncio.run(self.run_async(user_prompt, show_thinking=show_thinking, questions_per_agent=questions_per_agent))
+        return asyncio.run(self.run_async(
+            user_prompt,
+            show_thinking=show_thinking,
+            questions_per_agent=questions_per_agent,
+            show_stats=show_stats,
+            pause_between_phases=pause_between_phases
+        ))
@@ -0,0 +1,173 @@
+"""
+Conversation management between committee meeting phases.
+
+Without a conversation manager, every member turn starts with no history: the
+swarm resets each node to its initial messages before every turn. A manager
+passed to the meeting (conversation_manager=...) carries context between phases
+instead. MinutesConversationManager starts each member's next phase with a
+compact "minutes so far" summary of the whole meeting plus a sliding window of
+its own most recent statements, bounded by the phase's context_token_limit.
+This adds context to every turn rather than saving tokens, so nothing uses it
+unless a caller opts in.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple
+import copy
+
+from dbc.models.usage import estimate_tokens
+from dbc.workflow.thinking_filter import strip_thinking_blocks
+
+
+# Shortest excerpt of a statement kept in the minutes; older statements are dropped before going shorter
+MIN_EXCERPT_CHARS = 200
+
+
+def estimate_message_tokens(messages: List[dict]) -> int:
+    """Estimate the token count of the text content in a list of Strands messages."""
+    total = 0
+    for message in messages:
+        for block in message.get('content', []):
+            if 'text' in block:
+                total += estimate_tokens(block['text'])
+            elif 'toolUse' in block:
+                total += estimate_tokens(str(block['toolUse'].get('input', '')))
+            elif 'toolResult' in block:
+                for item in block['toolResult'].get('content', []):
+                    total += estimate_tokens(str(item.get('text', '')))
+    return total
+
+
+def _assistant_text(messages: List[dict]) -> str:
+    """Concatenate the assistant text in a turn, without <thinking> blocks."""
+    text = ''.join(
+        block['text']
+        for message in messages if message.get('role') == 'assistant'
+        for block in message.get('content', []) if 'text' in block
+    )
+    return strip_thinking_blocks(text).strip()
+
+
+def _text_message(role: str, text: str) -> dict:
+    """Build a single-block text message."""
+    return {'role': role, 'content': [{'text': text}]}
+
+
+class PhaseConversationManager(ABC):
+    """
+    Decides what conversation history each member carries between phases.
+
+    The meeting calls record_turn() after every member turn and compact() for every
+    member between phases. history() returns the messages a member starts its next
+    turn with.
+    """
+
+    @abstractmethod
+    def history(self, agent_key: str) -> List[dict]:
+        """Return a copy of the history the member should start its next turn with."""
+
+    @abstractmethod
+    def record_turn(self, agent_key: str, agent_name: str, phase_number: int, messages: List[dict]):
+        """
+        Record the messages produced by one member turn.
+
+        Args:
+            agent_key: Agent key of the member
+            agent_name: Display name of the member
+            phase_number: Phase the turn belongs to
+            messages: Messages added to the member's conversation during the turn
+        """
+
+    @abstractmethod
+    def compact(self, agent_key: str, phase_number: int, token_limit: int):
+        """
+        Compact a member's history before the given phase.
+
+        Args:
+            agent_key: Agent key of the member
+            phase_number: Phase the compacted history is for
+            token_limit: Token budget for the compacted history
+        """
+
+
+class MinutesConversationManager(PhaseConversationManager):
+    """Replaces raw history with meeting minutes plus a sliding window of recent turns."""
+
+    def __init__(self, minutes_share: float = 0.5):
+        """
+        Args:
+            minutes_share: Fraction of each phase's token budget reserved for the minutes;
+                the rest holds the member's own recent statements.
+        """
+        self.minutes_share = minutes_share
+        self.minutes: List[Tuple[int, str, str]] = []  # (phase, speaker name, statement)
+        self.turns: Dict[str, List[Tuple[int, str]]] = {}  # agent_key -> [(phase, statement)]
+        self.histories: Dict[str, List[dict]] = {}  # agent_key -> compacted history
+
+    def history(self, agent_key: str) -> List[dict]:
+        return copy.deepcopy(self.histories.get(agent_key, []))
+
+    def record_turn(self, agent_key: str, agent_name: str, phase_number: int, messages: List[dict]):
+        statement = _assistant_text(messages)
+        if statement:
+            self.minutes.append((phase_number, agent_name, statement))
+            self.turns.setdefault(agent_key, []).append((phase_number, statement))
+
+    def _render_minutes(self, token_budget: int) -> str:
+        """Render the minutes within the budget, trimming statements evenly and dropping the oldest first."""
+        kept = list(self.minutes)
+        while kept:
+            minutes = self._render_statements(kept, (token_budget * 4) // len(kept), len(self.minutes) - len(kept))
+            if estimate_tokens(minutes) <= token_budget:
+                return minutes
+            if len(kept) == 1:
+                # Even the latest statement alone is over budget: cut the rendered text itself
+                return minutes[:token_budget * 4].rstrip()
+            # Excerpts never go below MIN_EXCERPT_CHARS, so the oldest statement makes room instead
+            kept = kept[1:]
+
+        return ""
+
+    @staticmethod
+    def _render_statements(statements: List[Tuple[int, str, str]], excerpt_chars: int, omitted: int) -> str:
+        """Render minutes from statements, each cut to excerpt_chars."""
+        excerpt_chars = max(excerpt_chars, MIN_EXCERPT_CHARS)
+        minutes = "MEETING MINUTES SO FAR"
+        if omitted:
+            minutes += f" ({omitted} earlier statements omitted)"
+
+        current_phase = None
+        for phase_number, speaker, statement in statements:
+            if phase_number != current_phase:
+                minutes += f"\n\nPhase {phase_number}:"
+                current_phase = phase_number
+            excerpt = statement if len(statement) <= excerpt_chars else statement[:excerpt_chars].rstrip() + "..."
+            minutes += f"\n- {speaker}: {excerpt}"
+
+        return minutes
+
+    def compact(self, agent_key: str, phase_number: int, token_limit: int):
+        minutes = self._render_minutes(int(token_limit * self.minutes_share))
+
+        history = []
+        if minutes:
+            history = [
+                _text_message('user', minutes),
+                _text_message('assistant', "Noted. I'll keep the meeting minutes in mind."),
+            ]
+
+        # Sliding window of the member's own most recent statements, newest first until the budget runs out
+        remaining = token_limit - estimate_message_tokens(history)
+        window = []
+        for turn_phase, statement in reversed(self.turns.get(agent_key, [])):
+            turn = [
+                _text_message('user', f"[Your statement in Phase {turn_phase}]"),
+                _text_message('assistant', statement),
+            ]
+            cost = estimate_message_tokens(turn)
+            if cost > remaining:
+                break
+            window = turn + window
+            remaining -= cost
+
+        self.histories[agent_key] = history + window
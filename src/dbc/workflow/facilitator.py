@@ -0,0 +1,116 @@
+"""
+Rule-based facilitator for committee meeting swarm phases.
+
+Morgan Calendar's only job during a phase is to hand the floor to the next
+member, yet every one of those handoffs costs a full model call with the whole
+phase context. This module picks the next speaker in code from PHASE_CONFIG
+and only defers to the LLM facilitator when the rules cannot decide.
+"""
+
+from typing import List, Optional
+
+from dbc.workflow.swarm_config import FACILITATOR_KEY, PHASE_CONFIG, SWARM_CONFIG
+
+
+# Returned by FacilitatorRouter when the LLM facilitator should pick the next speaker
+FALLBACK_TO_FACILITATOR = 'fallback_to_facilitator'
+
+
+class FacilitatorRouter:
+    """
+    Deterministic next-speaker selection for a single phase.
+
+    Rules, in order:
+    1. A handoff to a participant who has not spoken yet is honored.
+    2. Otherwise the next participant who has not spoken takes the floor,
+       in required_handoffs order followed by expected_participants order.
+    3. Once every participant has spoken (or the handoff budget is nearly spent),
+       the synthesizer takes the floor.
+    4. After the synthesizer speaks with no participants pending, the phase ends.
+    5. A handoff to a participant who already spoke is honored (direct rebuttal).
+    6. Anything else (e.g. a handoff to a member not expected in this phase)
+       falls back to the LLM facilitator, whose own choice is then final.
+    """
+
+    def __init__(self, phase_number: int, available_keys: List[str], facilitator_key: str = FACILITATOR_KEY):
+        """
+        Args:
+            phase_number: Phase to route (key into PHASE_CONFIG)
+            available_keys: Agent keys present in the meeting
+            facilitator_key: Agent key of the LLM facilitator used as fallback
+        """
+        phase_config = PHASE_CONFIG[phase_number]
+
+        self.facilitator_key = facilitator_key
+        self.entry_point = phase_config.get('entry_point', 'sam_powerpoint')
+        self.synthesizer = phase_config.get('synthesizer')
+        self.max_handoffs = phase_config.get('max_handoffs', SWARM_CONFIG['max_handoffs'])
+
+        # Required handoffs come first, then everyone else who is expected to speak
+        ordered = phase_config.get('required_handoffs', []) + phase_config.get('expected_participants', [])
+        self.participants = []
+        for key in ordered:
+            if key in available_keys and key not in self.participants and key not in (facilitator_key, self.synthesizer):
+                self.participants.append(key)
+
+        self.history = []  # Agent keys in speaking order
+        self.fallback_count = 0
+
+    @property
+    def pending(self) -> List[str]:
+        """Participants who have not spoken yet in this phase."""
+        return [key for key in self.participants if key not in self.history]
+
+    def first_speaker(self) -> str:
+        """Pick the agent that opens the phase."""
+        if self.entry_point != self.facilitator_key:
+            return self.entry_point
+
+        # Skip the facilitator's opening turn and go straight to the first participant
+        if self.pending:
+            return self.pending[0]
+        if self.synthesizer:
+            return self.synthesizer
+
+        self.fallback_count += 1
+        return self.facilitator_key
+
+    def next_speaker(self, last_speaker: str, requested: Optional[str]) -> Optional[str]:
+        """
+        Decide who speaks after last_speaker.
+
+        Args:
+            last_speaker: Agent key of the member who just finished
+            requested: Agent key the member handed off to, or None if no handoff
+
+        Returns:
+            Agent key of the next speaker, None to end the phase, or
+            FALLBACK_TO_FACILITATOR when the rules cannot decide.
+        """
+        self.history.append(last_speaker)
+        pending = self.pending
+
+        if requested in pending:
+            return requested
+
+        # Wrap up with the synthesizer before the swarm runs out of handoffs
+        budget_nearly_spent = len(self.history) + 1 >= self.max_handoffs
+        synthesizer_due = self.synthesizer and last_speaker != self.synthesizer
+        if synthesizer_due and (not pending or budget_nearly_spent):
+            return self.synthesizer
+
+        if pending:
+            if requested is None or requested == self.facilitator_key:
+                return pending[0]
+        elif last_speaker == self.synthesizer or requested is None or requested == self.facilitator_key:
+            return None
+
+        if requested in self.participants or requested == self.synthesizer:
+            return requested
+
+        # The facilitator's own choice is final, so the fallback never loops
+        if last_speaker == self.facilitator_key:
+            return requested
+
+        self.fallback_count += 1
+        return FALLBACK_TO_FACILITATOR
@@ -0,0 +1,124 @@
+"""
+Output sinks for streamed meeting output.
+
+Models stream a few tokens per chunk, and writing and flushing stdout for
+every chunk costs a syscall per token. BufferedOutputSink coalesces chunks
+into line-sized writes, bounded in time so a partial line never sits on
+screen for longer than the flush interval. Speaker headers, handoffs and
+clarification prompts still flush immediately.
+"""
+
+from typing import TextIO
+import asyncio
+import sys
+import threading
+
+from dbc.workflow.swarm_config import SWARM_CONFIG
+
+
+class OutputSink:
+    """Unbuffered sink: every write goes straight to the stream and is flushed."""
+
+    def __init__(self, stream: TextIO = None):
+        """
+        Args:
+            stream: Stream to write to (defaults to the current sys.stdout at write time)
+        """
+        self._stream = stream
+        self.chunks = 0  # write() calls received
+        self.writes = 0  # stream.write() calls made
+        self.flushes = 0  # stream.flush() calls made
+
+    @property
+    def stream(self) -> TextIO:
+        # Resolved at write time so redirect_stdout (e.g. in benchmarks) is honored
+        return self._stream or sys.stdout
+
+    def write(self, text: str, flush: bool = False):
+        """
+        Write text to the stream.
+
+        Args:
+            text: Text to write
+            flush: Force the text out immediately (speaker headers, prompts)
+        """
+        if not text:
+            return
+        self.chunks += 1
+        self._write_through(text)
+
+    def flush(self):
+        """Write out anything buffered."""
+
+    def _write_through(self, text: str):
+        self.stream.write(text)
+        self.stream.flush()
+        self.writes += 1
+        self.flushes += 1
+
+    def stats(self) -> dict:
+        """Return write/flush counts, and how many a write-and-flush per chunk would have made."""
+        return {
+            'chunks': self.chunks,
+            'writes': self.writes,
+            'flushes': self.flushes,
+            'writes_saved': max(self.chunks - self.writes, 0),
+            'flushes_saved': max(self.chunks - self.flushes, 0),
+        }
+
+
+class BufferedOutputSink(OutputSink):
+    """Coalesces chunks into line-sized writes, flushed at most every flush_interval_ms."""
+
+    def __init__(self, stream: TextIO = None, flush_interval_ms: int = SWARM_CONFIG['output_flush_interval_ms'],
+                 max_buffer_chars: int = 4096):
+        """
+        Args:
+            stream: Stream to write to (defaults to the current sys.stdout at write time)
+            flush_interval_ms: Longest time a partial line may stay buffered
+            max_buffer_chars: Flush once this much text is buffered, even mid-line
+        """
+        super().__init__(stream)
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_buffer_chars = max_buffer_chars
+        self._buffer = []
+        self._buffered_chars = 0
+        self._timer = None
+        # Clarification prompts flush from the tool's worker thread
+        self._lock = threading.Lock()
+
+    def write(self, text: str, flush: bool = False):
+        if not text:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        with self._lock:
+            self.chunks += 1
+            self._buffer.append(text)
+            self._buffered_chars += len(text)
+
+            # Without an event loop nothing could flush a partial line later, so write it now
+            if flush or loop is None or '\n' in text or self._buffered_chars >= self.max_buffer_chars:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.flush_interval, self.flush)
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+
+        text = ''.join(self._buffer)
+        self._buffer = []
+        self._buffered_chars = 0
+        self._write_through(text)
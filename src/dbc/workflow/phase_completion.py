@@ -0,0 +1,94 @@
+"""
+Phase completion tracking for committee meeting swarm phases.
+
+PHASE_CONFIG lists who is expected to speak in each phase, but the swarm keeps
+going for as long as agents hand the floor to each other. The tracker watches
+the swarm event stream and closes the phase as soon as every expected
+participant has spoken and the synthesizer has produced output. Concurrent
+phases, which always end after the synthesizer's turn, are tracked for their
+stats only.
+"""
+
+from typing import List, Optional
+
+from dbc.workflow.swarm_config import FACILITATOR_KEY, PHASE_CONFIG, SWARM_CONFIG
+
+
+class PhaseCompletionTracker:
+    """Tracks who has spoken in a phase and decides when the phase is done."""
+
+    def __init__(self, phase_number: int, available_keys: List[str], skip_facilitator: bool = False,
+                 facilitator_key: str = FACILITATOR_KEY):
+        """
+        Args:
+            phase_number: Phase to track (key into PHASE_CONFIG)
+            available_keys: Agent keys present in the meeting
+            skip_facilitator: If True, the facilitator is not required to speak
+                (its turns are handled by the rule-based router)
+            facilitator_key: Agent key of the facilitator
+        """
+        phase_config = PHASE_CONFIG[phase_number]
+
+        self.phase_number = phase_number
+        self.synthesizer = phase_config.get('synthesizer')
+        self.max_handoffs = phase_config.get('max_handoffs', SWARM_CONFIG['max_handoffs'])
+        self.expected = [
+            key for key in phase_config.get('expected_participants', [])
+            if key in available_keys and not (skip_facilitator and key == facilitator_key)
+        ]
+
+        self.spoken = set()
+        self.turns = 0
+        self.tokens = 0
+        self.is_complete = False
+        self.closed_early = False
+        self.handoffs_saved = 0
+        self.tokens_saved = 0
+
+    def record_turn(self, agent_key: str, node_result=None):
+        """
+        Record a completed turn and update the completion state.
+
+        Args:
+            agent_key: Agent key of the member who just finished
+            node_result: Strands NodeResult for the turn, or the metrics of a direct
+                turn's AgentResult (anything with accumulated_usage; used for token usage)
+        """
+        self.turns += 1
+        self.spoken.add(agent_key)
+
+        usage = getattr(node_result, 'accumulated_usage', None) or {}
+        self.tokens += usage.get('totalTokens', 0)
+
+        everyone_heard = all(key in self.spoken for key in self.expected)
+        if everyone_heard and (self.synthesizer is None or agent_key == self.synthesizer):
+            self.is_complete = True
+
+    def close(self, pending_handoff: Optional[str]):
+        """
+        Close the phase, cancelling any handoff that was still pending.
+
+        Only the cancelled handoff counts as saved, at roughly the average token cost
+        of the turns seen so far. The discussion might have run on for longer, but
+        nothing shows it would have.
+
+        Args:
+            pending_handoff: Agent key the last speaker handed off to, if any
+        """
+        if pending_handoff is None:
+            return
+
+        self.closed_early = True
+        self.handoffs_saved = 1
+        self.tokens_saved = self.tokens // self.turns if self.turns else 0
+
+    def summary(self) -> dict:
+        """Return phase completion stats for the meeting report."""
+        return {
+            'phase': self.phase_number,
+            'turns': self.turns,
+            'tokens': self.tokens,
+            'closed_early': self.closed_early,
+            'handoffs_saved': self.handoffs_saved,
+            'tokens_saved': self.tokens_saved,
+        }
@@ -0,0 +1,174 @@
+"""
+Phase gates: how a meeting moves on between phases.
+
+The meeting used to call input() between phases, which blocks the event loop
+and everything on it (background work, concurrent meetings) until the user
+presses Enter. A gate waits without blocking the loop. It can wait for Enter
+with an optional timeout, advance automatically, or advance on an external
+signal. Text typed before Enter is returned as stakeholder input for the next
+phase.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+import asyncio
+import signal
+import sys
+import threading
+import time
+
+from dbc.workflow.swarm_config import SWARM_CONFIG
+from dbc.workflow.terminal_input import read_line
+
+
+GATE_MODES = ('enter', 'auto', 'signal')
+
+
+@dataclass
+class GateResult:
+    """
+    How a gate was passed.
+
+    Attributes:
+        advanced_by: 'enter', 'timeout', 'auto', 'signal' or 'eof' (stdin closed)
+        waited: Seconds spent at the gate
+        text: Text the user typed before Enter (empty if none)
+    """
+    advanced_by: str
+    waited: float = 0.0
+    text: str = ''
+
+
+class PhaseGate(ABC):
+    """Decides when the meeting moves on to the next phase."""
+
+    @abstractmethod
+    async def wait(self, message: str) -> GateResult:
+        """Wait until the meeting may continue, without blocking the event loop."""
+
+
+class AutoAdvanceGate(PhaseGate):
+    """Advances on its own, optionally after a delay (for headless and unattended runs)."""
+
+    def __init__(self, delay: float = 0.0):
+        """
+        Args:
+            delay: Seconds to wait before advancing
+        """
+        self.delay = delay
+
+    async def wait(self, message: str) -> GateResult:
+        started = time.monotonic()
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
+        return GateResult('auto', time.monotonic() - started)
+
+
+class EnterGate(PhaseGate):
+    """Waits for Enter on stdin, advancing anyway once the timeout passes."""
+
+    def __init__(self, timeout: float = None):
+        """
+        Args:
+            timeout: Seconds to wait for Enter before advancing (None waits indefinitely)
+        """
+        self.timeout = timeout
+
+    async def wait(self, message: str) -> GateResult:
+        if self.timeout:
+            message += f" (continuing automatically in {self.timeout:.0f}s)"
+        print(message + "\n(Optionally type a note for the committee first.)", flush=True)
+
+        started = time.monotonic()
+        try:
+            text = await read_line(self.timeout)
+        except asyncio.TimeoutError:
+            print("[No response; continuing]", flush=True)
+            return GateResult('timeout', time.monotonic() - started)
+
+        # readline() returns '' only once stdin is closed
+        advanced_by = 'enter' if text else 'eof'
+        return GateResult(advanced_by, time.monotonic() - started, text.strip())
+
+
+class SignalGate(PhaseGate):
+    """Advances when advance() is called (from any thread) or the process receives a signal."""
+
+    def __init__(self, timeout: float = None, unix_signal: int = None):
+        """
+        Args:
+            timeout: Seconds to wait for the signal before advancing (None waits indefinitely)
+            unix_signal: Signal that advances the gate (e.g. signal.SIGUSR1; POSIX only)
+        """
+        self.timeout = timeout
+        self.unix_signal = unix_signal
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._event: Optional[asyncio.Event] = None
+        self._pending = False  # advance() called while nothing was waiting
+        self._lock = threading.Lock()
+
+    def advance(self):
+        """Let the waiting meeting (or the next one to reach the gate) continue. Safe from any thread."""
+        with self._lock:
+            if self._event is None:
+                self._pending = True
+                return
+            loop, event = self._loop, self._event
+        loop.call_soon_threadsafe(event.set)
+
+    async def wait(self, message: str) -> GateResult:
+        how = f"send signal {signal.Signals(self.unix_signal).name} to process" if self.unix_signal else "waiting for signal"
+        print(f"{message} [{how}]", flush=True)
+
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        with self._lock:
+            self._loop, self._event = loop, event
+            if self._pending:
+                self._pending = False
+                event.set()
+
+        if self.unix_signal is not None:
+            loop.add_signal_handler(self.unix_signal, event.set)
+
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(event.wait(), self.timeout)
+            return GateResult('signal', time.monotonic() - started)
+        except asyncio.TimeoutError:
+            print("[No signal; continuing]", flush=True)
+            return GateResult('timeout', time.monotonic() - started)
+        finally:
+            if self.unix_signal is not None:
+                loop.remove_signal_handler(self.unix_signal)
+            with self._lock:
+                self._loop, self._event = None, None
+
+
+def create_phase_gate(mode: str = None, timeout: float = None) -> PhaseGate:
+    """
+    Build a gate from a mode name.
+
+    Args:
+        mode: 'enter', 'auto' or 'signal' (defaults to SWARM_CONFIG['phase_gate']['mode'])
+        timeout: Seconds before advancing anyway ('auto': delay before advancing;
+                 defaults to SWARM_CONFIG['phase_gate']['timeout'])
+
+    Returns:
+        The gate. 'enter' without a terminal on stdin advances automatically instead,
+        so headless runs never wait on input that cannot come.
+    """
+    mode = mode or SWARM_CONFIG['phase_gate']['mode']
+    timeout = timeout if timeout is not None else SWARM_CONFIG['phase_gate']['timeout']
+
+    if mode not in GATE_MODES:
+        raise ValueError(f"Unknown phase gate mode: {mode} (expected one of {', '.join(GATE_MODES)})")
+    if mode == 'auto':
+        return AutoAdvanceGate(delay=timeout or 0.0)
+    if mode == 'signal':
+        return SignalGate(timeout=timeout, unix_signal=getattr(signal, 'SIGUSR1', None))
+
+    if sys.stdin is None or not sys.stdin.isatty():
+        return AutoAdvanceGate()
+    return EnterGate(timeout=timeout)
@@ -34,7 +34,10 @@ PHASE_CONFIG = {
         'max_handoffs': 10,
         'entry_point': 'sam_powerpoint',
         'expected_participants': ['sam_powerpoint', 'nina_edgecase', 'casey_friday', 'fontaine_kerning', 'max_token'],
-        'required_handoffs': ['nina_edgecase', 'casey_friday', 'fontaine_kerning', 'max_token']
+        'required_handoffs': ['nina_edgecase', 'casey_friday', 'fontaine_kerning', 'max_token'],
+        # Specialists in required_handoffs are invoked concurrently, then the synthesizer merges their input
+        'execution_mode': 'fan_out',
+        'synthesizer': 'sam_powerpoint'
     },
     2: {
         'name': 'Initial Review',
@@ -43,7 +46,10 @@ PHASE_CONFIG = {
         'max_handoffs': 15,
         'entry_point': 'morgan_calendar',
         'expected_participants': ['morgan_calendar', 'nina_edgecase', 'casey_friday', 
-                                  'pat_attacksurface', 'fontaine_kerning', 'max_token', 'sam_powerpoint']
+                                  'pat_attacksurface', 'fontaine_kerning', 'max_token', 'sam_powerpoint'],
+        'synthesizer': 'sam_powerpoint',
+        # Token budget for each member's carried-over history (minutes + recent turns)
+        'context_token_limit': 4000
     },
     3: {
         'name': 'Cross-Committee Deliberation',
@@ -52,7 +58,9 @@ PHASE_CONFIG = {
         'max_handoffs': 15,
         'entry_point': 'morgan_calendar',
         'expected_participants': ['morgan_calendar', 'nina_edgecase', 'casey_friday', 
-                                  'pat_attacksurface', 'fontaine_kerning', 'max_token', 'sam_powerpoint']
+                                  'pat_attacksurface', 'fontaine_kerning', 'max_token', 'sam_powerpoint'],
+        'synthesizer': 'sam_powerpoint',
+        'context_token_limit': 6000
     },
     4: {
         'name': 'Finalize plan',
@@ -61,7 +69,11 @@ PHASE_CONFIG = {
         'max_handoffs': 10,
         'entry_point': 'morgan_calendar',
         'expected_participants': ['morgan_calendar', 'nina_edgecase', 'casey_friday', 
-                                  'pat_attacksurface', 'fontaine_kerning', 'max_token']
+                                  'pat_attacksurface', 'fontaine_kerning', 'max_token'],
+        # Position statements are independent, so they run concurrently before Sam's wrap-up
+        'execution_mode': 'parallel',
+        'synthesizer': 'sam_powerpoint',
+        'context_token_limit': 6000
     },
     5: {
         'name': 'Decision & Go-Forward Plan',
@@ -69,11 +81,25 @@ PHASE_CONFIG = {
         'tension_level': 'High → Resolution',
         'max_handoffs': 5,
         'entry_point': 'sam_powerpoint',
-        'expected_participants': ['sam_powerpoint', 'morgan_calendar']
+        'expected_participants': ['sam_powerpoint', 'morgan_calendar'],
+        'synthesizer': 'sam_powerpoint',
+        # The final synthesis draws on the whole meeting, so it gets the largest budget
+        'context_token_limit': 8000
     }
 }
 
 
+# Meeting facilitator (only hands off, never contributes analysis)
+FACILITATOR_KEY = 'morgan_calendar'
+
+
+# Phase execution modes
+# - 'swarm': agents self-organize through handoffs (default)
+# - 'fan_out': required_handoffs run concurrently, followed by a single synthesizer turn
+# - 'parallel': expected_participants (minus facilitator) run concurrently, followed by a synthesizer turn
+PHASE_EXECUTION_MODES = ('swarm', 'fan_out', 'parallel')
+
+
 # Swarm configuration
 SWARM_CONFIG = {
     'max_handoffs': 50,
@@ -82,4 +108,35 @@ SWARM_CONFIG = {
     'node_timeout': 600,  # 10 minutes per agent (allows time for user input)
     'repetitive_handoff_detection_window': 5,
     'repetitive_handoff_min_unique_agents': 3,
+    'facilitator_router': True,  # Pick the next speaker in code instead of through facilitator LLM turns
+    'prompt_cache': True,  # Mark system prompts and carried-forward phase context as Bedrock cache points
+    'context_token_limit': 4000,  # Default carried-over history budget for phases without their own limit
+    'output_flush_interval_ms': 50,  # Longest a partial line of streamed output stays buffered
+    'rate_limit': True,  # Admit model calls through per-model request/token quotas shared by all meetings
+    'checkpoint_dir': '~/.dbc/meetings',  # Append-only meeting logs used by `dbc resume`
+    'bedrock_pool': {  # Bedrock client shared by every member and meeting in the process
+        'max_pool_connections': 32,  # Concurrent connections (botocore default is 10)
+        'tcp_keepalive': True,  # Keep idle connections open between turns
+    },
+    'preflight_timeout': 180.0,  # Seconds kickoff warm-up may retry a model (subscription activation takes ~2 minutes)
+    'failover': True,  # Fail over to each member's fallback models when its model is unavailable
+    'circuit_breaker': {
+        'failure_threshold': 3,  # Consecutive failures (or latency breaches) before a model is skipped
+        'cool_down': 60.0,  # Seconds a skipped model waits before one call probes it again
+        'latency_slo': 30.0,  # Seconds to first output; slower responses count as failures
+    },
+    'phase_gate': {  # How the meeting moves on between phases
+        'mode': 'enter',  # 'enter' (wait for Enter), 'auto' (advance on its own) or 'signal' (SIGUSR1)
+        'timeout': None,  # Seconds before advancing anyway (None waits indefinitely; 'auto': delay)
+    },
+    'clarification': {  # How members' clarification questions are answered
+        'timeout': 600.0,  # Seconds to wait for an answer before the member gets the default answer
+        'default_answer': "[System: The user did not answer. Proceed with your best assumptions and state them.]",
+    },
+    'speculative_phases': False,  # Start a concurrent phase's turns during the review pause before it (opt-in)
+    'response_cache': False,  # Replay responses to identical model requests from disk (opt-in)
+    'response_cache_store': {
+        'directory': '~/.dbc/response-cache',
+        'max_bytes': 256 * 1024 * 1024,  # Least recently used responses are evicted past this size
+    },
 }
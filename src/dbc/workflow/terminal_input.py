@@ -0,0 +1,57 @@
+"""
+Reading a line from the terminal without blocking the event loop.
+
+Phase gates and clarification questions both wait on the user. Calling
+input() would freeze the loop and everything on it (concurrent turns, other
+meetings) until the user answers, so stdin is watched from the loop instead.
+"""
+
+import asyncio
+import sys
+import threading
+
+
+def _read_line_thread(loop: asyncio.AbstractEventLoop, line: asyncio.Future):
+    """Fallback for loops without add_reader (e.g. Windows): read stdin on a daemon thread."""
+    def read():
+        text = sys.stdin.readline()
+        loop.call_soon_threadsafe(lambda: line.done() or line.set_result(text))
+
+    # A read still pending after a timeout keeps its thread, so this is only used where add_reader is unavailable
+    threading.Thread(target=read, name='dbc-terminal-input', daemon=True).start()
+
+
+async def read_line(timeout: float = None) -> str:
+    """
+    Read one line from stdin while the event loop keeps running.
+
+    Args:
+        timeout: Seconds to wait (None waits indefinitely)
+
+    Returns:
+        The line, including its newline ('' once stdin is closed)
+
+    Raises:
+        asyncio.TimeoutError: If no line arrived in time
+    """
+    loop = asyncio.get_running_loop()
+    line = loop.create_future()
+
+    def on_readable():
+        if not line.done():
+            line.set_result(sys.stdin.readline())
+
+    # Watch stdin from the loop itself, so nothing is left reading it after a timeout
+    reader_fd = None
+    try:
+        reader_fd = sys.stdin.fileno()
+        loop.add_reader(reader_fd, on_readable)
+    except (AttributeError, NotImplementedError, OSError, ValueError):
+        reader_fd = None
+        _read_line_thread(loop, line)
+
+    try:
+        return await asyncio.wait_for(line, timeout)
+    finally:
+        if reader_fd is not None:
+            loop.remove_reader(reader_fd)
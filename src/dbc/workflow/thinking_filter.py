@@ -0,0 +1,121 @@
+"""
+Streaming filter for <thinking> blocks.
+
+Models wrap their reasoning in <thinking>...</thinking> tags, which the
+committee transcript hides unless --show-thinking is set. Text arrives in
+small chunks, so tags can be split across chunk boundaries. The filter scans
+each chunk once with a compiled pattern, tracks nesting depth, and holds back
+a trailing partial tag until the next chunk decides what it is.
+"""
+
+import re
+
+
+OPEN_TAG = '<thinking>'
+CLOSE_TAG = '</thinking>'
+
+_TAG_PATTERN = re.compile(r'<(/?)thinking>', re.IGNORECASE)
+_TRAILING_WHITESPACE = ' \t\r\n'
+
+
+def _partial_tag_length(text: str) -> int:
+    """Length of the suffix of text that could be the start of a tag split across chunks."""
+    start = text.rfind('<', max(len(text) - len(CLOSE_TAG) + 1, 0))
+    if start == -1:
+        return 0
+
+    suffix = text[start:].lower()
+    if OPEN_TAG.startswith(suffix) or CLOSE_TAG.startswith(suffix):
+        return len(text) - start
+    return 0
+
+
+class ThinkingBlockFilter:
+    """
+    Incrementally removes <thinking> blocks from a stream of text chunks.
+
+    Tags are matched case-insensitively and may nest; text is hidden until every
+    opened block is closed. Whitespace right after a closing tag is dropped, and a
+    closing tag with no open block is passed through as text. Output does not
+    depend on how the stream is split into chunks.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget all state (call when a new speaker starts streaming)."""
+        self.depth = 0
+        self.partial_tag_buffer = ""  # Possible tag prefix held back from the previous chunk
+        self.skip_whitespace = False  # Drop whitespace following a closing tag
+
+    @property
+    def in_thinking_block(self) -> bool:
+        return self.depth > 0
+
+    def feed(self, text: str) -> str:
+        """
+        Filter one chunk.
+
+        Args:
+            text: Next chunk of streamed text
+
+        Returns:
+            The visible text that can be printed now
+        """
+        text = self.partial_tag_buffer + text
+        self.partial_tag_buffer = ""
+
+        output = []
+        position = 0
+        for match in _TAG_PATTERN.finditer(text):
+            if self.depth == 0:
+                visible = text[position:match.start()]
+                if self.skip_whitespace:
+                    visible = visible.lstrip(_TRAILING_WHITESPACE)
+                    self.skip_whitespace = self.skip_whitespace and not visible
+                output.append(visible)
+
+            if not match.group(1):
+                self.depth += 1
+            elif self.depth > 0:
+                self.depth -= 1
+                self.skip_whitespace = self.depth == 0
+            else:
+                # Stray closing tag outside any block is ordinary text
+                output.append(match.group(0))
+                self.skip_whitespace = False
+            position = match.end()
+
+        # Hold back a trailing partial tag; the next chunk decides whether it is a tag
+        tail = text[position:]
+        held = _partial_tag_length(tail)
+        if held:
+            self.partial_tag_buffer = tail[-held:]
+            tail = tail[:-held]
+
+        if self.depth == 0:
+            if self.skip_whitespace:
+                stripped = tail.lstrip(_TRAILING_WHITESPACE)
+                # Keep skipping until something visible arrives (or a held tag settles it)
+                self.skip_whitespace = not stripped and not held
+                tail = stripped
+            output.append(tail)
+
+        return ''.join(output)
+
+    def flush(self) -> str:
+        """Return any held-back text at the end of the stream (a partial tag that never completed)."""
+        held = self.partial_tag_buffer
+        self.partial_tag_buffer = ""
+        if self.depth > 0:
+            return ""
+        if self.skip_whitespace:
+            held = held.lstrip(_TRAILING_WHITESPACE)
+        return held
+
+
+def strip_thinking_blocks(text: str) -> str:
+    """Remove <thinking> blocks from buffered (non-streamed) text."""
+    thinking_filter = ThinkingBlockFilter()
+    return thinking_filter.feed(text) + thinking_filter.flush()
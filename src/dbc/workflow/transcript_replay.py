@@ -0,0 +1,291 @@
+"""
+Transcript replay for committee meetings.
+
+Parses a saved meeting transcript (the terminal output of `dbc kickoff`) back
+into swarm events and feeds them through CommitteeStreamHandler, either as
+fast as possible or at the pace recorded in the transcript's speaker
+timestamps. Useful for profiling the renderer in isolation and for demos that
+make no model calls.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+import asyncio
+import random
+import re
+import sys
+import time
+
+from dbc.agents import CommitteeAgent
+from dbc.committee import COMMITTEE_MEMBERS
+from dbc.models import MockModelConfig
+from dbc.workflow.committee_meeting_swarm import CommitteeStreamHandler
+
+
+SEPARATOR = "=" * 80
+
+_SPEAKER_HEADER_PATTERN = re.compile(r'^\[(\d{2}):(\d{2}):(\d{2})\] (.+) \((.+)\):$')
+_HANDOFF_PATTERN = re.compile(r'^\[Handoff: (.+) → (.+)\]$')
+_PHASE_PATTERN = re.compile(r'^Phase (\d+): (.+)$')
+
+
+@dataclass
+class TranscriptSegment:
+    """
+    One piece of a parsed transcript.
+
+    Attributes:
+        kind: 'phase', 'turn', 'handoff' or 'text' (output printed outside the stream handler)
+        text: Streamed text for turns, raw output for text segments, phase name for phases
+        node_id: Speaker (agent name) for turns; handoff source for handoffs
+        target: Handoff target (agent name)
+        phase: Phase number for phase segments
+        timestamp: Seconds since midnight of the speaker header, for turns
+    """
+    kind: str
+    text: str = ""
+    node_id: Optional[str] = None
+    target: Optional[str] = None
+    phase: Optional[int] = None
+    timestamp: Optional[int] = None
+
+
+def parse_transcript(transcript: str, members: Dict = COMMITTEE_MEMBERS) -> List[TranscriptSegment]:
+    """
+    Parse a saved meeting transcript into segments.
+
+    Args:
+        transcript: Transcript text as printed by `dbc kickoff`
+        members: Committee member definitions, used to map upper-case speaker headers to agent names
+
+    Returns:
+        Segments in transcript order
+    """
+    names = {member.display_name.upper(): member.display_name for member in members.values()}
+    lines = transcript.split('\n')
+    segments = []
+    current = None  # Segment collecting lines (turn or text)
+
+    def close_current():
+        nonlocal current
+        if current is not None:
+            current.text = current.text.strip('\n')
+            if current.kind == 'turn' or current.text.strip():
+                segments.append(current)
+        current = None
+
+    def append_line(line: str):
+        nonlocal current
+        if current is None:
+            current = TranscriptSegment(kind='text')
+        current.text += line + '\n'
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        following = lines[i + 1:i + 3]
+
+        # Phase separator: ====, "Phase N: name", ====
+        if line == SEPARATOR and len(following) == 2 and following[1] == SEPARATOR and _PHASE_PATTERN.match(following[0]):
+            close_current()
+            phase_match = _PHASE_PATTERN.match(following[0])
+            segments.append(TranscriptSegment(kind='phase', text=phase_match.group(2), phase=int(phase_match.group(1))))
+            i += 3
+            continue
+
+        # Clarification summary is printed by the meeting between phases, up to its closing separator
+        if line == SEPARATOR and len(following) == 2 and following[0] == 'CLARIFICATIONS RECEIVED':
+            close_current()
+            end = i + 3
+            while end < len(lines) and lines[end] != SEPARATOR:
+                end += 1
+            for summary_line in lines[i:end + 1]:
+                append_line(summary_line)
+            close_current()
+            i = end + 1
+            continue
+
+        # Phase gate prompt
+        if line.startswith('Please review') and following and following[0].startswith('Press Enter'):
+            close_current()
+            append_line(line)
+            append_line(following[0])
+            close_current()
+            i += 2
+            continue
+
+        header_match = _SPEAKER_HEADER_PATTERN.match(line)
+        if header_match and header_match.group(4) in names:
+            close_current()
+            hours, minutes, seconds = (int(group) for group in header_match.group(1, 2, 3))
+            current = TranscriptSegment(
+                kind='turn',
+                node_id=names[header_match.group(4)],
+                timestamp=hours * 3600 + minutes * 60 + seconds
+            )
+            i += 1
+            continue
+
+        handoff_match = _HANDOFF_PATTERN.match(line)
+        if handoff_match:
+            close_current()
+            segments.append(TranscriptSegment(
+                kind='handoff',
+                node_id=handoff_match.group(1),
+                target=handoff_match.group(2)
+            ))
+            i += 1
+            continue
+
+        if line == '[**Meeting has ended.**]':
+            close_current()
+            append_line(line)
+            close_current()
+            i += 1
+            continue
+
+        append_line(line)
+        i += 1
+
+    close_current()
+    return segments
+
+
+def load_transcript(path: str) -> List[TranscriptSegment]:
+    """Read and parse a transcript file."""
+    with open(path, encoding='utf-8') as transcript_file:
+        return parse_transcript(transcript_file.read())
+
+
+def _turn_durations(segments: List[TranscriptSegment]) -> Dict[int, float]:
+    """Recorded duration of each turn (segment index -> seconds), from consecutive speaker timestamps."""
+    turns = [(index, segment.timestamp) for index, segment in enumerate(segments) if segment.kind == 'turn']
+    durations = {}
+    for (index, start), (_, next_start) in zip(turns, turns[1:]):
+        # Timestamps are wall-clock times of day, so allow for a meeting running past midnight
+        durations[index] = (next_start - start) % 86400
+    return durations
+
+
+def _chunk_text(text: str, chunk_chars: int, rng: random.Random) -> Iterator[str]:
+    """Split text into chunks of varying size around chunk_chars, like model stream deltas."""
+    position = 0
+    while position < len(text):
+        size = rng.randint(1, max(chunk_chars * 2 - 1, 1))
+        yield text[position:position + size]
+        position += size
+
+
+class TranscriptReplayer:
+    """Replays parsed transcript segments through a CommitteeStreamHandler."""
+
+    def __init__(
+        self,
+        segments: List[TranscriptSegment],
+        agents: Dict[str, CommitteeAgent] = None,
+        show_thinking: bool = False,
+        chunk_chars: int = 12,
+        seed: int = 0
+    ):
+        """
+        Args:
+            segments: Parsed transcript segments
+            agents: Committee agents used to render speaker headers (defaults to offline agents
+                for COMMITTEE_MEMBERS, which never call a model during replay)
+            show_thinking: Whether the handler should show <thinking> blocks
+            chunk_chars: Average streamed chunk size in characters (Bedrock deltas are a few tokens)
+            seed: Seed for chunk sizes, so replays are repeatable
+        """
+        if agents is None:
+            agents = {
+                key: CommitteeAgent.from_member(member, mock_model=MockModelConfig())
+                for key, member in COMMITTEE_MEMBERS.items()
+            }
+
+        self.segments = segments
+        self.agents = agents
+        self.show_thinking = show_thinking
+        self.chunk_chars = chunk_chars
+        self.seed = seed
+
+    def _print_phase_separator(self, segment: TranscriptSegment):
+        """Print a phase separator the way the meeting does."""
+        print("\n" + SEPARATOR)
+        print(f"Phase {segment.phase}: {segment.text}")
+        print(SEPARATOR + "\n")
+
+    def events(self) -> Iterator[Tuple[float, dict]]:
+        """
+        Generate (recorded delay before the event, event) pairs for the whole transcript.
+
+        Non-handler output (phase separators, gate prompts) is yielded as
+        {'type': 'transcript_phase'} and {'type': 'transcript_text'} events.
+        """
+        rng = random.Random(self.seed)
+        durations = _turn_durations(self.segments)
+
+        for index, segment in enumerate(self.segments):
+            if segment.kind == 'phase':
+                yield 0.0, {'type': 'transcript_phase', 'segment': segment}
+            elif segment.kind == 'text':
+                yield 0.0, {'type': 'transcript_text', 'text': segment.text}
+            elif segment.kind == 'handoff':
+                yield 0.0, {
+                    'type': 'multiagent_handoff',
+                    'from_node_ids': [segment.node_id],
+                    'to_node_ids': [segment.target],
+                }
+            else:
+                chunks = list(_chunk_text(segment.text, self.chunk_chars, rng))
+                delay = durations.get(index, 0.0) / len(chunks) if chunks else 0.0
+                yield 0.0, {'type': 'multiagent_node_start', 'node_id': segment.node_id, 'node_type': 'agent'}
+                for chunk in chunks:
+                    yield delay, {'type': 'multiagent_node_stream', 'node_id': segment.node_id, 'event': {'data': chunk}}
+                yield 0.0, {'type': 'multiagent_node_stop', 'node_id': segment.node_id, 'node_result': None}
+
+    async def replay(self, speed: float = None) -> dict:
+        """
+        Feed the transcript through a CommitteeStreamHandler.
+
+        Args:
+            speed: None replays as fast as possible; otherwise a multiple of the recorded
+                pace (1.0 is the speed the meeting actually ran at)
+
+        Returns:
+            Stats dictionary with events, bytes, elapsed seconds, events_per_second, bytes_per_second,
+            and the output sink's write/flush counts
+        """
+        handler = CommitteeStreamHandler(self.agents, show_thinking=self.show_thinking)
+        events = 0
+        streamed_bytes = 0
+
+        start = time.perf_counter()
+        for delay, event in self.events():
+            if speed and delay:
+                await asyncio.sleep(delay / speed)
+
+            if event['type'] in ('transcript_phase', 'transcript_text'):
+                # Printed outside the handler, so buffered stream output has to go first
+                handler.output_sink.flush()
+                if event['type'] == 'transcript_phase':
+                    self._print_phase_separator(event['segment'])
+                else:
+                    print("\n" + event['text'])
+                continue
+
+            if event['type'] == 'multiagent_node_stream':
+                streamed_bytes += len(event['event']['data'].encode('utf-8'))
+            await handler.handle_event(event)
+            events += 1
+        handler.output_sink.flush()
+        sys.stdout.flush()
+        elapsed = time.perf_counter() - start
+
+        return {
+            **handler.output_sink.stats(),
+            'events': events,
+            'bytes': streamed_bytes,
+            'elapsed': elapsed,
+            'events_per_second': events / elapsed if elapsed else None,
+            'bytes_per_second': streamed_bytes / elapsed if elapsed else None,
+        }
@@ -0,0 +1,43 @@
+"""
+Cassette record and replay of structured-output calls.
+
+Structured output is a forced tool call through the model's stream, so a
+recorded call is served back by replay like any other.
+"""
+
+import asyncio
+from typing import List
+
+from pydantic import BaseModel
+
+from dbc.models import Cassette, MockModelConfig, RecordingModel, ReplayModel
+
+
+class Decision(BaseModel):
+    summary: str
+    next_steps: List[str]
+
+
+PROMPT = [{'role': 'user', 'content': [{'text': "Summarize the decision."}]}]
+
+
+def _structured_output(model):
+    async def collect():
+        events = [event async for event in model.structured_output(Decision, PROMPT, system_prompt="You are Sam.")]
+        return events[-1]['output']
+    return asyncio.run(collect())
+
+
+def test_structured_output_replays_from_a_saved_cassette(tmp_path):
+    recording = Cassette(mode='record')
+    model = RecordingModel(MockModelConfig(seed=3).create_model('sam_powerpoint'), 'sam_powerpoint', 'mock', recording)
+    recorded = _structured_output(model)
+
+    path = str(tmp_path / 'meeting.cassette')
+    recording.save(path)
+    replay = Cassette.load(path)
+    replayed = _structured_output(ReplayModel('sam_powerpoint', 'mock', replay))
+
+    assert replayed == recorded
+    assert replay.stats()['calls'] == 1
+    assert replay.divergences == []
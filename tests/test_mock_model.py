@@ -0,0 +1,87 @@
+"""
+Structured output from the offline model.
+
+MockModel answers structured-output calls through a forced tool call, as
+BedrockModel does, so they share stream's latency and error injection.
+Model wrappers serve structured output through their own stream, so it is
+retried and failed over like any other call.
+"""
+
+import asyncio
+from typing import List, Literal, Optional
+
+import pytest
+from pydantic import BaseModel
+from strands.types.exceptions import ModelThrottledException
+
+from dbc.models import FailoverModel, MockModelConfig, RetryingModel, RetryPolicy
+
+
+class Task(BaseModel):
+    name: str
+    estimate_days: int
+
+
+class Plan(BaseModel):
+    title: str
+    tasks: List[Task]
+    approved: bool
+    risk: Literal['low', 'medium', 'high']
+    note: Optional[str] = None
+
+
+PROMPT = [{'role': 'user', 'content': [{'text': "Plan the launch."}]}]
+
+
+def _structured_output(model, output_model=Plan):
+    async def collect():
+        events = [event async for event in model.structured_output(output_model, PROMPT)]
+        return events[-1]['output']
+    return asyncio.run(collect())
+
+
+def test_scripted_json_response_is_used():
+    config = MockModelConfig(responses={'casey_friday': ['{"title": "Launch", "tasks": [], "approved": true, "risk": "low"}']})
+
+    plan = _structured_output(config.create_model('casey_friday'))
+
+    assert plan == Plan(title="Launch", tasks=[], approved=True, risk='low')
+
+
+def test_seeded_output_matches_the_schema_and_repeats():
+    config = MockModelConfig(seed=7)
+
+    first = _structured_output(config.create_model('casey_friday'))
+    second = _structured_output(config.create_model('casey_friday'))
+
+    assert isinstance(first, Plan)
+    assert first.tasks and isinstance(first.tasks[0], Task)
+    assert first == second
+
+
+def test_injected_errors_apply():
+    config = MockModelConfig(errors={'casey_friday': ['ThrottlingException']})
+    model = config.create_model('casey_friday')
+
+    with pytest.raises(ModelThrottledException):
+        _structured_output(model)
+    assert isinstance(_structured_output(model), Plan)
+
+
+def test_wrappers_serve_structured_output_through_their_own_stream():
+    config = MockModelConfig(errors={'casey_friday': ['ThrottlingException']})
+    model = RetryingModel(config.create_model('casey_friday'), policy=RetryPolicy(base_delay=0, max_delay=0), quiet=True)
+
+    assert isinstance(_structured_output(model), Plan)
+    assert model.retries == 1
+
+
+def test_failover_serves_structured_output_from_a_fallback():
+    config = MockModelConfig(errors={'primary': ['ThrottlingException']})
+    model = FailoverModel(
+        [('primary-model', config.create_model('primary')), ('fallback-model', config.create_model('fallback'))],
+        notify=lambda notice: None,
+    )
+
+    assert isinstance(_structured_output(model), Plan)
+    assert model.answered_by == 'fallback-model'
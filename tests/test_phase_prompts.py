@@ -0,0 +1,141 @@
+"""
+Prefix stability of the phase prompts.
+
+The static prefix of every phase prompt sits in front of a prompt-cache
+checkpoint, so it must be byte-identical across meetings and members; only
+the dynamic suffix may carry per-meeting or per-member text.
+"""
+
+import pytest
+
+from dbc.agents import cache_point_block
+from dbc.committee import COMMITTEE_MEMBERS
+from dbc.models import MockModelConfig
+from dbc.workflow.committee_meeting_swarm import CommitteeMeetingSwarm
+from dbc.workflow.committee_meeting_swarm import SWARM_HANDOFF_TOOL
+from dbc.workflow.phase_prompts import (
+    CONCURRENT_TURN_PROMPT_TEMPLATES,
+    PHASE_PROMPT_TEMPLATES,
+    SYNTHESIS_PROMPT_TEMPLATES,
+)
+from dbc.workflow.swarm_config import PHASE_CONFIG
+
+
+MEETING_STATES = [
+    {
+        'user_prompt': "Design a customer support portal",
+        'proposal': "Build the portal on the existing CRM.",
+        'user_input': "About 10k users.",
+    },
+    {
+        'user_prompt': "Plan a data warehouse migration",
+        'proposal': "Move to a managed warehouse in two stages.",
+        'user_input': "Budget is fixed for this year.",
+    },
+]
+
+
+TEMPLATES = [
+    *(PHASE_PROMPT_TEMPLATES[phase_number] for phase_number in sorted(PHASE_PROMPT_TEMPLATES)),
+    *(CONCURRENT_TURN_PROMPT_TEMPLATES[phase_number] for phase_number in sorted(CONCURRENT_TURN_PROMPT_TEMPLATES)),
+    *(SYNTHESIS_PROMPT_TEMPLATES[phase_number] for phase_number in sorted(SYNTHESIS_PROMPT_TEMPLATES)),
+]
+CONCURRENT_PHASES = [
+    phase_number for phase_number, phase_config in sorted(PHASE_CONFIG.items())
+    if phase_config.get('execution_mode') in ('fan_out', 'parallel')
+]
+
+
+def _meeting(user_prompt: str) -> CommitteeMeetingSwarm:
+    meeting = CommitteeMeetingSwarm.from_members(COMMITTEE_MEMBERS, mock_model=MockModelConfig())
+    meeting._initialize_state(user_prompt)
+    return meeting
+
+
+@pytest.mark.parametrize('template', TEMPLATES)
+def test_static_prefix_is_identical_across_meetings(template):
+    first_prefix, first_suffix = template.render(MEETING_STATES[0], "\n\nClarifications: about 10k users")
+    second_prefix, second_suffix = template.render(MEETING_STATES[1])
+
+    assert first_prefix.encode('utf-8') == second_prefix.encode('utf-8')
+    assert first_suffix != second_suffix
+
+
+@pytest.mark.parametrize('template', TEMPLATES)
+def test_static_prefix_holds_no_meeting_data(template):
+    static_prefix, _ = template.render(MEETING_STATES[0])
+
+    for value in MEETING_STATES[0].values():
+        assert value not in static_prefix
+
+
+@pytest.mark.parametrize('phase_number', CONCURRENT_PHASES)
+def test_member_prompts_share_cached_sections(phase_number):
+    prompts = []
+    for state in MEETING_STATES:
+        meeting = _meeting(state['user_prompt'])
+        meeting.state.update(state)
+        prompts += [
+            meeting._build_concurrent_turn_prompt(phase_number, agent_key)
+            for agent_key in meeting._get_concurrent_participants(phase_number)[:2]
+        ]
+
+    # [static prefix, cache point, meeting context, cache point, member suffix]
+    static_prefixes = {prompt[0]['text'] for prompt in prompts}
+    assert len(static_prefixes) == 1
+    assert all(prompt[1] == cache_point_block() for prompt in prompts)
+
+    # Members of the same meeting share everything but the per-member suffix
+    assert prompts[0][:4] == prompts[1][:4]
+    assert prompts[0][4] != prompts[1][4]
+    # Another meeting differs only after the static prefix
+    assert prompts[0][2] != prompts[2][2]
+
+
+def test_every_concurrent_phase_has_member_and_synthesis_templates():
+    assert sorted(CONCURRENT_TURN_PROMPT_TEMPLATES) == CONCURRENT_PHASES
+    assert sorted(SYNTHESIS_PROMPT_TEMPLATES) == CONCURRENT_PHASES
+
+
+@pytest.mark.parametrize('phase_number', CONCURRENT_PHASES)
+def test_synthesis_prompt_does_not_ask_for_handoffs(phase_number):
+    meeting = _meeting(MEETING_STATES[0]['user_prompt'])
+    meeting.state.update(MEETING_STATES[0])
+    contributions = [
+        {'agent_key': agent_key, 'text': f"Input from {agent_key}"}
+        for agent_key in meeting._get_concurrent_participants(phase_number)
+    ]
+
+    prompt = meeting._build_synthesis_prompt(phase_number, contributions)
+    text = "".join(block.get('text', '') for block in prompt)
+
+    assert "Hand off to" not in text
+    assert "hand off to each committee member" not in text
+    assert "DO NOT create the proposal yourself" not in text
+    assert all(contribution['text'] in text for contribution in contributions)
+
+
+@pytest.mark.parametrize('phase_number', sorted(CONCURRENT_TURN_PROMPT_TEMPLATES))
+def test_member_prompts_do_not_ask_for_handoffs(phase_number):
+    meeting = _meeting(MEETING_STATES[0]['user_prompt'])
+    meeting.state.update(MEETING_STATES[0])
+
+    for agent_key in meeting._get_concurrent_participants(phase_number):
+        prompt = meeting._build_concurrent_turn_prompt(phase_number, agent_key)
+        text = "".join(block.get('text', '') for block in prompt)
+
+        assert "Hand off to" not in text
+        assert "hand off" not in text.lower()
+
+
+def test_direct_turns_are_not_offered_the_handoff_tool():
+    meeting = _meeting(MEETING_STATES[0]['user_prompt'])
+    meeting._initialize_swarm()
+    registry = meeting.agents['nina_edgecase'].agent.tool_registry.registry
+    assert SWARM_HANDOFF_TOOL in registry
+
+    with meeting._without_handoff_tool('nina_edgecase'):
+        assert SWARM_HANDOFF_TOOL not in registry
+
+    # Swarm phases still get it back
+    assert SWARM_HANDOFF_TOOL in registry
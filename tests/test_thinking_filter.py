@@ -0,0 +1,71 @@
+"""
+Chunk-boundary properties of the streaming <thinking> filter.
+
+However the stream is split into chunks, filtering it chunk by chunk must give
+the same text as filtering the whole string at once.
+"""
+
+import random
+
+import pytest
+
+from dbc.workflow.thinking_filter import ThinkingBlockFilter, strip_thinking_blocks
+
+
+# Fragments random texts are built from: tags (in any case), partial tags, stray '<' and whitespace
+FRAGMENTS = [
+    '<thinking>', '</thinking>', '<THINKING>', '</Thinking>',
+    '<think', '</thin', '<', '>', '</', 'thinking',
+    ' ', '\n', '  \n', 'Hello', 'world.', 'a < b', 'x>y', '<b>bold</b>', 'done',
+]
+
+
+def _random_text(rng: random.Random) -> str:
+    return ''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 25)))
+
+
+def _filter_chunks(chunks) -> str:
+    thinking_filter = ThinkingBlockFilter()
+    return ''.join(thinking_filter.feed(chunk) for chunk in chunks) + thinking_filter.flush()
+
+
+def _random_texts(count: int, seed: int):
+    rng = random.Random(seed)
+    return [_random_text(rng) for _ in range(count)]
+
+
+@pytest.mark.parametrize('text', _random_texts(200, seed=11))
+def test_every_single_split_matches_whole_text(text):
+    expected = strip_thinking_blocks(text)
+
+    for boundary in range(len(text) + 1):
+        assert _filter_chunks([text[:boundary], text[boundary:]]) == expected, (text, boundary)
+
+
+@pytest.mark.parametrize('text', _random_texts(200, seed=12))
+def test_character_chunks_match_whole_text(text):
+    assert _filter_chunks(list(text)) == strip_thinking_blocks(text)
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_random_chunkings_match_whole_text(seed):
+    rng = random.Random(seed)
+    text = _random_text(rng) + _random_text(rng)
+
+    boundaries = sorted(rng.sample(range(len(text) + 1), k=min(len(text) + 1, rng.randint(1, 8))))
+    chunks = [text[start:end] for start, end in zip([0] + boundaries, boundaries + [len(text)])]
+
+    assert ''.join(chunks) == text
+    assert _filter_chunks(chunks) == strip_thinking_blocks(text)
+
+
+@pytest.mark.parametrize('text, visible', [
+    ("<thinking>plan</thinking>  Answer", "Answer"),
+    ("Before<thinking>a<thinking>b</thinking>c</thinking> after", "Beforeafter"),
+    ("Stray </thinking> tag", "Stray </thinking> tag"),
+    ("Ends with <", "Ends with <"),
+    ("Open <thinking>never closed", "Open "),
+])
+def test_known_outputs(text, visible):
+    assert strip_thinking_blocks(text) == visible
+    assert _filter_chunks(list(text)) == visible